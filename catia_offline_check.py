@@ -0,0 +1,736 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CATIA gerektirmeyen (Linux'ta çalışan) yazma yolu kontrolleri
+Üretilen CATScript metni golden/ altındaki .CATScript dosyalarıyla bayt bayt
+karşılaştırılır; script'in döndürdüğü durum vektörünün Excel satırlarına geri
+dağıtılması da sahte bir ExecuteScript ile denenir. Parametre önbelleği
+(CatiaParameterCache) ve COM servisi (CatiaComService) çağrı sayan saf Python
+sahte CATIA nesnesiyle çalıştırılır.
+
+Kullanım:
+    python catia_offline_check.py               # tüm kontroller
+    python catia_offline_check.py --guncelle    # golden dosyalarını yeniden yaz (bilinçli değişiklikte)
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from collections import Counter
+
+import s2dgui4 as app
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+# Sabit yazma planı: tırnak, Türkçe karakter, sayı biçimleri
+PLAN = [
+    app.WriteOp(2, "Rib_1\\T", 2.5),
+    app.WriteOp(2, 'Rib_1\\Not "A"', 7),
+    app.WriteOp(3, "Gövde_2\\Kalınlık", -0.0),
+    app.WriteOp(3, "Gövde_2\\Açı", 1e-07),
+    app.WriteOp(4, 'Rib_3\\""', 1e20),
+    app.WriteOp(4, "Rib_3\\ı", 0.1 + 0.2),
+    app.WriteOp(5, "Rib_4\\H", 123456789.125),
+    app.WriteOp(5, "", -3),
+]
+
+# Parça sınırı: 3'er parametrelik satırlar, chunk_size=4 -> satır bölünmeden 6'şarlık parçalar
+CHUNK_PLAN = [app.WriteOp(row, f"Rib_{row}\\P{k}", row + k / 10) for row in range(2, 7) for k in range(3)]
+CHUNK_SIZE = 4
+
+
+def golden_cases():
+    """(dosya adı, üretilen metin) listesi"""
+    cases = [
+        ("temel.CATScript", app.build_catscript(PLAN)),
+        ("delta.CATScript", app.build_catscript(PLAN, delta_tolerance=1e-6)),
+        ("bos.CATScript", app.build_catscript([])),
+    ]
+    writer = app.CatiaScriptWriter(None, chunk_size=CHUNK_SIZE)
+    for i, chunk in enumerate(writer.chunks(CHUNK_PLAN), 1):
+        cases.append((f"parca{i}.CATScript", app.build_catscript(chunk)))
+    return cases
+
+
+def run_golden(update=False):
+    print("=" * 60)
+    print("CATScript golden karşılaştırması")
+    print("=" * 60)
+    failures = 0
+    if update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+    for name, text in golden_cases():
+        data = text.encode("ascii")   # ASCII dışı karakter kalmışsa burada patlar
+        path = os.path.join(GOLDEN_DIR, name)
+        if update:
+            with open(path, "wb") as f:
+                f.write(data)
+            print(f"✏️ {name} yazıldı ({len(data)} bayt)")
+            continue
+        try:
+            with open(path, "rb") as f:
+                expected = f.read()
+        except OSError as e:
+            failures += 1
+            print(f"❌ {name}: golden dosyası okunamadı ({e})")
+            continue
+        if data == expected:
+            print(f"✅ {name} ({len(data)} bayt)")
+        else:
+            failures += 1
+            got, want = data.split(b"\r\n"), expected.split(b"\r\n")
+            diff = next((i for i, (a, b) in enumerate(zip(got, want)) if a != b), min(len(got), len(want)))
+            print(f"❌ {name}: satır {diff + 1} farklı")
+            print(f"     beklenen: {want[diff] if diff < len(want) else '<yok>'}")
+            print(f"     üretilen: {got[diff] if diff < len(got) else '<yok>'}")
+    return failures
+
+
+def check(label, ok, detail=""):
+    print(f"{'✅' if ok else '❌'} {label}{f' - {detail}' if detail else ''}")
+    return 0 if ok else 1
+
+
+def raises(fn, *args):
+    try:
+        fn(*args)
+    except (ValueError, RuntimeError):
+        return True
+    return False
+
+
+def run_units():
+    print("=" * 60)
+    print("Literal biçimleri, parça sınırları, durum vektörü")
+    print("=" * 60)
+    failures = 0
+
+    failures += check('_vb_string tırnak', app._vb_string('a "b"') == '"a ""b"""')
+    failures += check("_vb_string ASCII dışı", app._vb_string("Açı") == '"A" & ChrW(231) & ChrW(305)')
+    failures += check("_vb_string boş", app._vb_string("") == '""')
+    numbers = [(2.5, "2.5"), (7, "7.0"), (-0.0, "-0.0"), (1e-07, "1E-07"), (1e20, "1E+20"),
+               (0.1 + 0.2, "0.30000000000000004"), ("12.5", "12.5")]
+    for value, want in numbers:
+        failures += check(f"_vb_number({value!r})", app._vb_number(value) == want, app._vb_number(value))
+    for bad in (float("inf"), float("-inf"), float("nan")):
+        failures += check(f"_vb_number({bad}) reddedilir", raises(app._vb_number, bad))
+    # Sonlu olmayan hücre değerleri plan aşamasında satır hatası olur, script üretimi parçayı düşürmez
+    ops, errors = app.build_write_plan([["Rib_1", "inf", 2.0], ["Rib_2", 1.5, "nan"], ["Rib_3", float("-inf"), 4.0]],
+                                       [("T", 1), ("H", 2)])
+    failures += check("sonlu olmayan değer satır hatası", [(op.row, op.name) for op in ops]
+                      == [(2, "Rib_1H"), (3, "Rib_2T"), (4, "Rib_3H")] and [e[0] for e in errors] == [2, 3, 4],
+                      str(errors))
+    failures += check("sonlu olmayan değer script üretimini bozmaz", not raises(app.build_catscript, ops))
+
+    writer = app.CatiaScriptWriter(None, chunk_size=CHUNK_SIZE)
+    rows = [[op.row for op in chunk] for chunk in writer.chunks(CHUNK_PLAN)]
+    failures += check("parçalar satır bölmez", rows == [[2, 2, 2, 3, 3, 3], [4, 4, 4, 5, 5, 5], [6, 6, 6]], str(rows))
+    single = [[len(c)] for c in app.CatiaScriptWriter(None, chunk_size=1).chunks(CHUNK_PLAN)]
+    failures += check("chunk_size=1: satır başına parça", single == [[3]] * 5, str(single))
+
+    failures += check("durum: doğru uzunluk", app.parse_script_status("1201", "abcd") == "1201")
+    failures += check("durum: kısa vektör reddedilir", raises(app.parse_script_status, "12", "abc"))
+    failures += check("durum: None reddedilir", raises(app.parse_script_status, None, "a"))
+    failures += check("durum: yabancı karakter reddedilir", raises(app.parse_script_status, "1x1", "abc"))
+
+    by_row = app.status_by_row(PLAN, "10211102")
+    expected = {
+        2: (["Rib_1\\T"], [], ['Rib_1\\Not "A"']),
+        3: (["Gövde_2\\Açı"], ["Gövde_2\\Kalınlık"], []),
+        4: (['Rib_3\\""', "Rib_3\\ı"], [], []),
+        5: ([], [""], ["Rib_4\\H"]),
+    }
+    failures += check("durum -> satır", dict(by_row) == expected and list(by_row) == [2, 3, 4, 5], str(dict(by_row)))
+    return failures
+
+
+class FakeSystemService:
+    """ExecuteScript: diske yazılan script'i okur, isminde "Yok" geçen parametre için "0" döndürür"""
+    def __init__(self):
+        self.scripts = []
+
+    def ExecuteScript(self, directory, library_type, name, function, args):
+        with open(os.path.join(directory, name), "rb") as f:
+            text = f.read()
+        self.scripts.append(text)
+        calls = [line for line in text.split(b"\r\n") if line.startswith(b"    s = s & W(")]
+        return "".join("0" if b"Yok" in line else "1" for line in calls)
+
+
+class FakeCatia:
+    def __init__(self):
+        self.SystemService = FakeSystemService()
+
+
+def run_writer_roundtrip(work_dir):
+    print("=" * 60)
+    print("CatiaScriptWriter (sahte ExecuteScript)")
+    print("=" * 60)
+    failures = 0
+    catia = FakeCatia()
+    plan = CHUNK_PLAN[:7] + [app.WriteOp(4, "Rib_4\\Yok", 1.0)] + CHUNK_PLAN[7:]
+    writer = app.CatiaScriptWriter(catia, chunk_size=CHUNK_SIZE, script_dir=work_dir)
+    per_row = {}
+    for chunk in writer.chunks(plan):
+        for row_no, (written, unchanged, failed) in app.status_by_row(chunk, writer.execute(chunk)).items():
+            per_row[row_no] = (len(written), len(failed))
+    writer.cleanup()
+    failures += check("ExecuteScript çağrı sayısı", writer.calls == 3, str(writer.calls))
+    failures += check("diske yazılan = build_catscript", catia.SystemService.scripts[0] ==
+                      app.build_catscript(plan[:6]).encode("ascii"))
+    failures += check("satır sonuçları", per_row == {2: (3, 0), 3: (3, 0), 4: (3, 1), 5: (3, 0), 6: (3, 0)},
+                      str(per_row))
+    failures += check("cleanup script'i siler", not os.listdir(work_dir))
+    return failures
+
+
+# ------------------------------------------------------------------
+# Sahte CATIA (win32com dispatcher yerine): her özellik erişimini ve
+# çağıran thread'i sayar; "dead" iken her erişim RPC hatası verir
+# ------------------------------------------------------------------
+class CallLog:
+    def __init__(self):
+        self.counts = Counter()
+        self.threads = Counter()
+        self.lock = threading.Lock()
+
+    def hit(self, key):
+        with self.lock:
+            self.counts[key] += 1
+            self.threads[(key, threading.current_thread().name)] += 1
+
+    def on_threads(self, key):
+        return {thread for (k, thread) in self.threads if k == key}
+
+
+class FakeParameter:
+    def __init__(self, log, name, value):
+        self._log = log
+        self.Name = name
+        self._value = value
+
+    @property
+    def Value(self):
+        self._log.hit("Value.get")
+        return self._value
+
+    @Value.setter
+    def Value(self, value):
+        self._log.hit("Value.set")
+        self._value = value
+
+
+class FakeParameters:
+    def __init__(self, log, part_name, names):
+        self._log = log
+        self._items = [FakeParameter(log, f"{part_name}\\Parametreler\\{name}", 1.0) for name in names]
+        self._by_name = {p.Name.rsplit("\\", 1)[-1]: p for p in self._items}
+
+    @property
+    def Count(self):
+        self._log.hit("Count")
+        return len(self._items)
+
+    def Item(self, key):
+        self._log.hit("Item")
+        if isinstance(key, int):
+            return self._items[key - 1]
+        try:
+            return self._by_name[key.rsplit("\\", 1)[-1]]
+        except KeyError:
+            raise LookupError(f"Parametre yok: {key}")
+
+
+class FakeRelation:
+    def __init__(self, name, active=True):
+        self.Name = name
+        self.active = active
+
+    def IsDeactivated(self):
+        return not self.active
+
+    def Deactivate(self):
+        self.active = False
+
+    def Activate(self):
+        self.active = True
+
+
+class FakeRelations:
+    def __init__(self, relations):
+        self._items = relations
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def Item(self, index):
+        return self._items[index - 1]
+
+
+class FakePart:
+    def __init__(self, log, name, names):
+        self._log = log
+        self._parameters = FakeParameters(log, name, names)
+        # Formula.2 kullanıcı tarafından zaten kapatılmış: dokunulmamalı
+        self.relations = [FakeRelation("Formula.1"), FakeRelation("Formula.2", active=False), FakeRelation("Rule.1")]
+        self.updates = []  # Update anındaki açık ilişki sayısı
+
+    @property
+    def Parameters(self):
+        self._log.hit("Parameters")
+        return self._parameters
+
+    @property
+    def Relations(self):
+        return FakeRelations(self.relations)
+
+    def Update(self):
+        self._log.hit("Update")
+        self.updates.append(sum(r.active for r in self.relations))
+
+
+class FakeDocument:
+    def __init__(self, log, name, names):
+        self._log = log
+        self.Name = name
+        self._part = FakePart(log, name.split(".")[0], names)
+
+    @property
+    def Part(self):
+        self._log.hit("Part")
+        return self._part
+
+
+class FakeCatiaApp:
+    def __init__(self, log, document):
+        self._log = log
+        self.document = document
+        self.dead = False
+        self.switch_to = None     # (n, döküman): n. ActiveDocument erişiminden sonra aktif döküman değişir
+
+    def _alive(self, key):
+        self._log.hit(key)
+        if self.dead:
+            raise OSError("RPC sunucusu kullanılamıyor")
+
+    @property
+    def Name(self):
+        self._alive("Name")
+        return "CNEXT"
+
+    @property
+    def ActiveDocument(self):
+        self._alive("ActiveDocument")
+        if self.switch_to and self._log.counts["ActiveDocument"] > self.switch_to[0]:
+            self.document = self.switch_to[1]
+            self.switch_to = None
+        return self.document
+
+
+class FakeApp:
+    """WorkerThread'in beklediği arayüz yüzeyi (Tk yok)"""
+    def __init__(self, com_service=None):
+        self.events = app.UiEventChannel(self)
+        self.com_service = com_service
+        self.logs = []
+        self.stats = None
+        self.finished = False
+
+    def log_batch(self, items):
+        self.logs.extend(items)
+
+    def update_max_progress(self, value):
+        pass
+
+    def update_stats(self, *stats):
+        self.stats = stats
+
+    def update_queue_depth(self, *depths):
+        pass
+
+    def finish_process(self):
+        self.finished = True
+
+
+PARAM_NAMES = [f"Rib_{i}{s}" for i in range(1, 21) for s in ("T", "H")]
+
+
+def write_csv(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("ID,T,H\n")
+        for i in range(1, rows + 1):
+            f.write(f"Rib_{i},{i + 0.5},{i * 2}\n")
+    return path
+
+
+def check_preflight_switch(label, log, run):
+    """Ön kontrol açık, 11. satırda döküman değişimi: Part1'de Rib_16..20, Part2'de Rib_11..12 yok.
+    run(first, second) worker'ı çalıştırıp (fake_app, worker) döndürür. Eksikler ilk dökümanın
+    ön kontrolüne göre değil aktif dökümanın indeksine göre atlanmalı."""
+    first = FakeDocument(log, "Part1.CATPart", [n for n in PARAM_NAMES if int(n[4:-1]) < 16])
+    second = FakeDocument(log, "Part2.CATPart", [n for n in PARAM_NAMES if int(n[4:-1]) not in (11, 12)])
+    fake_app, worker = run(first, second)
+    failures = check(f"{label}: istatistik", fake_app.stats == (20, 36, 4), str(fake_app.stats))
+    failures += check(f"{label}: eksikler yeni dökümana göre atlanır", worker.write_counts["skipped"] == 4,
+                      str(worker.write_counts))
+    moved = [i for i in range(11, 21) if f"Rib_{i}T" in second._part._parameters._by_name
+             and second._part._parameters._by_name[f"Rib_{i}T"]._value == i + 0.5]
+    failures += check(f"{label}: ilk dökümanda eksik olanlar yeni dökümana yazılır", moved == list(range(13, 21)),
+                      f"yeni dökümanda satırlar {moved}")
+    return failures
+
+
+class LocalWorker(app.WorkerThread):
+    """COM servisi olmadan (her run'ın kendi bağlantısı) çalışan worker"""
+    def __init__(self, catia, *args):
+        super().__init__(*args)
+        self.fake_catia = catia
+
+    def connect_catia(self):
+        return self.fake_catia
+
+
+def run_parameter_cache(work_dir):
+    print("=" * 60)
+    print("Parametre önbelleği (çağrı sayan sahte CATIA)")
+    print("=" * 60)
+    failures = 0
+    log = CallLog()
+    first = FakeDocument(log, "Part1.CATPart", PARAM_NAMES)
+    second = FakeDocument(log, "Part2.CATPart", PARAM_NAMES)
+    catia = FakeCatiaApp(log, first)
+
+    cache = app.CatiaParameterCache(catia)
+    for _ in range(3):
+        for name in PARAM_NAMES:
+            cache.set_value(name, 2.0)
+    failures += check("Part/Parameters tek çözümleme",
+                      (log.counts["ActiveDocument"], log.counts["Part"], log.counts["Parameters"]) == (1, 1, 1),
+                      str(dict(log.counts)))
+    failures += check("isim başına tek Item()", log.counts["Item"] == len(PARAM_NAMES) == cache.item_calls,
+                      f'{log.counts["Item"]} Item')
+    failures += check("tekrar yazımlar önbellekten", cache.hits == 2 * len(PARAM_NAMES), str(cache.hits))
+
+    failures += check("aynı döküman: önbellek korunur", cache.check_document() and cache.invalidations == 0)
+    catia.document = second
+    switched = not cache.check_document()
+    failures += check("döküman değişimi algılanır", switched and cache.invalidations == 1 and not cache.handles)
+    failures += check("yeni dökümanın Part'ı", cache.part is second._part)
+    cache.set_value("Rib_1T", 7.0)
+    failures += check("yeni dökümana yazılır", second._part._parameters._by_name["Rib_1T"]._value == 7.0
+                      and first._part._parameters._by_name["Rib_1T"]._value == 2.0)
+
+    # Worker (ön kontrol kapalı): çalışma başına tek çözümleme, isim başına tek Item()
+    path = write_csv(os.path.join(work_dir, "onbellek.csv"), 20)
+    config = {"update_policy": "end", "excel_cache": False, "catia_batch_mode": False, "preflight_check": False}
+    for label, switch in (("tek döküman", None), ("yarıda döküman değişimi", 11)):
+        log.counts.clear()
+        first = FakeDocument(log, "Part1.CATPart", PARAM_NAMES)
+        second = FakeDocument(log, "Part2.CATPart", PARAM_NAMES)
+        catia = FakeCatiaApp(log, first)
+        if switch:
+            # İlk erişim önbelleği kurar, sonraki her satır check_document çağırır
+            catia.switch_to = (switch, second)
+        fake_app = FakeApp()
+        worker = LocalWorker(catia, fake_app, path, config, [("T", "B"), ("H", "C")])
+        worker.run_with_openpyxl()
+        fake_app.events.drain()
+        resolves = 2 if switch else 1
+        failures += check(f"worker ({label}): istatistik", fake_app.stats == (20, 40, 0), str(fake_app.stats))
+        failures += check(f"worker ({label}): Part/Parameters çözümleme",
+                          log.counts["Part"] == log.counts["Parameters"] == resolves,
+                          f'{log.counts["Part"]} Part, {log.counts["Parameters"]} Parameters')
+        failures += check(f"worker ({label}): isim başına tek Item()", log.counts["Item"] == len(PARAM_NAMES),
+                          f'{log.counts["Item"]} Item')
+        # Kurulum + satır başına bir check_document (+ değişimde resolve)
+        failures += check(f"worker ({label}): satır başına tek ActiveDocument",
+                          log.counts["ActiveDocument"] == 21 + resolves - 1, str(log.counts["ActiveDocument"]))
+        if switch:
+            # 12. erişim = 11. satırın kontrolü: 1-10 ilk dökümana, 11-20 yenisine
+            written = [doc for doc in (first, second)
+                       if doc._part._parameters._by_name["Rib_10T"]._value == 10.5]
+            moved = [i for i in range(1, 21) if second._part._parameters._by_name[f"Rib_{i}T"]._value == i + 0.5]
+            failures += check(f"worker ({label}): satırlar doğru dökümana", written == [first]
+                              and moved == list(range(11, 21)), f"yeni dökümanda satırlar {moved}")
+        failures += check(f"worker ({label}): yenileme raporu",
+                          worker.run_report.get("Parametre Önbelleği", "").endswith(f"{resolves - 1} yenileme"),
+                          worker.run_report.get("Parametre Önbelleği"))
+
+    def run_local(first, second):
+        catia = FakeCatiaApp(log, first)
+        catia.switch_to = (11, second)
+        fake_app = FakeApp()
+        worker = LocalWorker(catia, fake_app, path, dict(config, preflight_check=True), [("T", "B"), ("H", "C")])
+        worker.run_with_openpyxl()
+        fake_app.events.drain()
+        return fake_app, worker
+
+    log.counts.clear()
+    failures += check_preflight_switch("worker (ön kontrol + döküman değişimi)", log, run_local)
+    return failures
+
+
+def run_relations(work_dir):
+    print("=" * 60)
+    print("İlişkileri kapatma + yarıda döküman değişimi")
+    print("=" * 60)
+    failures = 0
+    log = CallLog()
+    first = FakeDocument(log, "Part1.CATPart", PARAM_NAMES)
+    second = FakeDocument(log, "Part2.CATPart", PARAM_NAMES)
+    catia = FakeCatiaApp(log, first)
+    catia.switch_to = (11, second)  # 11. satırdan itibaren Part2 aktif
+    path = write_csv(os.path.join(work_dir, "iliski.csv"), 20)
+    config = {"update_policy": "end", "excel_cache": False, "catia_batch_mode": False,
+              "suspend_relations": True}
+    fake_app = FakeApp()
+    worker = LocalWorker(catia, fake_app, path, config, [("T", "B"), ("H", "C")])
+    worker.run_with_openpyxl()
+    fake_app.events.drain()
+    p1, p2 = first._part, second._part
+    failures += check("istatistik", fake_app.stats == (20, 40, 0), str(fake_app.stats))
+    # Part1: referans Update (2 açık), değişimde ilişkiler açılıp bekleyen Update (2 açık)
+    failures += check("Part1: referans + değişimde son Update (ilişkiler açık)", p1.updates == [2, 2], str(p1.updates))
+    failures += check("Part2: referans + bitişte son Update (ilişkiler açık)", p2.updates == [2, 2], str(p2.updates))
+    failures += check("kullanıcının kapattığı ilişkiye dokunulmadı",
+                      [r.active for r in p1.relations] == [True, False, True]
+                      and [r.active for r in p2.relations] == [True, False, True])
+    failures += check("satırlar doğru dökümana",
+                      p1._parameters._by_name["Rib_10T"]._value == 10.5 and p1._parameters._by_name["Rib_11T"]._value == 1.0
+                      and p2._parameters._by_name["Rib_11T"]._value == 11.5)
+    report = worker.run_report
+    failures += check("raporda referans Update", "Referans Update (ilişkiler açık)" in report
+                      and "Son Update (ilişkiler açık)" in report,
+                      f'{report.get("Referans Update (ilişkiler açık)")} / {report.get("Son Update (ilişkiler açık)")}')
+    failures += check("ilişki özeti", report.get("İlişkiler (Relations)", "").startswith("2/3"),
+                      report.get("İlişkiler (Relations)"))
+    return failures
+
+
+class FakeDesignTable:
+    def __init__(self, comment, path):
+        self.Comment = comment
+        self.FilePath = path
+        self.associations = {}
+        self.synchronized = 0
+
+    def AddAssociation(self, parameter, column):
+        self.associations[column] = parameter
+
+    def Synchronize(self):
+        self.synchronized += 1
+
+
+class FakeTableRelations:
+    def __init__(self, removable=True):
+        self.tables = {}
+        self.created = 0
+        self.removable = removable
+
+    def Item(self, name):
+        return self.tables[name]
+
+    def CreateDesignTable(self, name, comment, copy_mode, path):
+        self.created += 1
+        self.tables[name] = FakeDesignTable(comment, path)
+        return self.tables[name]
+
+    def Remove(self, name):
+        if not self.removable:
+            raise OSError("Kaldırma reddedildi")
+        del self.tables[name]
+
+
+class FakeTablePart:
+    def __init__(self, relations):
+        self.Relations = relations
+
+
+class NameCache:
+    """param_cache.get: parametre handle'ı yerine adını döndürür"""
+    def get(self, name):
+        return f"param:{name}"
+
+
+def run_design_table(work_dir):
+    print("=" * 60)
+    print("Design table bağlama (sütun eşlemesi değişimi)")
+    print("=" * 60)
+    failures = 0
+    writer = app.DesignTableWriter(os.path.join(work_dir, "kitap.xlsx"), "Sayfa1")
+    relations = FakeTableRelations()
+    part = FakeTablePart(relations)
+
+    table = writer.attach(part, NameCache(), ["T", "H"])
+    failures += check("ilk bağlama: oluşturulur", relations.created == 1
+                      and table.associations == {"T": "param:T", "H": "param:H"}, table.Comment)
+    failures += check("bağlı sütunlar Comment'ten okunur", writer.associated_columns(table) == ["T", "H"])
+
+    writer.regenerated = True
+    again = writer.attach(part, NameCache(), ["H", "T"])
+    failures += check("aynı sütunlar: tablo korunur + senkronize", again is table and relations.created == 1
+                      and table.synchronized == 1)
+
+    changed = writer.attach(part, NameCache(), ["T", "H", "W"])
+    failures += check("sütun eklendi: yeniden oluşturulur", changed is not table and relations.created == 2
+                      and set(changed.associations) == {"T", "H", "W"})
+    reduced = writer.attach(part, NameCache(), ["T"])
+    failures += check("sütun çıkarıldı: yeniden oluşturulur", relations.created == 3
+                      and list(reduced.associations) == ["T"])
+
+    relations.tables[writer.table_name].Comment = "CATIA Automation Suite"  # eski sürümün tablosu
+    legacy = writer.attach(part, NameCache(), ["T"])
+    failures += check("kayıtsız (eski) tablo: yeniden oluşturulur", relations.created == 4
+                      and writer.associated_columns(legacy) == ["T"])
+
+    locked = FakeTableRelations(removable=False)
+    locked.CreateDesignTable(writer.table_name, "CATIA Automation Suite [\"T\"]", False, writer.path)
+    failures += check("kaldırılamayan tablo: açık hata",
+                      raises(writer.attach, FakeTablePart(locked), NameCache(), ["T", "H"]) and locked.created == 1)
+    return failures
+
+
+def run_com_service(work_dir):
+    print("=" * 60)
+    print("COM servisi (sahte dispatcher)")
+    print("=" * 60)
+    failures = 0
+    log = CallLog()
+    document = FakeDocument(log, "Part1.CATPart", PARAM_NAMES)
+    sessions = []
+
+    def connector():
+        catia = FakeCatiaApp(log, document)
+        sessions.append(catia)
+        return catia
+
+    service = app.CatiaComService(connector=connector, health_interval=0.05)
+    service.start()
+    try:
+        probe = service.call("probe", timeout=5)
+        failures += check("probe", probe == {"connected": True, "document": "Part1.CATPart", "error": None}, str(probe))
+
+        result = service.call("enumerate", timeout=5)
+        failures += check("enumerate: sayı + tam/kısa isimler", result["count"] == 40 and "Rib_1T" in result["names"]
+                          and "Part1\\Parametreler\\Rib_1T" in result["names"], str(result["count"]))
+        items_before = log.counts["Item"]
+        status = service.call("write_batch", [("Rib_1T", 5.0), ("Yok_1", 1.0), ("Rib_2T", 1.0)], 1e-6, timeout=5)
+        failures += check("write_batch durumları (yazıldı/hata/değişmedi)", status == "102", status)
+        failures += check("write_batch indeksten (Item sadece eksik isim için)",
+                          log.counts["Item"] - items_before == 1, str(log.counts["Item"] - items_before))
+        failures += check("update", service.call("update", timeout=5) >= 0 and log.counts["Update"] == 1)
+
+        # Boşta sağlık kontrolü kopan bağlantıyı bırakır, sonraki istek yeniden bağlanır
+        sessions[-1].dead = True
+        deadline = time.time() + 2
+        while service.catia is not None and time.time() < deadline:
+            time.sleep(0.01)
+        failures += check("sağlık kontrolü kopuk bağlantıyı bırakır", service.catia is None)
+        status = service.call("write_batch", [("Rib_3T", 9.0)], timeout=5)
+        failures += check("yeniden bağlanıp yazar", status == "1" and service.reconnects == 1 and len(sessions) == 2,
+                          f"{service.connects} bağlantı, {service.reconnects} yeniden")
+
+        # İstek sırasında kopma: istek yeniden bağlanıp bir kez tekrarlanır (write_batch önbellekteki
+        # handle'lara yazar, ActiveDocument'e satır başındaki check_document isteği dokunur)
+        sessions[-1].dead = True
+        part, _ = service.call("check_document", timeout=5)
+        status = service.call("write_batch", [("Rib_4T", 9.0)], timeout=5)
+        failures += check("istek içinde kopma -> tekrar", part is document._part and status == "1"
+                          and service.reconnects == 2, f"{status}, {service.reconnects} yeniden")
+
+        # Farklı thread'lerden eşzamanlı istekler: hepsi servis thread'inde sırayla
+        results = {}
+
+        def client(k):
+            futures = [service.submit("write_batch", [(f"Rib_{k + 1}H", float(n))]) for n in range(50)]
+            results[k] = [f.result(5) for f in futures]
+
+        clients = [threading.Thread(target=client, args=(k,), name=f"istemci-{k}") for k in range(8)]
+        for t in clients:
+            t.start()
+        for t in clients:
+            t.join()
+        ok = all(r == ["1"] * 50 for r in results.values()) and len(results) == 8
+        failures += check("8 thread x 50 istek", ok)
+        finals = [document._part._parameters._by_name[f"Rib_{k + 1}H"]._value for k in range(8)]
+        failures += check("thread başına sıra korunur", finals == [49.0] * 8, str(finals))
+        failures += check("COM erişimi sadece servis thread'inde",
+                          log.on_threads("Value.set") == {"S2D-COM"} and log.on_threads("Item") == {"S2D-COM"},
+                          str(log.on_threads("Value.set") | log.on_threads("Item")))
+        caller = service.call("call", lambda catia: threading.current_thread().name, timeout=5)
+        failures += check("call isteği servis thread'inde", caller == "S2D-COM", caller)
+
+        # Worker: satır yazımları write_batch, Update'ler update isteği olarak
+        path = write_csv(os.path.join(work_dir, "tablo.csv"), 25)  # Rib_21..25 CATIA'da yok
+        service.param_cache = None  # Servis boşta: önbelleği worker'ın ilk çalışması kurar
+        for policy, expected_updates in (("row", 20), ("parameter", 40), ("end", 1)):
+            log.counts.clear()
+            requests_before = service.request_count
+            fake_app = FakeApp(service)
+            config = {"update_policy": policy, "excel_cache": False, "catia_batch_mode": False}
+            worker = app.WorkerThread(fake_app, path, config, [("T", "B"), ("H", "C")])
+            worker.run_with_openpyxl()
+            fake_app.events.drain()
+            failures += check(f"worker ({policy}): istatistik", fake_app.stats == (25, 40, 10) and fake_app.finished,
+                              str(fake_app.stats))
+            failures += check(f"worker ({policy}): Update sayısı", log.counts["Update"] == expected_updates,
+                              str(log.counts["Update"]))
+            failures += check(f"worker ({policy}): Item() sadece tek indeksleme geçişinde",
+                              log.counts["Item"] == len(PARAM_NAMES) and log.counts["Count"] == 1,
+                              f'{log.counts["Item"]} Item, {log.counts["Count"]} Count')
+            # Döküman kontrolü çalışma başında ve satır başına birer istek; Part/Parameters servis
+            # önbelleğinde bir kez çözülür (ilk çalışma), sonraki çalışmalar yeniden çözmez
+            resolves = 1 if policy == "row" else 0
+            failures += check(f"worker ({policy}): satır başına bir ActiveDocument",
+                              log.counts["ActiveDocument"] == 25 + 1, str(log.counts["ActiveDocument"]))
+            failures += check(f"worker ({policy}): Part/Parameters tek çözümleme",
+                              log.counts["Part"] == log.counts["Parameters"] == resolves,
+                              f'{log.counts["Part"]} Part, {log.counts["Parameters"]} Parameters')
+            failures += check(f"worker ({policy}): yazma/Update servis thread'inde",
+                              log.on_threads("Value.set") == {"S2D-COM"} and log.on_threads("Update") == {"S2D-COM"})
+            failures += check(f"worker ({policy}): istek sayısı", service.request_count > requests_before,
+                              f"{service.request_count - requests_before} istek")
+
+        def run_service(first, second):
+            # Servis oturumu Part1'e geçer (çalışma başındaki kontrol algılar), 11. satırda Part2
+            log.counts.clear()
+            sessions[-1].document = first
+            sessions[-1].switch_to = (11, second)
+            fake_app = FakeApp(service)
+            config = {"update_policy": "end", "excel_cache": False, "catia_batch_mode": False}
+            worker = app.WorkerThread(fake_app, write_csv(os.path.join(work_dir, "onkontrol.csv"), 20), config,
+                                      [("T", "B"), ("H", "C")])
+            worker.run_with_openpyxl()
+            fake_app.events.drain()
+            return fake_app, worker
+
+        failures += check_preflight_switch("worker (servis, ön kontrol + döküman değişimi)", log, run_service)
+    finally:
+        service.shutdown()
+    failures += check("shutdown", not service.is_alive())
+    return failures
+
+
+if __name__ == "__main__":
+    if "--guncelle" in sys.argv:
+        run_golden(update=True)
+        sys.exit(0)
+    failed = run_golden()
+    print()
+    failed += run_units()
+    print()
+    with tempfile.TemporaryDirectory(prefix="s2d_catia_") as work:
+        failed += run_writer_roundtrip(work)
+        print()
+        failed += run_parameter_cache(work)
+        print()
+        failed += run_relations(work)
+        print()
+        failed += run_design_table(work)
+        print()
+        failed += run_com_service(work)
+    print(f"\n{'✅ Tüm kontroller geçti' if not failed else f'❌ {failed} kontrol başarısız'}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Önizleme tablosu (PreviewGrid) çizim süresi ölçümü
+Sanal tablo yalnızca görünen hücreleri çizdiği için ilk çizim ve kaydırma süresi
+veri boyutundan bağımsız kalmalıdır. --eski ile hücre başına CTkLabel kuran önceki
+yöntem de (sadece 10 x 50'de; büyük boyutlarda dakikalar sürer) ölçülür.
+
+Kullanım:
+    python preview_grid_benchmark.py           # 10x50, 100x200, 1000x500
+    python preview_grid_benchmark.py --eski    # + eski CTkLabel tablosu (10x50)
+"""
+
+import sys
+import time
+import random
+import statistics
+
+import customtkinter as ctk
+
+import s2dgui4 as app
+
+SIZES = [(10, 50), (100, 200), (1000, 500)]
+SCROLL_STEPS = 100
+
+
+def make_data(rows, cols):
+    rnd = random.Random(rows * cols)
+    data = [["ID"] + [f"P{c}" for c in range(1, cols)]]
+    for r in range(1, rows):
+        data.append([f"Rib_{r}"] + [rnd.choice((round(rnd.uniform(0, 500), 3), "AL-7075-T6", None, r * c))
+                                    for c in range(1, cols)])
+    return data
+
+
+def settle(root):
+    root.update_idletasks()
+    root.update()
+
+
+def bench_grid(root, rows, cols):
+    grid = app.PreviewGrid(root)
+    grid.pack(fill="both", expand=True)
+    settle(root)
+    data = make_data(rows, cols)
+
+    t0 = time.perf_counter()
+    grid.set_data(data)
+    settle(root)
+    first = (time.perf_counter() - t0) * 1000
+
+    steps = []
+    for i in range(SCROLL_STEPS):
+        t0 = time.perf_counter()
+        if i % 4 == 3:
+            grid.xview("scroll", 1, "units")
+        elif i % 10 == 9:
+            grid.yview("moveto", random.random())
+        else:
+            grid.yview("scroll", 1, "units")
+        settle(root)
+        steps.append((time.perf_counter() - t0) * 1000)
+    items = len(grid.canvas.find_all())
+    grid.destroy()
+    return first, statistics.mean(steps), max(steps), items
+
+
+def bench_labels(root, rows, cols):
+    """Önceki yöntem: her hücre için bir CTkLabel (update_ui_with_excel_data'nın eski hali)"""
+    frame = ctk.CTkFrame(root, fg_color="transparent")
+    frame.pack(fill="both", expand=True)
+    data = make_data(rows, cols)
+    t0 = time.perf_counter()
+    for c in range(cols):
+        ctk.CTkLabel(frame, text=app.num2col(c + 1), height=32, width=80).grid(row=0, column=c + 1)
+    for r, row in enumerate(data):
+        ctk.CTkLabel(frame, text=str(r + 1), height=28, width=50).grid(row=r + 1, column=0)
+        for c, value in enumerate(row):
+            ctk.CTkLabel(frame, text=app.PreviewGrid.cell_text(value), height=28, width=80,
+                         anchor="w").grid(row=r + 1, column=c + 1)
+    settle(root)
+    first = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    frame.destroy()
+    settle(root)
+    return first, (time.perf_counter() - t0) * 1000, len(data) * cols + cols + len(data)
+
+
+if __name__ == "__main__":
+    try:
+        root = ctk.CTk()
+    except Exception as e:  # Ekransız ortam (CI, SSH)
+        print(f"⚠️ Tk penceresi açılamadı: {e}")
+        sys.exit(1)
+    root.geometry("1100x480")
+    settle(root)
+
+    print("=" * 72)
+    print(f"PreviewGrid çizim süresi (pencere 1100x480, {SCROLL_STEPS} kaydırma adımı)")
+    print("=" * 72)
+    print(f"{'boyut':>10} | {'ilk çizim':>10} | {'kaydırma ort.':>13} | {'kaydırma max':>12} | canvas öğesi")
+    for rows, cols in SIZES:
+        first, mean, worst, items = bench_grid(root, rows, cols)
+        print(f"{rows:>4} x {cols:<4}| {first:8.1f} ms | {mean:10.2f} ms | {worst:9.2f} ms | {items}")
+
+    if "--eski" in sys.argv:
+        rows, cols = SIZES[0]
+        first, teardown, widgets = bench_labels(root, rows, cols)
+        print(f"\nEski CTkLabel tablosu {rows} x {cols}: {widgets} widget, kurulum {first:.0f} ms, "
+              f"yıkım {teardown:.0f} ms")
+    root.destroy()
@@ -4,6 +4,7 @@ import time
 import datetime
 import os
 import string
+import math
 import json
 import logging
 import traceback
@@ -340,6 +341,119 @@ def num2col(n):
         string = chr(65 + remainder) + string
     return string
 
+# ==========================================
+# CATIA GÜNCELLEME POLİTİKASI (part.Update)
+# ==========================================
+UPDATE_POLICIES = {
+    "parameter": "Her parametrede",
+    "row": "Her satırda",
+    "batch": "Her N satırda",
+    "end": "Sadece sonda",
+    "adaptive": "Adaptif",
+}
+
+class PartUpdatePolicy:
+    """part.Update() çağrılarını seçilen politikaya göre erteler ve maliyetini ölçer.
+
+    parameter: her parametre yazımından sonra (eski davranış)
+    row:       her satır bittiğinde
+    batch:     her N satırda bir
+    end:       sadece işlem sonunda
+    adaptive:  Update süresini ölçüp UI gecikmesini hedef altında tutacak N'yi seçer
+    """
+    def __init__(self, mode="parameter", batch_rows=50, target_latency=0.5, max_batch_rows=1000):
+        if mode not in UPDATE_POLICIES:
+            raise ValueError(f"Bilinmeyen güncelleme politikası: {mode}")
+        self.mode = mode
+        self.batch_rows = max(1, int(batch_rows))
+        self.target_latency = max(0.01, float(target_latency))
+        self.max_batch_rows = max(1, int(max_batch_rows))
+        if mode == "adaptive":
+            self.batch_rows = 1  # İlk ölçüme kadar her satırda
+
+        self.pending = False
+        self.rows_since_update = 0
+        self.update_count = 0
+        self.update_time = 0.0
+        self.max_update_cost = 0.0
+        self.last_update_cost = 0.0
+        self.row_time = 0.0  # Satır yazma süresi (üstel ortalama, Update hariç)
+        self._row_started = time.perf_counter()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(mode=config.get("update_policy", "parameter"),
+                   batch_rows=config.get("update_batch_rows", 50),
+                   target_latency=config.get("update_target_latency", 0.5))
+
+    def on_parameter_written(self, part):
+        """Bir parametre yazıldıktan sonra çağrılır"""
+        self.pending = True
+        if self.mode == "parameter":
+            self._do_update(part)
+
+    def on_row_done(self, part):
+        """Bir satırın tüm parametreleri yazıldıktan sonra çağrılır"""
+        now = time.perf_counter()
+        elapsed = now - self._row_started
+        self.row_time = elapsed if self.row_time == 0 else (0.8 * self.row_time + 0.2 * elapsed)
+        self.rows_since_update += 1
+
+        if self.pending and self.mode != "parameter" and self.mode != "end":
+            if self.mode == "row" or self.rows_since_update >= self.batch_rows:
+                self._do_update(part)
+        self._row_started = time.perf_counter()
+
+    def finish(self, part):
+        """İşlem sonunda (veya durdurulduğunda) bekleyen değişiklikleri uygula"""
+        if self.pending:
+            self._do_update(part)
+
+    def _do_update(self, part):
+        if part is None:
+            self.pending = False
+            return
+        t0 = time.perf_counter()
+        part.Update()
+        cost = time.perf_counter() - t0
+
+        self.update_count += 1
+        self.update_time += cost
+        self.last_update_cost = cost
+        self.max_update_cost = max(self.max_update_cost, cost)
+        self.pending = False
+        self.rows_since_update = 0
+
+        if self.mode == "adaptive":
+            self._adapt(cost)
+
+    def _adapt(self, cost):
+        """N satır yazma + 1 Update süresi hedef gecikmeyi aşmayacak en büyük N"""
+        if self.row_time <= 0:
+            return
+        budget = self.target_latency - cost
+        new_size = int(budget / self.row_time) if budget > 0 else 1
+        self.batch_rows = min(self.max_batch_rows, max(1, new_size))
+
+    def describe(self):
+        label = UPDATE_POLICIES.get(self.mode, self.mode)
+        if self.mode == "batch":
+            return f"{label} (N={self.batch_rows})"
+        if self.mode == "adaptive":
+            return f"{label} (hedef {self.target_latency * 1000:.0f} ms, son N={self.batch_rows})"
+        return label
+
+    def summary(self):
+        """Results dosyası için özet"""
+        avg = (self.update_time / self.update_count) if self.update_count else 0.0
+        return {
+            "Güncelleme Politikası": self.describe(),
+            "Part.Update Sayısı": self.update_count,
+            "Toplam Update Süresi": f"{self.update_time:.2f} sn",
+            "Ortalama Update Süresi": f"{avg * 1000:.1f} ms",
+            "En Uzun Update": f"{self.max_update_cost * 1000:.1f} ms",
+        }
+
 # ==========================================
 # ARKA PLAN İŞÇİSİ (DATA OKUMA & YAZMA)
 # ==========================================
@@ -352,6 +466,7 @@ class WorkerThread(threading.Thread):
         self.dynamic_params = dynamic_params # List of tuples: (Suffix, ColChar)
         self.running = True
         self.daemon = True
+        self.run_report = {}  # Results dosyasına yazılacak performans bilgileri
 
     def run(self):
         if TEST_MODE:
@@ -473,6 +588,9 @@ class WorkerThread(threading.Thread):
             # Batch update için değişiklikleri topla
             batch_size = 50  # Her 50 satırda bir UI güncelle
             last_update = 0
+            update_policy = PartUpdatePolicy.from_config(self.config)
+            part = None
+            APP_LOGGER.info(f"Güncelleme politikası: {update_policy.describe()}")
             
             # DÖNGÜ (optimize edilmiş)
             if raw_data:
@@ -519,8 +637,8 @@ class WorkerThread(threading.Thread):
                                             part = doc.Part
                                             param = part.Parameters.Item(full_name)
                                             param.Value = validated_value
-                                            # Parametreyi güncelle
-                                            part.Update()
+                                            # Parametreyi güncelle (politikaya göre ertelenebilir)
+                                            update_policy.on_parameter_written(part)
                                             APP_LOGGER.debug(f"{full_name} = {validated_value}")
                                         except Exception as catia_err:
                                             APP_LOGGER.error(f"CATIA parametresi yazılamadı ({full_name}): {catia_err}")
@@ -539,11 +657,25 @@ class WorkerThread(threading.Thread):
                                     if errors <= 10:
                                         self.app.after(0, self.app.log, f"Satır {i+2}: {full_name} = {str(e)}", "error")
                     
+                    try:
+                        update_policy.on_row_done(part)
+                    except Exception as upd_err:
+                        errors += 1
+                        APP_LOGGER.error(f"part.Update hatası - Satır {i+2}: {upd_err}")
+                    
                     # Batch UI güncelleme (her N satırda bir veya son satır)
                     if (i + 1 - last_update >= batch_size) or (i + 1 == total_rows):
                         self.app.after(0, self.app.update_stats, i+1, updates, errors)
                         last_update = i + 1
 
+            # Bekleyen part.Update (durdurulsa bile yazılan değerler uygulanır)
+            try:
+                update_policy.finish(part)
+            except Exception as upd_err:
+                errors += 1
+                APP_LOGGER.error(f"Son part.Update hatası: {upd_err}")
+            self.run_report.update(update_policy.summary())
+            
             # Excel'i kapat
             wb.Close(False)
             excel.Quit()
@@ -619,6 +751,9 @@ class WorkerThread(threading.Thread):
             # Batch güncelleme
             batch_size = 50
             last_update = 0
+            update_policy = PartUpdatePolicy.from_config(self.config)
+            part = None
+            APP_LOGGER.info(f"Güncelleme politikası: {update_policy.describe()}")
             
             # Satırları işle
             for i, row in enumerate(data):
@@ -659,7 +794,7 @@ class WorkerThread(threading.Thread):
                                         part = doc.Part
                                         param = part.Parameters.Item(full_name)
                                         param.Value = validated_value
-                                        part.Update()
+                                        update_policy.on_parameter_written(part)
                                         APP_LOGGER.debug(f"{full_name} = {validated_value}")
                                     except Exception as catia_err:
                                         APP_LOGGER.error(f"CATIA yazma hatası ({full_name}): {catia_err}")
@@ -679,11 +814,26 @@ class WorkerThread(threading.Thread):
                                 if errors <= 10:
                                     self.app.after(0, self.app.log, f"Satır {i+2}: {full_name} = {str(e)}", "error")
                 
+                try:
+                    update_policy.on_row_done(part)
+                except Exception as upd_err:
+                    errors += 1
+                    APP_LOGGER.error(f"part.Update hatası - Satır {i+2}: {upd_err}")
+                
                 # Batch UI güncelleme
                 if (i + 1 - last_update >= batch_size) or (i + 1 == total_rows):
                     self.app.after(0, self.app.update_stats, i+1, updates, errors)
                     last_update = i + 1
             
+            # Bekleyen part.Update (durdurulsa bile yazılan değerler uygulanır)
+            try:
+                update_policy.finish(part)
+            except Exception as upd_err:
+                errors += 1
+                APP_LOGGER.error(f"Son part.Update hatası: {upd_err}")
+            self.run_report.update(update_policy.summary())
+            APP_LOGGER.info(f"part.Update: {update_policy.summary()}")
+            
             # Son güncelleme
             self.app.after(0, self.app.update_stats, total_rows, updates, errors)
             self.app.after(0, self.app.finish_process)
@@ -1184,6 +1334,22 @@ class AutomationSuite(ctk.CTk):
         self.lbl_summary.grid(row=0, column=0, sticky="w")
         self.lbl_sheet_hint = ctk.CTkLabel(summary_bar, text="Parametre eşleşmelerini Ayarlar sekmesinden kontrol edin.", text_color="#888")
         self.lbl_sheet_hint.grid(row=0, column=1, sticky="e")
+        
+        # part.Update() politikası
+        policy_frame = ctk.CTkFrame(summary_bar, fg_color="transparent")
+        policy_frame.grid(row=1, column=0, columnspan=2, sticky="w", pady=(5, 0))
+        ctk.CTkLabel(policy_frame, text="part.Update():", text_color=self.colors["text_gray"]).pack(side="left")
+        self.combo_update_policy = ctk.CTkComboBox(policy_frame, values=list(UPDATE_POLICIES.values()), width=160)
+        self.combo_update_policy.set(UPDATE_POLICIES["parameter"])
+        self.combo_update_policy.pack(side="left", padx=(5, 15))
+        ctk.CTkLabel(policy_frame, text="N satır:", text_color=self.colors["text_gray"]).pack(side="left")
+        self.entry_update_rows = ctk.CTkEntry(policy_frame, width=60, justify="center")
+        self.entry_update_rows.insert(0, "50")
+        self.entry_update_rows.pack(side="left", padx=(5, 15))
+        ctk.CTkLabel(policy_frame, text="Hedef (ms):", text_color=self.colors["text_gray"]).pack(side="left")
+        self.entry_update_latency = ctk.CTkEntry(policy_frame, width=60, justify="center")
+        self.entry_update_latency.insert(0, "500")
+        self.entry_update_latency.pack(side="left", padx=(5, 0))
         # İstatistik Kartları
         frame_stats = ctk.CTkFrame(self.tab_monitor, fg_color=self.colors["panel"], corner_radius=10)
         frame_stats.grid(row=2, column=0, padx=10, pady=10, sticky="ew")
@@ -1223,6 +1389,13 @@ class AutomationSuite(ctk.CTk):
         # Animasyon değişkenleri
         self.hamster_angle = 0
         self.hamster_animation_id = None
+        self.hamster_paused = False   # pencere küçültülmüş / Monitör sekmesi gizli
+        self._hamster_items = None    # kalıcı canvas öğeleri (draw_hamster_wheel)
+        self._hamster_size = None     # karelerin hesaplandığı canvas boyutu
+        self._hamster_frames = {}     # açı -> hareketli öğelerin koordinatları
+        # Sekme tekrar gösterilince / pencere geri açılınca animasyonu sürdür
+        # (Map olayı alt widget'lardan da toplevel'a ulaşır)
+        self.bind("<Map>", self.resume_hamster_animation, add="+")
 
         log_actions = ctk.CTkFrame(self.tab_monitor, fg_color="transparent")
         log_actions.grid(row=5, column=0, padx=10, pady=(0,10), sticky="ew")
@@ -1508,6 +1681,9 @@ class AutomationSuite(ctk.CTk):
             self.btn_clear_params.configure(state=state)
         if hasattr(self, "combo_sheet"):
             self.combo_sheet.configure(state=combo_state)
+        for widget_name in ("combo_update_policy", "entry_update_rows", "entry_update_latency"):
+            if hasattr(self, widget_name):
+                getattr(self, widget_name).configure(state=state)
         for row in self.param_rows:
             row["col"].configure(state=state)
             row["name"].configure(state=state)
@@ -1719,11 +1895,16 @@ class AutomationSuite(ctk.CTk):
                 messagebox.showwarning("Uyarı", "Lütfen bir Excel sayfası seçin!")
                 return
             
+            # part.Update() politikası
+            if not self.read_update_policy():
+                return
+            
             # Kullanıcıdan onay al (opsiyonel)
             confirm_msg = f"İşlem başlatılacak:\n\n"
             confirm_msg += f"Dosya: {os.path.basename(self.selected_file)}\n"
             confirm_msg += f"Sayfa: {self.config['sheet_name']}\n"
-            confirm_msg += f"Parametre Sayısı: {len(dynamic_params)}\n\n"
+            confirm_msg += f"Parametre Sayısı: {len(dynamic_params)}\n"
+            confirm_msg += f"part.Update(): {self.combo_update_policy.get()}\n\n"
             confirm_msg += "Devam etmek istiyor musunuz?"
             
             if not messagebox.askyesno("İşlemi Başlat", confirm_msg):
@@ -1753,6 +1934,28 @@ class AutomationSuite(ctk.CTk):
             self.log(f"İşlem başlatılamadı: {e}", "error")
             messagebox.showerror("Hata", f"İşlem başlatılamadı:\n{str(e)}")
 
+    def read_update_policy(self):
+        """part.Update() politikası ayarlarını config'e aktarır"""
+        policy_label = self.combo_update_policy.get()
+        policy = next((k for k, v in UPDATE_POLICIES.items() if v == policy_label), None)
+        if policy is None:
+            self.log(f"Geçersiz güncelleme politikası: '{policy_label}'", "error")
+            return False
+        try:
+            batch_rows = int(self.entry_update_rows.get())
+            latency_ms = float(self.entry_update_latency.get())
+            if batch_rows < 1 or latency_ms <= 0:
+                raise ValueError
+        except ValueError:
+            self.log("N satır ve hedef gecikme pozitif sayı olmalı!", "error")
+            messagebox.showwarning("Uyarı", "N satır ve hedef gecikme pozitif sayı olmalı!")
+            return False
+        
+        self.config["update_policy"] = policy
+        self.config["update_batch_rows"] = batch_rows
+        self.config["update_target_latency"] = latency_ms / 1000.0
+        return True
+
     # (Diğer yardımcı fonksiyonlar: log, update_stats vs. aynı kalır)
     def log(self, msg, type="info"):
         icons = {"info": "ℹ", "update": "⚡", "error": "✖", "success": "✔"}
@@ -1851,11 +2054,16 @@ class AutomationSuite(ctk.CTk):
             self.draw_hamster_wheel()
         
     def draw_hamster_wheel(self):
-        """Hamster çarkı ve hamster'ı çizer"""
+        """Hamster çarkını çizer.
+
+        Canvas öğeleri bir kez oluşturulur; her karede sadece hareketli öğelerin
+        (çubuklar, hamster) coords'u değişir. Kare koordinatları canvas boyutu başına
+        açı ile önbelleğe alınır (360 / 8 = 45 kare), yani trigonometri her kare
+        için bir kez hesaplanır.
+        """
         if not hasattr(self, 'hamster_canvas'):
             return
         canvas = self.hamster_canvas
-        canvas.delete("all")
         
         # Canvas boyutları
         width = canvas.winfo_width()
@@ -1866,76 +2074,96 @@ class AutomationSuite(ctk.CTk):
             height = max(height, 80)
             canvas.configure(width=width, height=height)
         
+        if self._hamster_items is None:
+            self._hamster_items = {
+                "wheel": canvas.create_oval(0, 0, 0, 0, outline="#666", width=3, fill="#2b2b2b"),
+                "inner": canvas.create_oval(0, 0, 0, 0, outline="#444", width=2, fill="#1a1a1a"),
+                # Hareketli öğeler (sıra _hamster_frame ile aynı)
+                "moving": [canvas.create_line(0, 0, 0, 0, fill="#555", width=2) for _ in range(8)] + [
+                    canvas.create_oval(0, 0, 0, 0, fill="#D2691E", outline="#8B4513", width=2),  # gövde
+                    canvas.create_oval(0, 0, 0, 0, fill="white", outline="black"),                # göz
+                    canvas.create_oval(0, 0, 0, 0, fill="black")],                                # göz bebeği
+            }
+        items = self._hamster_items
+        
+        if self._hamster_size != (width, height):
+            # Boyut değişti: sabit halkaları yerleştir, kare önbelleğini sıfırla
+            self._hamster_size = (width, height)
+            self._hamster_frames = {}
+            center_x = width // 2
+            center_y = height // 2
+            wheel_radius = min(width, height) // 3
+            inner_radius = wheel_radius * 0.7
+            canvas.coords(items["wheel"], center_x - wheel_radius, center_y - wheel_radius,
+                          center_x + wheel_radius, center_y + wheel_radius)
+            canvas.coords(items["inner"], center_x - inner_radius, center_y - inner_radius,
+                          center_x + inner_radius, center_y + inner_radius)
+        
+        frame = self._hamster_frames.get(self.hamster_angle)
+        if frame is None:
+            frame = self._hamster_frames[self.hamster_angle] = self._hamster_frame(width, height, self.hamster_angle)
+        for item, xy in zip(items["moving"], frame):
+            canvas.coords(item, *xy)
+    
+    @staticmethod
+    def _hamster_frame(width, height, angle_deg):
+        """Verilen açı için çubuk ve hamster koordinatları (8 çubuk + gövde + göz + göz bebeği)"""
         center_x = width // 2
         center_y = height // 2
         wheel_radius = min(width, height) // 3
-        
-        # Çark (dış halka)
-        canvas.create_oval(
-            center_x - wheel_radius, center_y - wheel_radius,
-            center_x + wheel_radius, center_y + wheel_radius,
-            outline="#666", width=3, fill="#2b2b2b"
-        )
-        
-        # İç halka
         inner_radius = wheel_radius * 0.7
-        canvas.create_oval(
-            center_x - inner_radius, center_y - inner_radius,
-            center_x + inner_radius, center_y + inner_radius,
-            outline="#444", width=2, fill="#1a1a1a"
-        )
         
         # Spokes (çubuklar)
-        import math
         num_spokes = 8
+        frame = []
         for i in range(num_spokes):
-            angle = (self.hamster_angle + i * 360 / num_spokes) * math.pi / 180
-            x1 = center_x + inner_radius * math.cos(angle)
-            y1 = center_y + inner_radius * math.sin(angle)
-            x2 = center_x + wheel_radius * math.cos(angle)
-            y2 = center_y + wheel_radius * math.sin(angle)
-            canvas.create_line(x1, y1, x2, y2, fill="#555", width=2)
+            angle = (angle_deg + i * 360 / num_spokes) * math.pi / 180
+            frame.append((center_x + inner_radius * math.cos(angle), center_y + inner_radius * math.sin(angle),
+                          center_x + wheel_radius * math.cos(angle), center_y + wheel_radius * math.sin(angle)))
         
         # Hamster (basitleştirilmiş - daire)
-        hamster_angle_rad = (self.hamster_angle + 90) * math.pi / 180
+        hamster_angle_rad = (angle_deg + 90) * math.pi / 180
         hamster_x = center_x + (inner_radius + wheel_radius) / 2 * math.cos(hamster_angle_rad)
         hamster_y = center_y + (inner_radius + wheel_radius) / 2 * math.sin(hamster_angle_rad)
         hamster_size = wheel_radius * 0.15
-        
-        # Hamster gövdesi
-        canvas.create_oval(
-            hamster_x - hamster_size, hamster_y - hamster_size,
-            hamster_x + hamster_size, hamster_y + hamster_size,
-            fill="#D2691E", outline="#8B4513", width=2
-        )
+        frame.append((hamster_x - hamster_size, hamster_y - hamster_size,
+                      hamster_x + hamster_size, hamster_y + hamster_size))
         
         # Hamster gözü
         eye_offset = hamster_size * 0.3
         eye_size = hamster_size * 0.2
         eye_x = hamster_x + eye_offset * math.cos(hamster_angle_rad)
         eye_y = hamster_y + eye_offset * math.sin(hamster_angle_rad)
-        canvas.create_oval(
-            eye_x - eye_size, eye_y - eye_size,
-            eye_x + eye_size, eye_y + eye_size,
-            fill="white", outline="black"
-        )
-        canvas.create_oval(
-            eye_x - eye_size*0.5, eye_y - eye_size*0.5,
-            eye_x + eye_size*0.5, eye_y + eye_size*0.5,
-            fill="black"
-        )
+        frame.append((eye_x - eye_size, eye_y - eye_size, eye_x + eye_size, eye_y + eye_size))
+        frame.append((eye_x - eye_size*0.5, eye_y - eye_size*0.5, eye_x + eye_size*0.5, eye_y + eye_size*0.5))
+        return frame
         
     def animate_hamster(self):
         """Hamster animasyonunu günceller"""
         if not hasattr(self, 'hamster_animation_id') or self.hamster_animation_id is None:
             return
         
+        # Pencere küçültülmüş veya Monitör sekmesi gizliyse zamanlamayı bırak;
+        # resume_hamster_animation (<Map>) kaldığı yerden sürdürür
+        if not self.hamster_canvas.winfo_viewable():
+            self.hamster_paused = True
+            return
+        
         self.hamster_angle = (self.hamster_angle + 8) % 360
         self.draw_hamster_wheel()
         
         # Animasyonu devam ettir (sadece çalışıyorsa)
         if self.hamster_animation_id is not None:
             self.hamster_animation_id = self.after(50, self.animate_hamster)
+    
+    def resume_hamster_animation(self, event=None):
+        """Duraklatılmış animasyonu canvas tekrar görünür olunca sürdürür"""
+        if not self.hamster_paused or self.hamster_animation_id is None:
+            return
+        if not self.hamster_canvas.winfo_viewable():
+            return
+        self.hamster_paused = False
+        self.hamster_animation_id = self.after(50, self.animate_hamster)
         
     def start_hamster_animation(self):
         """Hamster animasyonunu başlatır"""
@@ -1948,6 +2176,7 @@ class AutomationSuite(ctk.CTk):
             self.hamster_canvas.update_idletasks()
             
         self.hamster_angle = 0
+        self.hamster_paused = False
         self.draw_hamster_wheel()
         # İlk animasyon çağrısını başlat
         self.hamster_animation_id = self.after(50, self.animate_hamster)
@@ -1955,8 +2184,10 @@ class AutomationSuite(ctk.CTk):
     def stop_hamster_animation(self):
         """Hamster animasyonunu durdurur"""
         if self.hamster_animation_id is not None:
-            self.after_cancel(self.hamster_animation_id)
+            if not self.hamster_paused:
+                self.after_cancel(self.hamster_animation_id)
             self.hamster_animation_id = None
+        self.hamster_paused = False
         
     def finish_process(self):
         self.set_controls_state(True)
@@ -2005,6 +2236,13 @@ class AutomationSuite(ctk.CTk):
                 f.write(f"Hatalar: {errors}\n")
                 f.write(f"Başarı Oranı: {(updates/self.total_work*100) if self.total_work > 0 else 0:.1f}%\n")
                 f.write(f"Geçen Süre: {time.strftime('%M:%S', time.gmtime(elapsed_time))}\n")
+                
+                # Worker'ın topladığı performans bilgileri (politika, Update maliyeti, ...)
+                report = getattr(self.worker, "run_report", None)
+                if report:
+                    f.write(f"\nPerformans\n{'-'*50}\n")
+                    for key, value in report.items():
+                        f.write(f"{key}: {value}\n")
             self.log(f"Sonuçlar otomatik kaydedildi: {os.path.basename(filename)}", "info")
         except Exception as e:
             self.log(f"Sonuç kaydedilemedi: {e}", "error")
@@ -2017,7 +2255,9 @@ class AutomationSuite(ctk.CTk):
         profile = {
             "params": [],
             "sheet_name": self.config.get("sheet_name", ""),
-            "excel_file": self.selected_file if self.selected_file else ""
+            "excel_file": self.selected_file if self.selected_file else "",
+            "update_policy": self.config.get("update_policy", "parameter"),
+            "update_batch_rows": self.config.get("update_batch_rows", 50)
         }
         for row in self.param_rows:
             suffix = row["name"].get().strip()
@@ -2068,6 +2308,15 @@ class AutomationSuite(ctk.CTk):
                         except:
                             pass
                 
+                # part.Update() politikası
+                if profile.get("update_policy") in UPDATE_POLICIES:
+                    self.config["update_policy"] = profile["update_policy"]
+                    self.combo_update_policy.set(UPDATE_POLICIES[profile["update_policy"]])
+                if profile.get("update_batch_rows"):
+                    self.config["update_batch_rows"] = int(profile["update_batch_rows"])
+                    self.entry_update_rows.delete(0, "end")
+                    self.entry_update_rows.insert(0, str(profile["update_batch_rows"]))
+                
                 # Excel dosyasını yükle (eğer varsa)
                 if "excel_file" in profile and profile["excel_file"] and os.path.exists(profile["excel_file"]):
                     self.selected_file = profile["excel_file"]
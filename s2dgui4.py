@@ -8,6 +8,28 @@ import string
 import logging
 import traceback
 import re
+import tempfile
+import hashlib
+import queue
+import concurrent.futures
+import multiprocessing
+import fnmatch
+import operator
+import posixpath
+import zipfile
+import codecs
+import array
+import bisect
+import decimal
+import math
+import json
+import mmap
+import shutil
+import zlib
+import struct
+import csv
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
 from logging.handlers import RotatingFileHandler
 from tkinter import filedialog, messagebox, Canvas
 try:
@@ -35,6 +57,13 @@ try:
 except ImportError:
     WIN32COM_AVAILABLE = False
     print("⚠️ win32com bulunamadı. Test modu dışında çalışmayabilir.")
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.parquet
+    PYARROW_AVAILABLE = True  # Opsiyonel: Parquet girişi ve hızlı CSV okuma
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # ==========================================
 # AYARLAR & YARDIMCILAR
@@ -164,15 +193,371 @@ class DropZone(ctk.CTkFrame):
         if self.command:
             self.command()
 
+class PreviewGrid(ctk.CTkFrame):
+    """Sanal (virtualized) önizleme tablosu: tek Canvas, sadece görünen hücreler çizilir.
+
+    Satır yüksekliği ve sütun genişliği sabit olduğundan görünen aralık doğrudan
+    hesaplanır. Canvas öğeleri yuva (slot) başına bir kez oluşturulur; kaydırmada
+    sadece metni değişen yuvalar güncellenir. Çizim maliyeti veri boyutuna değil
+    pencere boyutuna bağlıdır. Başlık satırı ve satır numarası sütunu sabit kalır.
+    """
+    ROW_H = 28
+    HEAD_H = 32
+    COL_W = 112         # MAX_CHARS karakter Consolas 10'a yeter
+    NUM_W = 50
+    VISIBLE_ROWS = 12   # Başlangıç yüksekliği (satır)
+    MAX_CHARS = 15
+    WHEEL_ROWS = 3
+
+    def __init__(self, parent):
+        super().__init__(parent, fg_color=THEME["bg_dark"], corner_radius=10)
+        self.canvas = Canvas(self, bg=THEME["bg_dark"], highlightthickness=0, borderwidth=0, relief="flat",
+                             height=self.HEAD_H + self.ROW_H * self.VISIBLE_ROWS)
+        self.v_scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self.yview)
+        self.h_scrollbar = ctk.CTkScrollbar(self, orientation="horizontal", command=self.xview)
+        self.canvas.grid(row=0, column=0, sticky="nsew", padx=(6, 0), pady=(6, 0))
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        self._reset_state()
+
+        self.canvas.bind("<Configure>", self._render)
+        if sys.platform in ("win32", "darwin"):
+            self.canvas.bind("<MouseWheel>", self._on_wheel)
+            self.canvas.bind("<Shift-MouseWheel>", lambda e: self._on_wheel(e, horizontal=True))
+        else:
+            for button, step in (("4", -1), ("5", 1)):
+                self.canvas.bind(f"<Button-{button}>", lambda e, s=step: self.yview("scroll", s * self.WHEEL_ROWS, "units"))
+                self.canvas.bind(f"<Shift-Button-{button}>", lambda e, s=step: self.xview("scroll", s, "units"))
+
+    def _reset_state(self):
+        self.data = []
+        self.n_rows = 0
+        self.n_cols = 0
+        self.top = 0        # İlk görünen veri satırı
+        self.left = 0       # İlk görünen veri sütunu
+        self.rows_fit = 0   # Tam görünen satır/sütun sayısı (kaydırma sınırı)
+        self.cols_fit = 0
+        self._width = 0
+        self._stripes = []  # Satır yuvası başına zemin şeridi
+        self._numbers = []  # Satır yuvası başına satır numarası
+        self._heads = []    # Sütun yuvası başına (zemin, harf)
+        self._cells = []    # [satır yuvası][sütun yuvası] metin öğesi
+        self._shown = {}    # öğe -> gösterilen metin/renk (değişmeyen yuva Tk'ye gitmez)
+        self._corner = None
+        self.render_ms = 0.0
+
+    def set_data(self, data):
+        """Yeni önizleme verisi; yuvalar yeniden kullanılır, görünüm başa döner"""
+        self.data = data
+        self.n_rows = len(data)
+        self.n_cols = max((len(r) for r in data), default=0)
+        self.top = 0
+        self.left = 0
+        self._render()
+
+    @classmethod
+    def cell_text(cls, value):
+        text = "" if value is None else str(value)
+        return text if len(text) <= cls.MAX_CHARS else text[:cls.MAX_CHARS - 2] + "..."
+
+    # --- yuva havuzu ---
+    def _ensure_slots(self, rows, cols, width):
+        c = self.canvas
+        if self._corner is None:
+            self._corner = (c.create_rectangle(2, 2, self.NUM_W - 2, self.HEAD_H - 2,
+                                               fill=THEME["bg_card_hover"], outline=""),
+                            c.create_text(self.NUM_W // 2, self.HEAD_H // 2, text="#", fill=THEME["text_main"],
+                                          font=("Roboto", 10, "bold")))
+        while len(self._stripes) < rows:
+            i = len(self._stripes)
+            y = self.HEAD_H + i * self.ROW_H
+            self._stripes.append(c.create_rectangle(0, y + 1, width, y + self.ROW_H - 1, outline="", width=0))
+            c.tag_lower(self._stripes[-1])  # Sonradan eklenen şerit metinlerin altında kalır
+            self._numbers.append(c.create_text(self.NUM_W // 2, y + self.ROW_H // 2, fill=THEME["text_muted"],
+                                               font=("Roboto", 9)))
+            self._cells.append([])
+        while len(self._heads) < cols:
+            j = len(self._heads)
+            x = self.NUM_W + j * self.COL_W
+            self._heads.append((c.create_rectangle(x + 2, 2, x + self.COL_W - 2, self.HEAD_H - 2,
+                                                   fill=THEME["bg_card_hover"], outline=""),
+                                c.create_text(x + self.COL_W // 2, self.HEAD_H // 2, fill=THEME["text_main"],
+                                              font=("Roboto", 10, "bold"))))
+        for i, row_items in enumerate(self._cells):
+            y = self.HEAD_H + i * self.ROW_H + self.ROW_H // 2
+            while len(row_items) < len(self._heads):
+                x = self.NUM_W + len(row_items) * self.COL_W
+                row_items.append(c.create_text(x + 6, y, anchor="w", fill=THEME["text_main"],
+                                               font=("Consolas", 10)))
+        if width != self._width:
+            # Şeritler pencere genişliğinde; sadece genişlik değişince güncellenir
+            for i, stripe in enumerate(self._stripes):
+                y = self.HEAD_H + i * self.ROW_H
+                c.coords(stripe, 0, y + 1, width, y + self.ROW_H - 1)
+            self._width = width
+
+    def _set(self, item, **options):
+        key = tuple(options.values())
+        if self._shown.get(item) != key:
+            self.canvas.itemconfigure(item, **options)
+            self._shown[item] = key
+
+    # --- çizim ---
+    def _render(self, event=None):
+        t0 = time.perf_counter()
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return  # Henüz yerleşmedi; <Configure> tekrar çağırır
+        rows = max(0, -(-(height - self.HEAD_H) // self.ROW_H))
+        cols = max(0, -(-(width - self.NUM_W) // self.COL_W))
+        self.rows_fit = max(1, (height - self.HEAD_H) // self.ROW_H)
+        self.cols_fit = max(1, (width - self.NUM_W) // self.COL_W)
+        self.top = max(0, min(self.top, self.n_rows - self.rows_fit))
+        self.left = max(0, min(self.left, self.n_cols - self.cols_fit))
+        self._ensure_slots(rows, cols, width)
+
+        for j, (head_bg, head_text) in enumerate(self._heads):
+            col = self.left + j
+            visible = j < cols and col < self.n_cols
+            self._set(head_bg, state="normal" if visible else "hidden")
+            self._set(head_text, text=num2col(col + 1) if visible else "")
+        for i, stripe in enumerate(self._stripes):
+            r = self.top + i
+            row = self.data[r] if i < rows and r < self.n_rows else None
+            if row is None:
+                self._set(stripe, state="hidden")
+                self._set(self._numbers[i], text="")
+                for item in self._cells[i]:
+                    self._set(item, text="")
+                continue
+            self._set(stripe, state="normal", fill=THEME["bg_card"] if r % 2 == 0 else THEME["bg_card_hover"])
+            self._set(self._numbers[i], text=str(r + 1))
+            for j, item in enumerate(self._cells[i]):
+                col = self.left + j
+                self._set(item, text=self.cell_text(row[col]) if j < cols and col < len(row) else "")
+
+        self.v_scrollbar.set(*self._fractions(self.top, self.rows_fit, self.n_rows))
+        self.h_scrollbar.set(*self._fractions(self.left, self.cols_fit, self.n_cols))
+        self.render_ms = (time.perf_counter() - t0) * 1000
+
+    @staticmethod
+    def _fractions(first, fit, total):
+        if total <= fit:
+            return 0.0, 1.0
+        return first / total, min(1.0, (first + fit) / total)
+
+    # --- kaydırma (Scrollbar komut protokolü: moveto f / scroll n units|pages) ---
+    def _scroll(self, position, fit, total, args):
+        if not args:
+            return position
+        if args[0] == "moveto":
+            position = int(round(float(args[1]) * total))
+        elif args[0] == "scroll":
+            step = int(float(args[1]))
+            position += step * (fit if len(args) > 2 and args[2] == "pages" else 1)
+        return max(0, min(position, total - fit))
+
+    def yview(self, *args):
+        top = self._scroll(self.top, self.rows_fit, self.n_rows, args)
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def xview(self, *args):
+        left = self._scroll(self.left, self.cols_fit, self.n_cols, args)
+        if left != self.left:
+            self.left = left
+            self._render()
+
+    def _on_wheel(self, event, horizontal=False):
+        notches = -1 if event.delta > 0 else 1
+        if sys.platform == "darwin":
+            notches = -event.delta  # macOS: delta küçük adımlarla gelir
+        if horizontal:
+            self.xview("scroll", notches, "units")
+        else:
+            self.yview("scroll", notches * self.WHEEL_ROWS, "units")
+
+
+class ThroughputSeries:
+    """İşlem hızı (satır/sn) zaman serisi - sabit boyutlu, min/max seyreltilmiş.
+
+    İlerleme sayacı örneklerinden anlık hız (ardışık iki örnek arası) ve
+    AVG_WINDOW saniyelik hareketli ortalama hesaplanır. Hızlar zaman kovalarında
+    [başlangıç sn, min, max, ortalama] olarak tutulur; kova sayısı CAPACITY'ye
+    ulaşınca komşu kovalar birleştirilip kova genişliği ikiye katlanır. Böylece
+    bellek ve çizim maliyeti çalıştırma süresinden bağımsızdır, tepe ve dipler
+    seyreltmede kaybolmaz.
+    """
+    CAPACITY = 240      # kova sayısı üst sınırı
+    MIN_DT = 0.25       # örnekler arası en kısa süre (sn); daha sık gelenler atlanır
+    AVG_WINDOW = 5.0    # hareketli ortalama penceresi (sn)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.t0 = None
+        self.span = self.MIN_DT     # kova genişliği (sn)
+        self.buckets = []
+        self._last = None           # son kabul edilen örnek (t, sayaç)
+        self._first_count = 0
+        self._latest = None         # atlananlar dahil en son örnek (genel ortalama için)
+        self._window = deque()      # hareketli ortalama örnekleri
+        self.instant = 0.0
+        self.average = 0.0
+        self.peak = 0.0
+
+    def add(self, t, count):
+        """Örnek ekler; yeni bir hız noktası oluştuysa True döner (grafik yenilenir)"""
+        if self.t0 is None:
+            self.t0 = t
+            self._first_count = count
+            self._last = self._latest = (t, count)
+            self._window.append((t, count))
+            return False
+        last_t, last_count = self._last
+        if count < last_count:
+            # Sayaç geri gitti (yeni sayfa / aşama): hız tabanını yenile
+            self._first_count -= last_count - count
+            self._last = self._latest = (t, count)
+            self._window.clear()
+            self._window.append((t, count))
+            return False
+        self._latest = (t, count)
+        dt = t - last_t
+        if dt < self.MIN_DT:
+            return False
+
+        rate = (count - last_count) / dt
+        self._last = (t, count)
+        window = self._window
+        window.append((t, count))
+        while len(window) > 2 and t - window[1][0] >= self.AVG_WINDOW:
+            window.popleft()
+        w_t, w_count = window[0]
+        self.instant = rate
+        self.average = (count - w_count) / (t - w_t)
+        self.peak = max(self.peak, rate)
+
+        x = t - self.t0
+        buckets = self.buckets
+        if buckets and x < buckets[-1][0] + self.span:
+            bucket = buckets[-1]
+            bucket[1] = min(bucket[1], rate)
+            bucket[2] = max(bucket[2], rate)
+            bucket[3] = self.average
+        else:
+            if len(buckets) >= self.CAPACITY:
+                self._compact()
+            buckets.append([x - x % self.span, rate, rate, self.average])
+        return True
+
+    def _compact(self):
+        """Kova genişliğini ikiye katlar: aynı yeni kovaya düşenler min/max ile birleşir"""
+        self.span *= 2
+        merged = []
+        for start, lo, hi, avg in self.buckets:
+            start -= start % self.span
+            if merged and merged[-1][0] == start:
+                bucket = merged[-1]
+                bucket[1] = min(bucket[1], lo)
+                bucket[2] = max(bucket[2], hi)
+                bucket[3] = avg
+            else:
+                merged.append([start, lo, hi, avg])
+        self.buckets = merged
+
+    def overall(self):
+        """Çalıştırma boyunca ortalama hız (satır/sn)"""
+        if self.t0 is None or self._latest[0] <= self.t0:
+            return 0.0
+        return (self._latest[1] - self._first_count) / (self._latest[0] - self.t0)
+
+
+class ThroughputChart(ctk.CTkFrame):
+    """ThroughputSeries çizimi: min/max bandı + hareketli ortalama çizgisi.
+
+    Canvas öğeleri bir kez oluşturulur, yenilemede sadece coords/itemconfigure
+    çağrılır (nokta sayısı en fazla 2 x CAPACITY).
+    """
+    HEIGHT = 110
+    BAND_COLOR = "#1e3a5f"   # primary'nin bg_dark üzerindeki soluk tonu
+
+    def __init__(self, parent, series):
+        super().__init__(parent, fg_color=THEME["bg_dark"], corner_radius=10)
+        self.series = series
+        self.canvas = Canvas(self, bg=THEME["bg_dark"], highlightthickness=0, borderwidth=0, relief="flat",
+                             height=self.HEIGHT)
+        self.canvas.pack(fill="both", expand=True, padx=6, pady=6)
+        c = self.canvas
+        self._grid = [c.create_line(0, 0, 0, 0, fill=THEME["border"], dash=(2, 4)) for _ in range(3)]
+        self._band = c.create_polygon(0, 0, 0, 0, 0, 0, fill=self.BAND_COLOR, outline="")
+        self._avg = c.create_line(0, 0, 0, 0, fill=THEME["primary"], width=2)
+        self._scale = c.create_text(4, 2, anchor="nw", text="", fill=THEME["text_muted"], font=("Roboto", 9))
+        self._rates = c.create_text(0, 2, anchor="ne", text="", fill=THEME["text_main"], font=("Roboto", 10))
+        c.bind("<Configure>", lambda e: self.redraw())
+
+    @staticmethod
+    def nice_ceiling(value):
+        """Eksen üst sınırı: 1-2-5 serisinden value'yu aşan ilk değer"""
+        if value <= 0:
+            return 1
+        magnitude = 10 ** int(f"{value:e}".split("e")[1])
+        for step in (1, 2, 5, 10):
+            if value <= step * magnitude:
+                return step * magnitude
+        return 10 * magnitude
+
+    def redraw(self):
+        c = self.canvas
+        w, h = c.winfo_width(), c.winfo_height()
+        series = self.series
+        buckets = series.buckets
+        if w < 10 or h < 10 or not buckets:
+            c.coords(self._band, 0, 0, 0, 0, 0, 0)
+            c.coords(self._avg, 0, 0, 0, 0)
+            for line in self._grid:
+                c.coords(line, 0, 0, 0, 0)
+            c.itemconfigure(self._scale, text="")
+            c.itemconfigure(self._rates, text="")
+            return
+
+        top = self.nice_ceiling(max(b[2] for b in buckets))
+        span = series.span
+        x_total = max(buckets[-1][0] + span, span * 4)
+        x_k = (w - 1) / x_total
+        y_top = 16   # üstte yazılar için boşluk
+        y_k = (h - 1 - y_top) / top
+
+        upper, lower, avg = [], [], []
+        for start, lo, hi, mean in buckets:
+            x0, x1 = start * x_k, (start + span) * x_k
+            y_hi, y_lo = h - 1 - hi * y_k, h - 1 - lo * y_k
+            upper += (x0, y_hi, x1, y_hi)
+            lower += (x0, y_lo, x1, y_lo)
+            avg += ((x0 + x1) / 2, h - 1 - mean * y_k)
+        for i in range(len(lower) - 2, -1, -2):
+            upper += (lower[i], lower[i + 1])
+        if len(avg) == 2:
+            avg += (avg[0] + 1, avg[1])
+        c.coords(self._band, *upper)
+        c.coords(self._avg, *avg)
+        for k, line in enumerate(self._grid, 1):
+            y = h - 1 - top * k / 4 * y_k
+            c.coords(line, 0, y, w, y)
+        c.itemconfigure(self._scale, text=f"{top:g} satır/sn")
+        c.coords(self._rates, w - 4, 2)
+        c.itemconfigure(self._rates, text=f"Anlık {series.instant:.1f}  ·  Ort. {series.average:.1f} satır/sn")
 
 # ==========================================
 # LOGGING SİSTEMİ
 # ==========================================
 def setup_logger():
     """Gelişmiş logging sistemi - Dosya ve konsol çıktısı"""
-    if not os.path.exists("Logs"):
-        os.makedirs("Logs")
-    
     logger = logging.getLogger("CATIA_Automation")
     logger.setLevel(logging.DEBUG)
     
@@ -180,6 +565,16 @@ def setup_logger():
     if logger.handlers:
         return logger
     
+    # Paralel ayrıştırma süreçleri (spawn) modülü yeniden import eder: aynı log dosyasına
+    # ikinci bir RotatingFileHandler açılmaz (Windows'ta döndürme sırasında dosya kilitlenir).
+    # __main__ yeniden import edilirken parent_process() henüz None, süreç adı ise atanmış olur.
+    if multiprocessing.current_process().name != "MainProcess" or multiprocessing.parent_process() is not None:
+        logger.addHandler(logging.NullHandler())
+        return logger
+    
+    if not os.path.exists("Logs"):
+        os.makedirs("Logs")
+    
     # Dosya handler (Rotating - Max 5MB, 5 yedek)
     log_file = os.path.join("Logs", "catia_automation.log")
     fh = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=5, encoding='utf-8')
@@ -198,6 +593,76 @@ def setup_logger():
 # Global logger
 APP_LOGGER = setup_logger()
 
+# ==========================================
+# LOG HALKASI (arayüz log deposu)
+# ==========================================
+LOG_CAPACITY = 100_000     # halkada tutulan satır (dolunca en eskinin üzerine yazılır)
+LOG_VIEW_LINES = 1000      # log kutusunda görünen satır
+
+
+class LogRecord:
+    """Tek log satırı - dict yerine __slots__ (100k satırda ~3x daha az bellek)"""
+    __slots__ = ("seq", "ts", "type", "msg")
+    ICONS = {"info": "ℹ", "update": "⚡", "error": "✖", "success": "✔"}
+
+    def __init__(self, seq, ts, type, msg):
+        self.seq = seq
+        self.ts = ts
+        self.type = type
+        self.msg = msg
+
+    def line(self):
+        return f"[{self.ts}] {self.ICONS.get(self.type, '')} {self.msg}"
+
+
+class LogRing:
+    """
+    Sabit kapasiteli log halkası. Her kayda monoton artan bir sıra numarası (seq)
+    verilir ve kayıt _slots[seq % capacity] yuvasına yazılır; ekleme, kırpma ve
+    temizleme O(1)'dir. Hata kayıtlarının seq'leri ayrıca `errors` deque'sunda
+    tutulur: "sadece hatalar" görünümü listeyi yeniden filtrelemek yerine bu
+    indeksten okunur.
+    """
+
+    def __init__(self, capacity=LOG_CAPACITY):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self.next_seq = 0       # sıradaki kaydın seq'i
+        self._base = 0          # clear() sonrası ilk geçerli seq
+        self.errors = deque()   # hata kayıtlarının seq'leri (artan)
+
+    @property
+    def first_seq(self):
+        """Halkada hâlâ duran en eski kaydın seq'i"""
+        return max(self._base, self.next_seq - self.capacity)
+
+    def __len__(self):
+        return self.next_seq - self.first_seq
+
+    def append(self, ts, type, msg):
+        seq = self.next_seq
+        record = LogRecord(seq, ts, type, msg)
+        self._slots[seq % self.capacity] = record
+        self.next_seq = seq + 1
+        if type == "error":
+            self.errors.append(seq)
+        # Üzerine yazılan hataları indeksten at (amortize O(1))
+        first = self.first_seq
+        errors = self.errors
+        while errors and errors[0] < first:
+            errors.popleft()
+        return record
+
+    def get(self, seq):
+        if seq < self.first_seq or seq >= self.next_seq:
+            return None
+        return self._slots[seq % self.capacity]
+
+    def clear(self):
+        """Yuvaları silmeden boşaltır: eski kayıtlar _base'in altında kalır"""
+        self._base = self.next_seq
+        self.errors.clear()
+
 # ==========================================
 # VERİ DOĞRULAMA
 # ==========================================
@@ -205,6 +670,8 @@ def validate_parameter_value(value, param_name):
     """Parametre değerini CATIA'ya göndermeden önce doğrula"""
     try:
         float_val = float(value)
+        if not math.isfinite(float_val):
+            raise ValueError("sonlu bir sayı olmalı")
         
         # Özel doğrulama kuralları
         if "Thickness" in param_name or param_name.startswith("T"):
@@ -222,8 +689,38 @@ def validate_parameter_value(value, param_name):
 # ==========================================
 # EXCEL İŞLEMLERİ
 # ==========================================
-def read_excel_openpyxl(file_path, sheet_name=None):
-    """openpyxl ile hızlı Excel okuma"""
+def project_columns(param_map):
+    """Okunacak sütunlar: ID (0) + eşlenen sütunlar.
+
+    Döner: (columns, projected_param_map) - projected_param_map indeksleri kompakt
+    satırdaki konumlardır (read_excel_openpyxl(columns=...) çıktısı ile kullanılır).
+    """
+    columns = sorted({0} | {col_idx for _, col_idx in param_map})
+    position = {col_idx: i for i, col_idx in enumerate(columns)}
+    return columns, [(suffix, position[col_idx]) for suffix, col_idx in param_map]
+
+def _iter_sheet_rows(ws, columns=None):
+    """(excel_satır_no, satır) üretir; ID boş satırlar atlanır.
+
+    columns verilirse sadece o sütunlar okunur (max_col ile sağdaki sütunlar hiç
+    dolaşılmaz) ve satır kompakt tuple olarak döner.
+    """
+    if not columns:
+        for row_no, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+            if row and row[0]:  # İlk sütun (ID) boş değilse
+                yield row_no, row
+        return
+    width = columns[-1] + 1
+    pick = operator.itemgetter(*columns) if len(columns) > 1 else (lambda r: (r[columns[0]],))
+    for row_no, row in enumerate(ws.iter_rows(min_row=2, max_col=width, values_only=True), start=2):
+        if not row or not row[0]:
+            continue
+        if len(row) < width:
+            row = row + (None,) * (width - len(row))
+        yield row_no, pick(row)
+
+def read_excel_openpyxl(file_path, sheet_name=None, columns=None):
+    """openpyxl ile hızlı Excel okuma (columns: sadece bu 0-tabanlı sütunlar)"""
     try:
         wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
         
@@ -232,11 +729,8 @@ def read_excel_openpyxl(file_path, sheet_name=None):
         else:
             ws = wb.active
         
-        # Tüm satırları oku (ilk satır header)
-        data = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if row and row[0]:  # İlk sütun (ID) boş değilse
-                data.append(row)
+        # Satırları oku (ilk satır header)
+        data = [row for _, row in _iter_sheet_rows(ws, columns)]
         
         # Sayfa isimlerini al
         sheets = wb.sheetnames
@@ -247,11 +741,42 @@ def read_excel_openpyxl(file_path, sheet_name=None):
         APP_LOGGER.error(f"openpyxl okuma hatası: {e}")
         raise
 
-def read_excel_preview_openpyxl(file_path, max_rows=10):
-    """openpyxl ile önizleme okuma (ilk N satır, tüm sütunlar)"""
+def iter_excel_rows_openpyxl(file_path, sheet_name=None, columns=None):
+    """Satırları belleğe almadan akış halinde okur.
+
+    İlk eleman ("total", tahmini_satır_sayısı), sonrakiler ("row", excel_satır_no, satır).
+    ID (ilk sütun) boş satırlar atlanır. columns: bkz. project_columns.
+    """
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        yield ("total", max(0, (ws.max_row or 1) - 1))
+        for row_no, row in _iter_sheet_rows(ws, columns):
+            yield ("row", row_no, row)
+    finally:
+        wb.close()
+
+class PreviewCancelled(Exception):
+    """Önizleme okuması cancelled olayıyla yarıda bırakıldı"""
+
+def raise_if_cancelled(cancelled):
+    if cancelled is not None and cancelled.is_set():
+        raise PreviewCancelled()
+
+def read_excel_preview_openpyxl(file_path, max_rows=10, sheet_name=None, cancelled=None, report=None):
+    """openpyxl ile önizleme okuma (ilk N satır, tüm sütunlar; sheet_name yoksa aktif sayfa).
+    cancelled (threading.Event) kitap açıldıktan sonra ve satır aralarında kontrol edilir;
+    okunan sayfanın adı report["sheet"]'e yazılır."""
     try:
         wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-        ws = wb.active
+        try:
+            raise_if_cancelled(cancelled)
+        except PreviewCancelled:
+            wb.close()
+            raise
+        ws = wb[sheet_name] if sheet_name else wb.active
+        if report is not None:
+            report["sheet"] = ws.title
         
         # En son dolu sütunu bul - önce tüm satırları okuyup en uzun satırı bul
         max_col = 0
@@ -262,6 +787,9 @@ def read_excel_preview_openpyxl(file_path, max_rows=10):
         for idx, row in enumerate(ws.iter_rows(min_row=1, max_row=preview_rows, values_only=True)):
             if idx >= max_rows:
                 break
+            if cancelled is not None and cancelled.is_set():
+                wb.close()
+                raise PreviewCancelled()
             row_list = list(row) if row else []
             # None değerlerini temizle ve gerçek uzunluğu bul
             # Sondaki None'ları temizle
@@ -287,26 +815,3118 @@ def read_excel_preview_openpyxl(file_path, max_rows=10):
         wb.close()
         
         return data, sheets
+    except PreviewCancelled:
+        raise
     except Exception as e:
         APP_LOGGER.error(f"openpyxl önizleme hatası: {e}")
         raise
 
-def col2num(col_str):
-    """Harfi sayıya çevirir (A->1, Z->26, AA->27)"""
-    num = 0
-    col_str = col_str.strip().upper()
-    for c in col_str:
-        if c in string.ascii_letters:
-            num = num * 26 + (ord(c) - ord('A')) + 1
-    return num
+def format_row_id(id_val):
+    """ID hücresini CATIA parametre önekine çevirir (10.0 -> "10")"""
+    if isinstance(id_val, (int, float)) and not isinstance(id_val, bool):
+        return str(int(id_val)) if float(id_val).is_integer() else str(id_val)
+    return str(id_val).strip()
+
+def collect_parameter_names(data, param_map, row_numbers=None):
+    """Sayfadan üretilecek tüm 'ID + suffix' isimleri -> ilk geçtiği satır (Excel satır no).
+    row_numbers verilmezse satırların 2. satırdan boşluksuz başladığı varsayılır."""
+    names = {}
+    for i, row in enumerate(data):
+        id_val = row[0] if len(row) > 0 else None
+        if not id_val:
+            continue
+        id_str = format_row_id(id_val)
+        if not id_str:
+            continue
+        for suffix, col_idx in param_map:
+            if col_idx < len(row):
+                val = row[col_idx]
+                if val is not None and val != "":
+                    names.setdefault(id_str + suffix, row_numbers[i] if row_numbers else i + 2)
+    return names
+
+def col2num(col_str):
+    """Harfi sayıya çevirir (A->1, Z->26, AA->27)"""
+    num = 0
+    col_str = col_str.strip().upper()
+    for c in col_str:
+        if c in string.ascii_letters:
+            num = num * 26 + (ord(c) - ord('A')) + 1
+    return num
+
+def num2col(n):
+    """Sayıyı harfe çevirir (1->A, 27->AA)"""
+    string = ""
+    while n > 0:
+        n, remainder = divmod(n - 1, 26)
+        string = chr(65 + remainder) + string
+    return string
+
+# ==========================================
+# NATIVE XLSX OKUYUCU (zip + iterparse)
+# ==========================================
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_X = "{%s}" % _XLSX_MAIN_NS
+# Tarih/saat olan yerleşik sayı formatları (openpyxl BUILTIN_FORMATS)
+_XLSX_BUILTIN_DATE_FORMATS = set(range(14, 23)) | {45, 46, 47}
+_XLSX_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+_XLSX_DIMENSION_REF = re.compile(r"([A-Z]+)(\d+)$")
+_XLSX_ROW_NUMBER = re.compile(r'\sr="(\d+)"')
+_XLSX_NS_DECL = re.compile(r'xmlns(?::[\w.-]+)?="[^"]*"')
+_XLSX_CELL_ATTR = re.compile(r'\s([ts])="([^"]*)"')
+
+class NativeXlsxUnsupported(Exception):
+    """Native okuyucunun desteklemediği içerik; openpyxl'e düşülür"""
+
+def _xlsx_text(node):
+    """<si>/<is> içeriği: düz <t> + zengin metin koşularındaki <t>'ler (fonetik <rPh> hariç)"""
+    parts = []
+    plain = node.find(_X + "t")
+    if plain is not None and plain.text:
+        parts.append(plain.text)
+    for run in node.iterfind(_X + "r"):
+        t = run.find(_X + "t")
+        if t is not None and t.text:
+            parts.append(t.text)
+    return "".join(parts)
+
+def _xlsx_is_date_format(code):
+    """Biçim kodunda tarih/saat belirteci var mı (tırnak, kaçış ve [renk] blokları hariç)"""
+    code = re.sub(r'"[^"]*"|\\.|\[(?![hms]+\])[^\]]*\]', "", code)
+    return re.search(r"[dmyhs]", code, re.IGNORECASE) is not None
+
+def _xlsx_cast_number(text):
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+class CompactStringTable:
+    """Büyük sharedStrings için sıkı saklama: tek UTF-8 blob + ofset dizisi.
+    Metin başına ayrı str nesnesi (~50 bayt ek yük) tutulmaz; erişimde çözülür."""
+    def __init__(self):
+        self._blob = bytearray()
+        self._offsets = array.array("Q", [0])
+
+    def append(self, text):
+        self._blob += text.encode("utf-8")
+        self._offsets.append(len(self._blob))
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        return self._blob[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+class NativeXlsxReader:
+    """.xlsx zip'ini doğrudan açıp sharedStrings ve sayfa XML'ini artımlı çözen okuyucu.
+
+    read_excel_openpyxl (read_only, data_only) ile aynı satırları döndürür: paylaşılan
+    ve satır içi metinler, sayılar, boolean'lar, hata değerleri ve formüllerin
+    önbellekteki sonuçları desteklenir. Projeksiyonda sadece istenen sütunların
+    hücreleri çözülür. Tarih biçimli hücreler, ISO tarih hücreleri, strict OOXML
+    ve chartsheet gibi durumlarda NativeXlsxUnsupported fırlatılır.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.zip = zipfile.ZipFile(file_path)
+        self.sheets = []        # [(isim, zip içi yol)]
+        self.active_index = 0
+        self._shared = None
+        self._date_styles = None
+        self.uncached_formulas = 0  # Önbellek değeri (<v>) olmayan formül hücreleri
+        self._read_workbook()
+
+    def close(self):
+        self.zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def sheetnames(self):
+        return [name for name, _ in self.sheets]
+
+    def _parse(self, path):
+        try:
+            with self.zip.open(path) as f:
+                return ET.parse(f).getroot()
+        except KeyError:
+            raise NativeXlsxUnsupported(f"Paket parçası yok: {path}")
+
+    @staticmethod
+    def _resolve_target(target, base="xl/"):
+        return target.lstrip("/") if target.startswith("/") else posixpath.normpath(base + target)
+
+    def _read_workbook(self):
+        root = self._parse("xl/workbook.xml")
+        if root.tag != _X + "workbook":
+            raise NativeXlsxUnsupported(f"Desteklenmeyen workbook şeması: {root.tag}")
+        rels = {}
+        self._shared_path = None
+        self._styles_path = None
+        try:
+            rel_root = self._parse("xl/_rels/workbook.xml.rels")
+        except NativeXlsxUnsupported:
+            rel_root = None
+        if rel_root is not None:
+            for rel in rel_root.iter("{%s}Relationship" % _XLSX_PKG_REL_NS):
+                target = self._resolve_target(rel.get("Target", ""))
+                rel_type = rel.get("Type", "")
+                rels[rel.get("Id")] = (target, rel_type)
+                if rel_type.endswith("/sharedStrings"):
+                    self._shared_path = target
+                elif rel_type.endswith("/styles"):
+                    self._styles_path = target
+        for sheet in root.iter(_X + "sheet"):
+            target, rel_type = rels.get(sheet.get("{%s}id" % _XLSX_REL_NS), (None, ""))
+            if target is None or not rel_type.endswith("/worksheet"):
+                target = None  # chartsheet/dialogsheet: isim listede, okunamaz
+            self.sheets.append((sheet.get("name"), target))
+        view = root.find(f"{_X}bookViews/{_X}workbookView")
+        if view is not None:
+            self.active_index = int(view.get("activeTab", 0))
+
+    def _sheet_path(self, sheet_name=None):
+        if sheet_name:
+            for name, path in self.sheets:
+                if name == sheet_name:
+                    break
+            else:
+                raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        else:
+            if not 0 <= self.active_index < len(self.sheets):
+                raise NativeXlsxUnsupported("Aktif sayfa bulunamadı")
+            name, path = self.sheets[self.active_index]
+        if path is None:
+            raise NativeXlsxUnsupported(f"'{name}' bir çalışma sayfası değil")
+        return path
+
+    COMPACT_SHARED_BYTES = 16 * 1024 * 1024  # Bu boyutun üstündeki sharedStrings sıkı tabloda tutulur
+
+    @property
+    def shared_strings(self):
+        """sharedStrings.xml iterparse ile bir kez, ihtiyaç olunca okunur"""
+        if self._shared is None:
+            self._shared = []
+            if self._shared_path and self._shared_path in self.zip.namelist():
+                if self.zip.getinfo(self._shared_path).file_size > self.COMPACT_SHARED_BYTES:
+                    self._shared = CompactStringTable()
+                with self.zip.open(self._shared_path) as f:
+                    root = None
+                    for event, node in ET.iterparse(f, events=("start", "end")):
+                        if root is None:
+                            root = node
+                        elif event == "end" and node.tag == _X + "si":
+                            self._shared.append(_xlsx_text(node).replace("x005F_", ""))
+                            root.clear()  # Okunan <si>'ler kökte birikmesin
+        return self._shared
+
+    @property
+    def date_styles(self):
+        """Tarih/saat biçimli cellXfs indeksleri"""
+        if self._date_styles is None:
+            self._date_styles = set()
+            if self._styles_path and self._styles_path in self.zip.namelist():
+                root = self._parse(self._styles_path)
+                custom = {int(f.get("numFmtId")): f.get("formatCode", "")
+                          for f in root.iter(_X + "numFmt")}
+                xfs = root.find(_X + "cellXfs")
+                for i, xf in enumerate(xfs if xfs is not None else ()):
+                    fmt_id = int(xf.get("numFmtId", 0))
+                    if fmt_id in _XLSX_BUILTIN_DATE_FORMATS or (fmt_id in custom and _xlsx_is_date_format(custom[fmt_id])):
+                        self._date_styles.add(i)
+        return self._date_styles
+
+    def dimension(self, sheet_name=None):
+        """<dimension ref> -> (max_row, max_col) veya None (sadece başlangıç okunur)"""
+        with self.zip.open(self._sheet_path(sheet_name)) as f:
+            for event, el in ET.iterparse(f, events=("start",)):
+                if el.tag == _X + "dimension":
+                    m = _XLSX_DIMENSION_REF.search(el.get("ref", ""))
+                    return (int(m.group(2)), col2num(m.group(1))) if m else None
+                if el.tag == _X + "sheetData":
+                    return None
+        return None
+
+    def _cell_value(self, c):
+        t = c.get("t", "n")
+        if t == "inlineStr":
+            node = c.find(_X + "is")
+            return _xlsx_text(node) if node is not None else None
+        value = c.findtext(_X + "v") or None
+        if value is None and c.find(_X + "f") is not None:
+            self.uncached_formulas += 1
+        return self._typed_value(t, c.get("s"), value, c.get("r"))
+
+    def iter_cells(self, sheet_name=None):
+        """(satır_no, 0-tabanlı sütun, önbellek değeri, <f> öğesi veya None): sayfanın tüm dolu hücreleri.
+        Formül değerlendirici için; satırlar tam ayrıştırılır."""
+        path = self._sheet_path(sheet_name)
+        row_no = 0
+        for head, body in self._iter_row_chunks(path):
+            r = _XLSX_ROW_NUMBER.search(head)
+            row_no = int(r.group(1)) if r else row_no + 1
+            if body is None:
+                continue
+            row_el = ET.fromstring(f"<row {self._ns_decl}{head}>{body}</row>")
+            for col, c in self._index_cells(list(row_el), row_no, _X + "c").items():
+                yield row_no, col, self._cell_value(c), c.find(_X + "f")
+
+    def _typed_value(self, t, style, value, ref):
+        """<v> metnini hücre tipine göre çevirir (t: hücre tipi, style: s özniteliği)"""
+        if value is None:
+            return None
+        if t == "n":
+            if style and int(style) in self.date_styles:
+                raise NativeXlsxUnsupported(f"Tarih biçimli hücre: {ref}")
+            return _xlsx_cast_number(value)
+        if t == "s":
+            return self.shared_strings[int(value)]
+        if t == "b":
+            return bool(int(value))
+        if t in ("str", "e"):
+            return value
+        raise NativeXlsxUnsupported(f"Desteklenmeyen hücre tipi '{t}': {ref}")
+
+    def iter_rows(self, sheet_name=None, columns=None, min_row=2):
+        """(excel_satır_no, satır) üretir; ID (ilk sütun) boş satırlar atlanır.
+
+        columns: 0-tabanlı sütunlar (bkz. project_columns). None ise tüm sütunlar;
+        bu durumda openpyxl gibi <dimension> genişliği, o da yoksa satırdaki son
+        hücre kullanılır.
+
+        Sayfa XML'i parça parça açılır ve </row> sınırlarından bölünür; az sütun
+        istendiğinde sadece o hücreler (r="B12" referansıyla bulunup) XML olarak
+        çözülür, diğer hücreler hiç ayrıştırılmaz.
+        """
+        path = self._sheet_path(sheet_name)
+        dim = self.dimension(sheet_name)
+        if columns:
+            wanted = list(columns)
+        else:
+            wanted = list(range(dim[1])) if dim else None  # None: satır genişliği son hücre
+        max_row = dim[0] if dim else None
+        letters = [num2col(c + 1) for c in wanted] if wanted else []
+        per_cell = wanted is not None and len(wanted) <= self.PER_CELL_LIMIT
+
+        row_no = 0
+        for head, body in self._iter_row_chunks(path):
+            r = _XLSX_ROW_NUMBER.search(head)
+            row_no = int(r.group(1)) if r else row_no + 1
+            if max_row is not None and row_no > max_row:
+                return
+            if row_no < min_row or body is None:
+                continue
+            if per_cell and "<c>" not in body and body.count("<c ") == body.count('<c r="'):
+                values = self._cells_by_ref(body, wanted, letters, row_no)
+            else:
+                values = self._cells_by_parse(head, body, wanted, row_no)
+            if values[0]:
+                yield row_no, tuple(values)
+
+    PER_CELL_LIMIT = 16  # Daha fazla sütunda satırın tamamını ayrıştırmak daha ucuz
+
+    def _iter_row_chunks(self, path, chunk_size=1 << 20):
+        """<row> öğelerini (başlangıç etiketi, gövde) olarak üretir; gövde None ise boş satır (<row/>)"""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        buf = ""
+        in_data = False
+        with self.zip.open(path) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                buf += decoder.decode(chunk, final=not chunk)
+                if not in_data:
+                    pos = buf.find("<sheetData")
+                    if pos < 0:
+                        if not chunk:
+                            if ":sheetData" in buf:
+                                raise NativeXlsxUnsupported("Önekli (prefixed) sayfa XML'i")
+                            return
+                        continue
+                    end = buf.find(">", pos)
+                    if end < 0:
+                        continue
+                    self._ns_decl = self._namespace_declarations(buf[:pos])
+                    if buf[end - 1] == "/":
+                        return  # <sheetData/>: boş sayfa
+                    buf = buf[end + 1:]
+                    in_data = True
+                start = 0
+                while True:
+                    end = buf.find("</row>", start)
+                    if end < 0:
+                        break
+                    segment = buf[start:end]
+                    start = end + 6
+                    parts = segment.split("<row")
+                    for part in parts[1:-1]:
+                        yield part[:part.find(">")], None  # Araya giren kendiliğinden kapanan satırlar
+                    last = parts[-1]
+                    close = last.find(">")
+                    yield last[:close], last[close + 1:]
+                buf = buf[start:]
+                stop = buf.find("</sheetData>")
+                if stop >= 0 or not chunk:
+                    for part in buf[:stop if stop >= 0 else len(buf)].split("<row")[1:]:
+                        yield part[:part.find(">")], None
+                    return
+
+    @staticmethod
+    def _namespace_declarations(prolog):
+        """Kök öğedeki xmlns bildirimleri (parça parça ayrıştırılan hücrelere eklenir)"""
+        root_start = prolog.find("<worksheet")
+        if root_start < 0:
+            raise NativeXlsxUnsupported("Kök öğe <worksheet> değil")
+        root_tag = prolog[root_start:prolog.find(">", root_start)]
+        decls = " ".join(m.group(0) for m in _XLSX_NS_DECL.finditer(root_tag))
+        if f'xmlns="{_XLSX_MAIN_NS}"' not in decls:
+            raise NativeXlsxUnsupported("Desteklenmeyen sayfa şeması")
+        return decls
+
+    def _cells_by_ref(self, body, wanted, letters, row_no):
+        """Sadece istenen hücreleri r="<sütun><satır>" ile bulup çözer"""
+        values = [None] * len(wanted)
+        suffix = f'{row_no}"'
+        for k, letter in enumerate(letters):
+            pos = body.find(f'<c r="{letter}{suffix}')
+            if pos < 0:
+                continue  # Boş hücre
+            tag_end = body.find(">", pos)
+            if body[tag_end - 1] == "/":
+                continue  # <c r=".." s=".."/>: değer yok
+            end = body.find("</c>", tag_end)
+            inner = body[tag_end + 1:end]
+            if inner.startswith("<v>") and inner.endswith("</v>") and "<" not in inner[3:-4] and "&" not in inner:
+                # En yaygın biçim <c r=".." [s=".."] [t=".."]><v>..</v></c>: XML ayrıştırıcısı gerekmez
+                attrs = dict(_XLSX_CELL_ATTR.findall(body[pos:tag_end]))
+                values[k] = self._typed_value(attrs.get("t", "n"), attrs.get("s"), inner[3:-4] or None,
+                                              f"{letter}{row_no}")
+                continue
+            cell = ET.fromstring(f"<c {self._ns_decl}{body[pos + 2:end + 4]}")
+            values[k] = self._cell_value(cell)
+        return values
+
+    def _cells_by_parse(self, head, body, wanted, row_no):
+        """Satırın tamamını ayrıştırır (çok sütun, r'siz veya farklı öznitelik sıralı hücreler)"""
+        row_el = ET.fromstring(f"<row {self._ns_decl}{head}>{body}</row>")
+        cells = self._index_cells(list(row_el), row_no, _X + "c")
+        if wanted is None:
+            wanted = range(max(cells) + 1 if cells else 1)
+        values = [None] * len(wanted)
+        for k, col in enumerate(wanted):
+            c = cells.get(col)
+            if c is not None:
+                values[k] = self._cell_value(c)
+        return values
+
+    @staticmethod
+    def _index_cells(cells, row_no, c_tag):
+        """Boşluklu satırlar için sütun -> hücre (r özniteliği yoksa sıra sayılır)"""
+        index = {}
+        col = -1
+        for c in cells:
+            if c.tag != c_tag:
+                continue
+            ref = c.get("r")
+            if ref:
+                m = _XLSX_CELL_REF.match(ref)
+                col = col2num(m.group(1)) - 1
+            else:
+                col += 1
+            index[col] = c
+        return index
+
+def read_excel_native(file_path, sheet_name=None, columns=None):
+    """NativeXlsxReader ile read_excel_openpyxl'in aynısı: (data, sheets)"""
+    with NativeXlsxReader(file_path) as reader:
+        data = [row for _, row in reader.iter_rows(sheet_name, columns)]
+        return data, reader.sheetnames
+
+def probe_workbook(file_path):
+    """Kitabı yüklemeden meta veri: sadece xl/workbook.xml ve her sayfanın <dimension> öğesi okunur.
+
+    Döner: {"sheets": [isim], "active": isim, "dimensions": {isim: (max_row, max_col) veya None},
+    "ms": süre} ya da okunamıyorsa None (.xls, bozuk zip, strict OOXML...).
+    CSV/TSV/Parquet tek "sayfa" (dosya adı) olarak döner; boyut sadece Parquet'te
+    (dosya üst verisinden) bilinir.
+    """
+    start = time.perf_counter()
+    if is_tabular_file(file_path):
+        name = tabular_sheet_name(file_path)
+        dim = None
+        if file_path.lower().endswith(".parquet") and PYARROW_AVAILABLE:
+            try:
+                meta = pyarrow.parquet.read_metadata(file_path)
+                dim = (meta.num_rows + 1, meta.num_columns)
+            except (pyarrow.ArrowException, OSError) as e:
+                APP_LOGGER.info(f"Parquet üst verisi okunamadı: {e}")
+        return {"sheets": [name], "active": name, "dimensions": {name: dim},
+                "ms": (time.perf_counter() - start) * 1000}
+    if not file_path.lower().endswith((".xlsx", ".xlsm")):
+        return None
+    try:
+        with NativeXlsxReader(file_path) as reader:
+            dimensions = {}
+            for name, path in reader.sheets:
+                dimensions[name] = reader.dimension(name) if path else None
+            names = reader.sheetnames
+            active = names[reader.active_index] if 0 <= reader.active_index < len(names) else (names[0] if names else None)
+    except (NativeXlsxUnsupported, zipfile.BadZipFile, ET.ParseError, KeyError, OSError, ValueError) as e:
+        APP_LOGGER.info(f"Meta veri sondası kullanılamadı: {e}")
+        return None
+    elapsed = (time.perf_counter() - start) * 1000
+    APP_LOGGER.info(f"Meta veri sondası: {len(names)} sayfa, {elapsed:.1f} ms")
+    return {"sheets": names, "active": active, "dimensions": dimensions, "ms": elapsed}
+
+def read_excel_table(file_path, sheet_name=None, columns=None, native=True, report=None):
+    """Native okuyucuyu dener, desteklenmeyen içerikte openpyxl'e düşer.
+    Önbellek değeri olmayan formüller varsa FormulaEvaluator ile hesaplanır; özet report'a yazılır.
+    Döner: (excel_satır_numaraları, data, sheets)"""
+    if is_tabular_file(file_path):
+        return read_tabular(file_path, columns)
+    if native and file_path.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            with NativeXlsxReader(file_path) as reader:
+                numbered = list(reader.iter_rows(sheet_name, columns))
+                if reader.uncached_formulas:
+                    APP_LOGGER.info(f"{reader.uncached_formulas} formül hücresinin önbellek değeri yok, hesaplanıyor")
+                    evaluator = FormulaEvaluator(reader)
+                    numbered = list(evaluator.iter_rows(sheet_name, columns))
+                    summary = evaluator.summary()
+                    for key, value in summary.items():
+                        APP_LOGGER.info(f"{key}: {value}")
+                    if report is not None:
+                        report.update(summary)
+                return [n for n, _ in numbered], [row for _, row in numbered], reader.sheetnames
+        except (NativeXlsxUnsupported, zipfile.BadZipFile, ET.ParseError) as e:
+            APP_LOGGER.info(f"Native okuyucu kullanılamadı, openpyxl'e geçiliyor: {e}")
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+        numbered = list(_iter_sheet_rows(ws, columns))
+        return [n for n, _ in numbered], [row for _, row in numbered], wb.sheetnames
+    finally:
+        wb.close()
+
+def read_excel_fast(file_path, sheet_name=None, columns=None, native=True, report=None):
+    """Native okuyucuyu dener, desteklenmeyen içerikte openpyxl'e düşer. Döner: (data, sheets)"""
+    _, data, sheets = read_excel_table(file_path, sheet_name, columns, native, report)
+    return data, sheets
+
+def iter_excel_rows_fast(file_path, sheet_name=None, columns=None, native=True, report=None):
+    """iter_excel_rows_openpyxl'in native karşılığı. Native okuyucu akışın ortasında
+    desteklenmeyen bir hücreye rastlarsa openpyxl kalan satırlardan devam eder.
+    Akış bitince önbellek değeri olmayan formül sayısı report["uncached_formulas"]'a yazılır."""
+    if is_tabular_file(file_path):
+        yield from iter_tabular_rows(file_path, columns)
+        return
+    last_row = 1
+    total_sent = False
+    if native and file_path.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            with NativeXlsxReader(file_path) as reader:
+                dim = reader.dimension(sheet_name)
+                yield ("total", max(0, dim[0] - 1) if dim else 0)
+                total_sent = True
+                for row_no, row in reader.iter_rows(sheet_name, columns):
+                    yield ("row", row_no, row)
+                    last_row = row_no
+                if report is not None:
+                    report["uncached_formulas"] = reader.uncached_formulas
+                if reader.uncached_formulas:
+                    # Akışta bağımlılık sırası kurulamaz; bu hücreler boş (None) geçti
+                    APP_LOGGER.warning(f"Akışlı okuma formül hesaplamaz: {reader.uncached_formulas} "
+                                       f"formül hücresinin önbellek değeri yok (Excel'de kaydedip yeniden deneyin)")
+            return
+        except (NativeXlsxUnsupported, zipfile.BadZipFile, ET.ParseError) as e:
+            APP_LOGGER.info(f"Native okuyucu kullanılamadı (satır {last_row} sonrası openpyxl): {e}")
+    for item in iter_excel_rows_openpyxl(file_path, sheet_name, columns):
+        if item[0] == "total":
+            if not total_sent:
+                yield item
+        elif item[1] > last_row:
+            yield item
+
+# ==========================================
+# FORMÜL DEĞERLENDİRİCİ (önbellek değeri olmayan formüller)
+# ==========================================
+# Sadece formül yazıp Excel'de hiç hesaplanmamış (<v> içermeyen) kitaplar için:
+# dört işlem, başvurular (sayfalar arası dahil), SUM / MIN / MAX / IF / ROUND.
+_FORMULA_TOKEN = re.compile(r"""\s*(?:
+      (?P<str>"(?:[^"]|"")*")
+    | (?P<err>\#(?:NULL!|DIV/0!|VALUE!|REF!|NAME\?|NUM!|N/A))
+    | (?P<func>[A-Za-z_][\w.]*)\s*\(
+    | (?P<ref>(?:(?:'(?:[^']|'')+'|[^\W\d][\w.]*)!)?\$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?)(?![\w(!])
+    | (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<bool>TRUE|FALSE)(?![\w(])
+    | (?P<op><>|<=|>=|[-+*/^&=<>%(),])
+    | (?P<name>[^\W\d][\w.]*)
+    )""", re.VERBOSE | re.IGNORECASE)
+_FORMULA_CELL = re.compile(r"(\$?)([A-Za-z]{1,3})(\$?)(\d+)")
+_EXCEL_ERRORS = {"#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"}
+_COMPARE_OPS = {"=": operator.eq, "<>": operator.ne, "<": operator.lt,
+                ">": operator.gt, "<=": operator.le, ">=": operator.ge}
+
+class FormulaUnsupported(Exception):
+    """Değerlendiricinin bilmediği fonksiyon/sözdizimi; hücre #NAME? olur ve topluca raporlanır"""
+
+class ExcelError(str):
+    """Excel hata değeri (#DIV/0! gibi); işlemlerde yayılır"""
+
+def _tokenize_formula(text):
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = _FORMULA_TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise FormulaUnsupported("sözdizimi")
+        tokens.append((m.lastgroup, m.group(m.lastgroup)))
+        pos = m.end()
+    return tokens
+
+def shift_formula(text, d_row, d_col):
+    """Paylaşılan formülü (t="shared") ana hücreden d_row/d_col uzağa taşır; $'lı kısımlar sabit kalır"""
+    def shift_cell(m):
+        col_abs, col, row_abs, row = m.groups()
+        if not col_abs:
+            col = num2col(col2num(col.upper()) + d_col)
+        if not row_abs:
+            row = str(int(row) + d_row)
+        return f"{col_abs}{col}{row_abs}{row}"
+    parts = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = _FORMULA_TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise FormulaUnsupported("sözdizimi")
+        if m.lastgroup == "ref":
+            start = m.start("ref")
+            ref = m.group("ref")
+            bang = ref.rfind("!") + 1
+            parts.append(text[pos:start + bang] + _FORMULA_CELL.sub(shift_cell, ref[bang:]))
+        else:
+            parts.append(text[pos:m.end()])
+        pos = m.end()
+    return "".join(parts)
+
+class _FormulaParser:
+    """Excel önceliğiyle ifade ayrıştırıcı: karşılaştırma < & < +,- < *,/ < ^ < işaret < %.
+    Çıktı tuple AST: ("num", v) ("str", s) ("bool", b) ("err", e) ("ref", sayfa, r1, c1, r2, c2)
+    ("fn", AD, [argümanlar]) ("bin", op, a, b) ("neg", a) ("pct", a)"""
+    PRECEDENCE = {"=": 1, "<>": 1, "<": 1, ">": 1, "<=": 1, ">=": 1,
+                  "&": 2, "+": 3, "-": 3, "*": 4, "/": 4, "^": 5}
+
+    def __init__(self, text, functions):
+        self.tokens = _tokenize_formula(text)
+        self.pos = 0
+        self.functions = functions
+
+    def parse(self):
+        node = self.expression()
+        if self.pos != len(self.tokens):
+            raise FormulaUnsupported("sözdizimi")
+        return node
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take_op(self, ops):
+        kind, text = self.peek()
+        if kind == "op" and text in ops:
+            self.pos += 1
+            return text
+        return None
+
+    def expect(self, op):
+        if not self.take_op((op,)):
+            raise FormulaUnsupported("sözdizimi")
+
+    def expression(self, min_level=1):
+        """Öncelik tırmanma: tüm ikili işleçler (^ dahil, Excel'deki gibi) soldan birleşir"""
+        node = self.unary()
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            kind, op = tokens[self.pos]
+            level = self.PRECEDENCE.get(op) if kind == "op" else None
+            if level is None or level < min_level:
+                break
+            self.pos += 1
+            node = ("bin", op, node, self.expression(level + 1))
+        return node
+
+    def unary(self):
+        op = self.take_op(("+", "-"))
+        if op == "-":
+            return ("neg", self.unary())
+        if op == "+":
+            return self.unary()
+        node = self.primary()
+        while self.take_op(("%",)):
+            node = ("pct", node)
+        return node
+
+    def primary(self):
+        kind, text = self.peek()
+        self.pos += 1
+        if kind == "num":
+            return ("num", _xlsx_cast_number(text))
+        if kind == "str":
+            return ("str", text[1:-1].replace('""', '"'))
+        if kind == "bool":
+            return ("bool", text.upper() == "TRUE")
+        if kind == "err":
+            return ("err", ExcelError(text.upper()))
+        if kind == "ref":
+            return self.reference(text)
+        if kind == "func":
+            name = text.rstrip("( \t").upper()
+            if name.startswith("_XLFN."):
+                name = name[6:]
+            if name not in self.functions:
+                raise FormulaUnsupported(name)
+            args = []
+            if not self.take_op((")",)):
+                while True:
+                    if self.peek() in (("op", ","), ("op", ")")):
+                        args.append(("num", 0))  # Boş argüman: IF(A1;;1)
+                    else:
+                        args.append(self.expression())
+                    if self.take_op((")",)):
+                        break
+                    self.expect(",")
+            return ("fn", name, args)
+        if kind == "op" and text == "(":
+            node = self.expression()
+            self.expect(")")
+            return node
+        if kind == "name":
+            raise FormulaUnsupported(text)  # Tanımlı ad, tam sütun/satır aralığı vb.
+        raise FormulaUnsupported("sözdizimi")
+
+    @staticmethod
+    def reference(text):
+        sheet = None
+        if "!" in text:
+            sheet, text = text.rsplit("!", 1)
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+        cells = [_FORMULA_CELL.fullmatch(part).groups() for part in text.split(":")]
+        (_, c1, _, r1), (_, c2, _, r2) = cells[0], cells[-1]
+        r1, r2 = sorted((int(r1), int(r2)))
+        c1, c2 = sorted((col2num(c1.upper()) - 1, col2num(c2.upper()) - 1))
+        return ("ref", sheet, r1, c1, r2, c2)
+
+class FormulaEvaluator:
+    """NativeXlsxReader üzerinden, önbellek değeri olmayan formül hücrelerini hesaplar.
+
+    Sayfalar ilk başvuruda bir kez tam okunur. Hücreler bağımlılık sırasıyla (açık yığınlı
+    DFS, özyineleme yok) bir kez hesaplanıp saklanır; döngüyü kapatan başvuru boş (0)
+    okunur ve raporlanır. Desteklenmeyen fonksiyonlar hücreyi #NAME? yapar ve unsupported sayacında
+    toplanır. Önbellek değeri olan formüllere dokunulmaz.
+    """
+    FUNCTIONS = ("SUM", "MIN", "MAX", "IF", "ROUND")
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.sheet_names = {name.lower(): name for name, path in reader.sheets if path}
+        self._values = {}     # sayfa -> {(satır, sütun): değer}
+        self._formulas = {}   # sayfa -> {(satır, sütun): formül metni / AST / FormulaUnsupported}
+        self._by_col = {}     # sayfa -> {sütun: sıralı formül satırları} (aralık bağımlılıkları)
+        self._bounds = {}     # sayfa -> (son satır, son sütun)
+        self._memo = {}       # (sayfa, satır, sütun) -> hesaplanan değer
+        self.unsupported = {} # fonksiyon/sebep -> hücre sayısı
+        self.cycles = 0
+        self.elapsed = 0.0
+
+    # --- sayfa yükleme ---
+    def _sheet(self, name):
+        """Gerçek sayfa adı (büyük/küçük harf duyarsız); yoksa None"""
+        real = self.sheet_names.get(name.lower()) if name else None
+        if real is not None and real not in self._values:
+            self._load(real)
+        return real
+
+    def _load(self, sheet):
+        values, formulas, shared = {}, {}, {}
+        max_row = max_col = 0
+        for row, col, value, f in self.reader.iter_cells(sheet):
+            max_row, max_col = max(max_row, row), max(max_col, col)
+            if value is not None:
+                values[(row, col)] = ExcelError(value) if isinstance(value, str) and value in _EXCEL_ERRORS else value
+            if f is None:
+                continue
+            text = f.text or ""
+            if f.get("t") == "shared":
+                if text:
+                    shared[f.get("si")] = (text, row, col)
+                elif f.get("si") in shared:
+                    master, m_row, m_col = shared[f.get("si")]
+                    try:
+                        text = shift_formula(master, row - m_row, col - m_col)
+                    except FormulaUnsupported as e:
+                        text = e
+            elif f.get("t") == "dataTable":
+                text = FormulaUnsupported("veri tablosu")
+            if value is None and text:
+                if isinstance(text, FormulaUnsupported):
+                    self._note(str(text))
+                formulas[(row, col)] = text
+        by_col = {}
+        for row, col in sorted(formulas):
+            by_col.setdefault(col, []).append(row)
+        self._values[sheet] = values
+        self._formulas[sheet] = formulas
+        self._by_col[sheet] = by_col
+        self._bounds[sheet] = (max_row, max_col)
+
+    def _ast(self, sheet, row, col):
+        node = self._formulas[sheet][(row, col)]
+        if isinstance(node, str):
+            try:
+                node = _FormulaParser(node.lstrip("="), self.FUNCTIONS).parse()
+            except FormulaUnsupported as e:
+                node = e
+            except (ValueError, AttributeError):
+                node = FormulaUnsupported("sözdizimi")
+            if isinstance(node, FormulaUnsupported):
+                self._note(str(node))
+            self._formulas[sheet][(row, col)] = node
+        return node
+
+    def _note(self, reason):
+        self.unsupported[reason] = self.unsupported.get(reason, 0) + 1
+
+    # --- bağımlılık sırası ---
+    def _dependencies(self, key):
+        """Hücrenin başvurduğu, henüz hesaplanmamış formül hücreleri"""
+        sheet, row, col = key
+        node = self._ast(sheet, row, col)
+        if isinstance(node, FormulaUnsupported):
+            return
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if node[0] == "ref":
+                target = self._sheet(node[1]) if node[1] else sheet
+                if target is None:
+                    continue
+                _, _, r1, c1, r2, c2 = node
+                by_col = self._by_col[target]
+                for c in range(c1, c2 + 1):
+                    rows = by_col.get(c)
+                    if rows:
+                        for r in rows[bisect.bisect_left(rows, r1):bisect.bisect_right(rows, r2)]:
+                            yield (target, r, c)
+            elif node[0] == "fn":
+                pending.extend(node[2])
+            elif node[0] == "bin":
+                pending.extend(node[2:])
+            elif node[0] in ("neg", "pct"):
+                pending.append(node[1])
+
+    def evaluate(self, sheet, row, col):
+        """Tek hücrenin değeri (formülse bağımlılıklarıyla birlikte hesaplanır)"""
+        sheet = self._sheet(sheet)
+        key = (sheet, row, col)
+        if key in self._memo or (row, col) not in self._formulas.get(sheet, ()):
+            return self._cell(*key)
+        start = time.perf_counter()
+        stack = [(key, self._dependencies(key))]
+        visiting = {key}
+        while stack:
+            node, deps = stack[-1]
+            for dep in deps:
+                if dep in self._memo:
+                    continue
+                if dep in visiting:
+                    self.cycles += 1
+                    continue
+                visiting.add(dep)
+                stack.append((dep, self._dependencies(dep)))
+                break
+            else:
+                stack.pop()
+                visiting.discard(node)
+                self._memo[node] = self._compute(node)
+        self.elapsed += time.perf_counter() - start
+        return self._memo[key]
+
+    def _compute(self, key):
+        sheet, row, col = key
+        node = self._ast(sheet, row, col)
+        if isinstance(node, FormulaUnsupported):
+            return ExcelError("#NAME?")
+        value = self._eval(node, sheet)
+        if isinstance(value, list):
+            value = ExcelError("#VALUE!")  # Tek hücreye aralık (dizi) sonucu
+        elif value is None:
+            value = 0
+        return value
+
+    def _cell(self, sheet, row, col):
+        key = (sheet, row, col)
+        if key in self._memo:
+            return self._memo[key]
+        return self._values[sheet].get((row, col))
+
+    # --- ifade değerlendirme ---
+    def _eval(self, node, sheet):
+        kind = node[0]
+        if kind in ("num", "str", "bool", "err"):
+            return node[1]
+        if kind == "ref":
+            target = self._sheet(node[1]) if node[1] else sheet
+            if target is None:
+                return ExcelError("#REF!")
+            _, _, r1, c1, r2, c2 = node
+            if (r1, c1) == (r2, c2):
+                return self._cell(target, r1, c1)
+            max_row, max_col = self._bounds[target]
+            return [self._cell(target, r, c)
+                    for r in range(r1, min(r2, max_row) + 1) for c in range(c1, min(c2, max_col) + 1)]
+        if kind == "neg":
+            value = self._number(self._scalar(self._eval(node[1], sheet)))
+            return value if isinstance(value, ExcelError) else -value
+        if kind == "pct":
+            value = self._number(self._scalar(self._eval(node[1], sheet)))
+            return value if isinstance(value, ExcelError) else value / 100
+        if kind == "bin":
+            return self._binary(node[1], self._scalar(self._eval(node[2], sheet)),
+                                self._scalar(self._eval(node[3], sheet)))
+        return getattr(self, "_fn_" + node[1].lower())(node[2], sheet)
+
+    @staticmethod
+    def _scalar(value):
+        return ExcelError("#VALUE!") if isinstance(value, list) else value
+
+    @staticmethod
+    def _number(value):
+        if isinstance(value, ExcelError):
+            return value
+        if value is None:
+            return 0
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            return _xlsx_cast_number(value.strip())
+        except ValueError:
+            return ExcelError("#VALUE!")
+
+    @staticmethod
+    def _text(value):
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, float):
+            return str(int(value)) if value.is_integer() else format(value, ".15g")
+        return str(value)
+
+    def _binary(self, op, left, right):
+        for value in (left, right):
+            if isinstance(value, ExcelError):
+                return value
+        if op == "&":
+            return self._text(left) + self._text(right)
+        if op in _COMPARE_OPS:
+            return _COMPARE_OPS[op](self._order(left, right), self._order(right, left))
+        left, right = self._number(left), self._number(right)
+        for value in (left, right):
+            if isinstance(value, ExcelError):
+                return value
+        try:
+            if op == "+":
+                return left + right
+            if op == "-":
+                return left - right
+            if op == "*":
+                return left * right
+            if op == "/":
+                return ExcelError("#DIV/0!") if right == 0 else left / right
+            if left == 0 and right < 0:
+                return ExcelError("#DIV/0!")
+            result = left ** right
+            return ExcelError("#NUM!") if isinstance(result, complex) else result
+        except OverflowError:
+            return ExcelError("#NUM!")
+
+    @staticmethod
+    def _order(value, other):
+        """Karşılaştırma anahtarı: sayı < metin < mantıksal; boş hücre karşısındakinin tipinde boş"""
+        if value is None:
+            value = "" if isinstance(other, str) else (False if isinstance(other, bool) else 0)
+        if isinstance(value, bool):
+            return (2, value)
+        if isinstance(value, str):
+            return (1, value.lower())
+        return (0, value)
+
+    def _numbers(self, args, sheet):
+        """SUM/MIN/MAX argümanları: aralıktaki metin/mantıksal/boş atlanır, doğrudan değerler çevrilir"""
+        values = []
+        for arg in args:
+            value = self._eval(arg, sheet)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ExcelError):
+                        return item
+                    if isinstance(item, (int, float)) and not isinstance(item, bool):
+                        values.append(item)
+                continue
+            if arg[0] == "ref" and (isinstance(value, bool) or not isinstance(value, (int, float, ExcelError))):
+                continue  # Tek hücre başvurusu da aralık gibi davranır
+            value = self._number(value)
+            if isinstance(value, ExcelError):
+                return value
+            values.append(value)
+        return values
+
+    def _fn_sum(self, args, sheet):
+        values = self._numbers(args, sheet)
+        return values if isinstance(values, ExcelError) else sum(values)
+
+    def _fn_min(self, args, sheet):
+        values = self._numbers(args, sheet)
+        return values if isinstance(values, ExcelError) else min(values, default=0)
+
+    def _fn_max(self, args, sheet):
+        values = self._numbers(args, sheet)
+        return values if isinstance(values, ExcelError) else max(values, default=0)
+
+    def _fn_if(self, args, sheet):
+        if not 1 < len(args) < 4:
+            return ExcelError("#VALUE!")
+        cond = self._scalar(self._eval(args[0], sheet))
+        if isinstance(cond, str) and not isinstance(cond, ExcelError):
+            if cond.upper() not in ("TRUE", "FALSE"):
+                return ExcelError("#VALUE!")
+            cond = cond.upper() == "TRUE"
+        cond = self._number(cond)
+        if isinstance(cond, ExcelError):
+            return cond
+        if cond:
+            return self._eval(args[1], sheet)
+        return self._eval(args[2], sheet) if len(args) == 3 else False
+
+    def _fn_round(self, args, sheet):
+        if len(args) != 2:
+            return ExcelError("#VALUE!")
+        value, digits = (self._number(self._scalar(self._eval(a, sheet))) for a in args)
+        for v in (value, digits):
+            if isinstance(v, ExcelError):
+                return v
+        # Excel ROUND: yarım değerler sıfırdan uzağa (Python round() bankacı yuvarlaması yapar)
+        exp = decimal.Decimal(1).scaleb(-int(digits))
+        try:
+            return float(decimal.Decimal(repr(value)).quantize(exp, rounding=decimal.ROUND_HALF_UP))
+        except decimal.InvalidOperation:
+            return value  # float'ın taşıdığından fazla basamak: değer zaten yuvarlı
+
+    # --- çıktı ---
+    def iter_rows(self, sheet_name=None, columns=None, min_row=2):
+        """NativeXlsxReader.iter_rows ile aynı satırlar, formüller hesaplanmış olarak"""
+        if not sheet_name:
+            sheet_name = self.reader.sheetnames[self.reader.active_index]
+        sheet = self._sheet(sheet_name)
+        values, formulas = self._values[sheet], self._formulas[sheet]
+        dim = self.reader.dimension(sheet)
+        last_row = dim[0] if dim else self._bounds[sheet][0]
+        rows = {}
+        for row, col in list(values) + list(formulas):
+            if min_row <= row <= last_row:
+                rows.setdefault(row, set()).add(col)
+        for row in sorted(rows):
+            if columns:
+                wanted = columns
+            else:
+                wanted = range(dim[1] if dim else max(rows[row]) + 1)
+            out = []
+            for col in wanted:
+                if (row, col) in formulas:
+                    out.append(self._output(self.evaluate(sheet, row, col)))
+                else:
+                    value = values.get((row, col))
+                    out.append(str(value) if isinstance(value, ExcelError) else value)
+            if out[0]:
+                yield row, tuple(out)
+
+    @staticmethod
+    def _output(value):
+        """Hesaplanan değeri okuyucu çıktısına çevirir (tam sayı değerli float -> int, hata -> metin)"""
+        if isinstance(value, ExcelError):
+            return str(value)
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    def summary(self):
+        computed = len(self._memo)
+        report = {"Formüller": f"{computed} formül hücresi hesaplandı ({self.elapsed * 1000:.0f} ms)"}
+        problems = dict(self.unsupported)
+        if self.cycles:
+            problems["döngüsel başvuru"] = self.cycles
+        if problems:
+            report["Desteklenmeyen Formüller"] = ", ".join(
+                f"{name} ×{count}" for name, count in sorted(problems.items(), key=lambda kv: -kv[1]))
+        return report
+
+# ==========================================
+# DÜZ TABLO GİRİŞİ (CSV / TSV / Parquet)
+# ==========================================
+TABULAR_EXTENSIONS = (".csv", ".tsv", ".parquet")
+_CSV_INT = re.compile(r"[+-]?\d+$")
+_CSV_FLOAT = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+# Toplu çevrimde izinli karakterler: bu kümede int()/float() sadece yukarıdaki biçimleri
+# kabul eder ("nan", "inf", "1_000", boşluk ve ASCII dışı rakamlar kümede yok)
+_CSV_INT_CHARS = b"0123456789+-\n"
+_CSV_FLOAT_CHARS = b"0123456789+-.eE\n"
+
+def is_tabular_file(file_path):
+    return file_path.lower().endswith(TABULAR_EXTENSIONS)
+
+def tabular_sheet_name(file_path):
+    """CSV/Parquet'te sayfa yok; sayfa listesinde dosya adı gösterilir"""
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+def sniff_csv(file_path):
+    """(encoding, ayraç, ondalık_virgül)
+
+    UTF-8 (BOM'lu veya BOM'suz) çözülemiyorsa cp1254. .tsv sekme ile ayrılır; .csv için
+    başlık satırında en sık geçen , ; | veya sekme seçilir. Ayraç ';' ise ondalık
+    ayırıcı virgüldür (Türkçe Excel/çözücü dışa aktarımları).
+    """
+    with open(file_path, "rb") as f:
+        sample = f.read(64 * 1024)
+    try:
+        text = codecs.getincrementaldecoder("utf-8-sig")().decode(sample, final=False)
+        encoding = "utf-8-sig"
+    except UnicodeDecodeError:
+        encoding = "cp1254"
+        text = sample.decode(encoding, errors="replace")
+    if file_path.lower().endswith(".tsv"):
+        delimiter = "\t"
+    else:
+        header = text.split("\n", 1)[0]
+        delimiter = max(",;\t|", key=header.count)
+    return encoding, delimiter, delimiter == ";"
+
+def _csv_cast(text, decimal_comma=False):
+    """Metin hücreyi openpyxl'in vereceği tipe çevirir: boş -> None, tamsayı, ondalık, diğerleri metin"""
+    if text is None or text == "":
+        return None
+    value = text.strip()
+    if decimal_comma and value.count(",") == 1:
+        value = value.replace(",", ".")
+    if _CSV_INT.match(value):
+        return int(value)
+    if _CSV_FLOAT.match(value):
+        return float(value)
+    return text
+
+def _cast_column(values, decimal_comma=False):
+    """Sütunu toplu çevirir: tüm sütun _csv_cast'in kabul ettiği sayı biçimindeyse tek
+    int/float map'i (C döngüsü), olmazsa hücre hücre. int()/float() tek başına "nan",
+    "inf", "1_000" gibi metinleri de kabul eder; sütun önce aynı biçimle süzülür."""
+    try:
+        text = "\n".join(values).encode("ascii")
+    except (TypeError, UnicodeEncodeError):
+        text = None  # Kısa kayıtlardan gelen None veya ASCII dışı metin: hücre hücre
+    if text is not None:
+        for allowed, convert in ((_CSV_INT_CHARS, int), (_CSV_FLOAT_CHARS, float)):
+            if not text.translate(None, allowed):
+                try:
+                    return list(map(convert, values))
+                except ValueError:
+                    pass  # Boş hücre, "1.2.3", hücre içi satır sonu...
+    return [_csv_cast(v, decimal_comma) for v in values]
+
+def _pick_columns(records, columns):
+    """Kayıtlardan istenen sütunlar (kısa kayıtlarda eksikler None)"""
+    if columns is None:
+        columns = range(max((len(r) for r in records), default=0))
+    if not columns:
+        return []
+    need = max(columns) + 1
+    pick = operator.itemgetter(*columns) if len(columns) > 1 else (lambda r: (r[columns[0]],))
+    return [pick(r) if len(r) >= need else tuple(r[c] if c < len(r) else None for c in columns)
+            for r in records]
+
+def _records_to_rows(records, columns, decimal_comma, first_row_no):
+    """Metin kayıtlarını sütun sütun çevirip (satır_no, satır) listesine dönüştürür; ID boş satırlar atlanır.
+    ID sütunu (ilk sütun) metin kalır: "001" ile "1" farklı parametre adlarıdır."""
+    picked = _pick_columns(records, columns)
+    if not picked:
+        return []
+    id_column, *value_columns = zip(*picked)
+    cast = [id_column] + [_cast_column(col, decimal_comma) for col in value_columns]
+    return [(first_row_no + i, row) for i, row in enumerate(zip(*cast)) if row[0]]
+
+def count_csv_records(file_path):
+    """Satır sonu sayısı (başlık hariç); tırnak içi satır sonu yoksa kayıt sayısına eşittir"""
+    lines = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    return max(0, lines - 1)
+
+def _read_csv_arrow(file_path, columns, encoding, delimiter, decimal_comma):
+    """pyarrow.csv ile sütunlu okuma; sütunlar numaralarıyla seçilir (başlık isimlerinden bağımsız)"""
+    with open(file_path, newline="", encoding=encoding) as f:
+        header = next(csv.reader(f, delimiter=delimiter), [])
+    width = len(header)
+    wanted = list(columns) if columns else list(range(width))
+    if not wanted or wanted[-1] >= width:
+        raise ValueError("İstenen sütun başlıktan geniş")
+    names = [f"c{i}" for i in range(width)]
+    table = pyarrow.csv.read_csv(
+        file_path,
+        read_options=pyarrow.csv.ReadOptions(encoding="utf8" if encoding == "utf-8-sig" else encoding,
+                                             column_names=names, skip_rows=1),
+        parse_options=pyarrow.csv.ParseOptions(delimiter=delimiter, ignore_empty_lines=False),
+        convert_options=pyarrow.csv.ConvertOptions(include_columns=[names[c] for c in wanted],
+                                                   column_types={names[wanted[0]]: pyarrow.string()},
+                                                   null_values=[""], strings_can_be_null=True,
+                                                   decimal_point="," if decimal_comma else "."))
+    cols = [table.column(names[c]).to_pylist() for c in wanted]
+    return [(i + 2, row) for i, row in enumerate(zip(*cols)) if row[0]]
+
+def iter_tabular_rows(file_path, columns=None, chunk_rows=5000):
+    """iter_excel_rows_fast karşılığı: ("total", n), sonra ("row", satır_no, satır).
+    Satır numarası başlık 1 olmak üzere kayıt sırasıdır. Bellek chunk_rows ile sınırlı."""
+    if file_path.lower().endswith(".parquet"):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet için pyarrow gerekli: 'pip install pyarrow'")
+        pf = pyarrow.parquet.ParquetFile(file_path)
+        names = pf.schema_arrow.names
+        wanted = list(columns) if columns else list(range(len(names)))
+        present = [c for c in wanted if c < len(names)]
+        yield ("total", pf.metadata.num_rows)
+        row_no = 2
+        for batch in pf.iter_batches(batch_size=chunk_rows, columns=[names[c] for c in present]):
+            by_col = dict(zip(present, (col.to_pylist() for col in batch.columns)))
+            cols = [by_col.get(c, [None] * batch.num_rows) for c in wanted]
+            for i, row in enumerate(zip(*cols)):
+                if row[0]:
+                    yield ("row", row_no + i, row)
+            row_no += batch.num_rows
+        return
+    encoding, delimiter, decimal_comma = sniff_csv(file_path)
+    yield ("total", count_csv_records(file_path))
+    with open(file_path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        next(reader, None)
+        row_no = 2
+        while True:
+            records = [r for _, r in zip(range(chunk_rows), reader)]
+            if not records:
+                return
+            for item in _records_to_rows(records, columns, decimal_comma, row_no):
+                yield ("row",) + item
+            row_no += len(records)
+
+def read_tabular(file_path, columns=None):
+    """read_excel_table karşılığı: (satır_numaraları, data, sheets). CSV'de pyarrow varsa
+    onunla, yoksa csv modülü + sütun sütun tip çevirimiyle okunur."""
+    if not file_path.lower().endswith(".parquet") and PYARROW_AVAILABLE:
+        encoding, delimiter, decimal_comma = sniff_csv(file_path)
+        try:
+            numbered = _read_csv_arrow(file_path, columns, encoding, delimiter, decimal_comma)
+            return [n for n, _ in numbered], [row for _, row in numbered], [tabular_sheet_name(file_path)]
+        except (pyarrow.ArrowInvalid, ValueError, UnicodeDecodeError) as e:
+            APP_LOGGER.info(f"pyarrow CSV okuyamadı, csv modülüne geçiliyor: {e}")
+    numbered = [item[1:] for item in iter_tabular_rows(file_path, columns, chunk_rows=50000) if item[0] == "row"]
+    return [n for n, _ in numbered], [row for _, row in numbered], [tabular_sheet_name(file_path)]
+
+def read_tabular_preview(file_path, max_rows=10):
+    """read_excel_preview_openpyxl karşılığı: başlık dahil ilk N satır (liste), sheets"""
+    if file_path.lower().endswith(".parquet"):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet için pyarrow gerekli: 'pip install pyarrow'")
+        pf = pyarrow.parquet.ParquetFile(file_path)
+        rows = [list(pf.schema_arrow.names)]
+        batch = next(pf.iter_batches(batch_size=max(1, max_rows - 1)), None)
+        if batch is not None:
+            cols = [c.to_pylist() for c in batch.columns]
+            rows.extend(list(r) for r in zip(*cols))
+        rows = rows[:max_rows]
+    else:
+        encoding, delimiter, decimal_comma = sniff_csv(file_path)
+        with open(file_path, newline="", encoding=encoding) as f:
+            records = [r for _, r in zip(range(max_rows), csv.reader(f, delimiter=delimiter))]
+        rows = [[_csv_cast(v, decimal_comma) for v in r] for r in records]
+    for r in rows:
+        while r and r[-1] is None:
+            r.pop()
+    width = max((len(r) for r in rows), default=0) or 1
+    return [r + [None] * (width - len(r)) for r in rows], [tabular_sheet_name(file_path)]
+
+# ==========================================
+# SÜTUNLU ÖNBELLEK (Cache/)
+# ==========================================
+CACHE_DIR = "Cache"
+CACHE_FORMAT_VERSION = 1
+_CACHE_MAGIC = b"S2DC"
+_CACHE_LOCK = threading.Lock()
+
+def _cache_tag(value):
+    """Karışık sütunlar için JSON'a uygun etiketli değer"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return {"b": value}
+    if isinstance(value, int):
+        return {"i": value}
+    if isinstance(value, float):
+        return {"f": value}
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"t": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"td": value.total_seconds()}
+    raise TypeError(f"Önbelleğe alınamayan tip: {type(value).__name__}")
+
+def _cache_untag(value):
+    if not isinstance(value, dict):
+        return value
+    (kind, raw), = value.items()
+    if kind in ("b", "i", "f"):
+        return raw
+    if kind == "dt":
+        return datetime.datetime.fromisoformat(raw)
+    if kind == "d":
+        return datetime.date.fromisoformat(raw)
+    if kind == "t":
+        return datetime.time.fromisoformat(raw)
+    return datetime.timedelta(seconds=raw)
+
+def encode_column(values):
+    """Bir sütunu ikili kodlar. Döner: (tip_kodu, bytes)
+
+    n: tamamen boş, f: float, i: int64, m: int/float karışık sayı (float + int maskesi),
+    b: bool, s: metin (NUL ile ayrılmış UTF-8; XML metni NUL içeremez), o: karışık (etiketli JSON). Sayısal/bool/metin tiplerinde önce boş (None) maskesi gelir.
+    """
+    present = [v for v in values if v is not None]
+    if not present:
+        return "n", b""
+    nulls = bytes(v is None for v in values) if len(present) != len(values) else b""
+    types = {type(v) for v in present}
+    if types == {float}:
+        return "f", nulls + array.array("d", [0.0 if v is None else v for v in values]).tobytes()
+    if types == {int} and all(-2 ** 63 <= v < 2 ** 63 for v in present):
+        return "i", nulls + array.array("q", [0 if v is None else v for v in values]).tobytes()
+    if types == {int, float} and all(type(v) is float or abs(v) < 2 ** 53 for v in present):
+        ints = bytes(type(v) is int for v in values)
+        return "m", nulls + ints + array.array("d", [0.0 if v is None else v for v in values]).tobytes()
+    if types == {bool}:
+        return "b", nulls + bytes(bool(v) for v in values)
+    if types == {str} and not any("\x00" in v for v in present):
+        return "s", nulls + "\x00".join("" if v is None else v for v in values).encode("utf-8")
+    return "o", json.dumps([_cache_tag(v) for v in values], ensure_ascii=False).encode("utf-8")
+
+def decode_column(code, payload, count, has_nulls):
+    """encode_column'un tersi: değer listesi"""
+    if code == "n":
+        return [None] * count
+    if code == "o":
+        return [_cache_untag(v) for v in json.loads(payload.decode("utf-8"))]
+    nulls = payload[:count] if has_nulls else b""
+    body = payload[len(nulls):]
+    if code in ("f", "i"):
+        values = array.array("d" if code == "f" else "q")
+        values.frombytes(body)
+        values = values.tolist()
+    elif code == "m":
+        ints = body[:count]
+        values = array.array("d")
+        values.frombytes(body[count:])
+        values = [int(v) if is_int else v for v, is_int in zip(values, ints)]
+    elif code == "b":
+        values = [bool(b) for b in body]
+    else:
+        values = body.decode("utf-8").split("\x00")
+    if nulls:
+        values = [None if null else v for v, null in zip(values, nulls)]
+    return values
+
+def encode_table(row_numbers, rows, meta):
+    """Satır listesini sütunlu ikili formata çevirir"""
+    width = max((len(r) for r in rows), default=0)
+    columns = list(zip(*[tuple(r) + (None,) * (width - len(r)) for r in rows])) if rows else []
+    payloads = []
+    col_meta = []
+    for col in columns:
+        code, payload = encode_column(col)
+        col_meta.append([code, len(payload), any(v is None for v in col)])
+        payloads.append(payload)
+    numbers = array.array("I", row_numbers).tobytes()
+    header = json.dumps({"rows": len(rows), "width": width, "byteorder": sys.byteorder,
+                         "columns": col_meta, "meta": meta}, ensure_ascii=False).encode("utf-8")
+    return b"".join([_CACHE_MAGIC, struct.pack("<HI", CACHE_FORMAT_VERSION, len(header)), header, numbers] + payloads)
+
+def decode_table(blob):
+    """Döner: (row_numbers, rows, meta) - format/sürüm uyuşmazsa ValueError"""
+    if blob[:4] != _CACHE_MAGIC:
+        raise ValueError("Önbellek dosyası değil")
+    version, header_len = struct.unpack_from("<HI", blob, 4)
+    if version != CACHE_FORMAT_VERSION:
+        raise ValueError(f"Önbellek sürümü uyumsuz: {version}")
+    pos = 4 + struct.calcsize("<HI")
+    header = json.loads(blob[pos:pos + header_len].decode("utf-8"))
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError("Önbellek bayt sırası farklı")
+    pos += header_len
+    count = header["rows"]
+    numbers = array.array("I")
+    numbers.frombytes(blob[pos:pos + 4 * count])
+    pos += 4 * count
+    columns = []
+    for code, length, has_nulls in header["columns"]:
+        columns.append(decode_column(code, blob[pos:pos + length], count, has_nulls))
+        pos += length
+    rows = list(zip(*columns)) if columns else [()] * count
+    return numbers.tolist(), rows, header["meta"]
+
+class ColumnarCache:
+    """Ayrıştırılmış sayfaları içerik adresli, sütunlu ikili dosyalar olarak saklar.
+
+    Anahtar: dosya içeriğinin SHA-256'sı + sayfa + sütunlar + tür. (yol, boyut, mtime)
+    üçlüsü içerik hash'ine bir indeksle eşlenir; dosya değişmediyse tekrar hash'lenmez.
+    Toplam boyut max_bytes'ı aşarsa en uzun süre kullanılmayan girişler silinir (LRU,
+    dosya mtime'ı son kullanım zamanıdır).
+    """
+    INDEX_NAME = "stat_index.json"
+    INDEX_LIMIT = 500
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.last_status = None  # Results için: "isabet (12 ms)" / "ıska"
+
+    @classmethod
+    def from_config(cls, config):
+        if not config.get("excel_cache", True):
+            return None
+        return cls(max_bytes=int(config.get("cache_max_mb", 256)) * 1024 * 1024)
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, self.INDEX_NAME)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def content_hash(self, file_path):
+        """(yol, boyut, mtime) indeksten; değiştiyse dosya hash'lenir"""
+        st = os.stat(file_path)
+        stat_key = f"{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}"
+        with _CACHE_LOCK:
+            index = self._load_index()
+            digest = index.get(stat_key)
+        if digest:
+            return digest
+        h = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with _CACHE_LOCK:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            index = self._load_index()
+            index[stat_key] = digest
+            if len(index) > self.INDEX_LIMIT:
+                index = dict(list(index.items())[-self.INDEX_LIMIT:])
+            self._atomic_write(self._index_path(), json.dumps(index).encode("utf-8"))
+        return digest
+
+    def entry_path(self, file_path, kind, sheet_name, columns):
+        key = json.dumps([self.content_hash(file_path), kind, sheet_name or "", columns, CACHE_FORMAT_VERSION])
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + ".s2dc")
+
+    def load(self, file_path, kind, sheet_name=None, columns=None):
+        """Döner: (row_numbers, rows, meta) veya None"""
+        t0 = time.perf_counter()
+        name = os.path.basename(file_path)
+        try:
+            path = self.entry_path(file_path, kind, sheet_name, columns)
+            with open(path, "rb") as f:
+                table = decode_table(f.read())
+            os.utime(path)  # LRU: son kullanım
+        except FileNotFoundError:
+            self.last_status = "ıska"
+            APP_LOGGER.info(f"Önbellek ıska: {name} [{kind}, {sheet_name or 'aktif sayfa'}]")
+            return None
+        except Exception as e:
+            self.last_status = "ıska (okunamadı)"
+            APP_LOGGER.warning(f"Önbellek girişi okunamadı, yeniden ayrıştırılacak: {e}")
+            return None
+        elapsed = (time.perf_counter() - t0) * 1000
+        self.last_status = f"isabet ({elapsed:.0f} ms)"
+        APP_LOGGER.info(f"Önbellek isabet: {name} [{kind}, {sheet_name or 'aktif sayfa'}] "
+                        f"{len(table[1])} satır, {elapsed:.0f} ms")
+        return table
+
+    def store(self, file_path, kind, sheet_name, columns, row_numbers, rows, meta=None):
+        try:
+            blob = encode_table(row_numbers, rows, meta or {})
+        except Exception as e:
+            APP_LOGGER.warning(f"Önbelleğe yazılamadı: {e}")
+            return
+        self.store_blob(file_path, kind, sheet_name, columns, blob)
+
+    def store_blob(self, file_path, kind, sheet_name, columns, blob):
+        """Hazır encode_table çıktısını yazar (paralel ayrıştırmada tekrar kodlanmaz)"""
+        try:
+            path = self.entry_path(file_path, kind, sheet_name, columns)
+            with _CACHE_LOCK:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._atomic_write(path, blob)
+                self._evict()
+            APP_LOGGER.info(f"Önbelleğe yazıldı: {os.path.basename(file_path)} [{kind}] {len(blob) / 1024:.0f} KB")
+        except Exception as e:
+            APP_LOGGER.warning(f"Önbelleğe yazılamadı: {e}")
+
+    @staticmethod
+    def _atomic_write(path, blob):
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".s2dc"):
+                path = os.path.join(self.cache_dir, name)
+                st = os.stat(path)
+                entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            APP_LOGGER.info(f"Önbellekten çıkarıldı (LRU): {os.path.basename(path)}")
+
+# ==========================================
+# SATIR İNDEKSİ (kısmi çalıştırma)
+# ==========================================
+_ROW_INDEX_MAGIC = b"S2DX"
+ROW_INDEX_VERSION = 2  # 2: önbellek değeri olmayan formüller hesaplanarak kaydedilir
+_ID_SEPARATORS = re.compile(r"[,;\s]+")
+
+def parse_row_range(text):
+    """"4000-4200", "4000-", "-4200" veya "4000" -> (ilk, son) Excel satırları (dahil); boşsa None.
+    Geçersiz girişte ValueError"""
+    text = (text or "").strip()
+    if not text:
+        return None
+    first, sep, last = text.partition("-")
+    first = int(first) if first.strip() else 1
+    last = int(last) if last.strip() else (None if sep else first)
+    if first < 1 or (last is not None and last < first):
+        raise ValueError(f"Geçersiz satır aralığı: {text}")
+    return first, last
+
+def parse_id_list(text):
+    """Virgül, noktalı virgül, boşluk veya satır sonuyla ayrılmış ID'ler (sıra korunur, tekrarlar atılır)"""
+    return list(dict.fromkeys(part for part in _ID_SEPARATORS.split(text or "") if part))
+
+class RowIndex:
+    """Sayfanın projeksiyonlu satırlarını satır numarası ve ID ile doğrudan okunabilir
+    biçimde tutan disk dosyası. ColumnarCache ile aynı anahtar şemasını ve LRU'yu
+    paylaşır (tür: "rowidx"), ilk kısmi çalıştırmada tam okumadan bir kez kurulur.
+
+    Düzen: S2DX | sürüm, başlık uzunluğu | JSON başlık | satır_no[n] (uint32, artan) |
+    kayıt ofsetleri[n+1] (uint64) | ID anahtarları[n] (uint64, sıralı: crc32(ID) << 32 | konum) |
+    kayıtlar (satır başına etiketli JSON). Dosya mmap ile açılır; satır aralığı ve ID'ler
+    ikili aramayla bulunur, sadece eşleşen kayıtlar çözülür.
+    """
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        try:
+            self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise
+        try:
+            self._read_layout()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_layout(self):
+        mm = self.mm
+        if mm[:4] != _ROW_INDEX_MAGIC:
+            raise ValueError("Satır indeksi dosyası değil")
+        version, header_len = struct.unpack_from("<HI", mm, 4)
+        if version != ROW_INDEX_VERSION:
+            raise ValueError(f"Satır indeksi sürümü uyumsuz: {version}")
+        pos = 4 + struct.calcsize("<HI")
+        header = json.loads(mm[pos:pos + header_len].decode("utf-8"))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("Satır indeksi bayt sırası farklı")
+        pos += header_len
+        n = self.count = header["rows"]
+        view = memoryview(mm)
+        self._views = [view]
+        self.row_numbers = self._cast(view, pos, n, "I")
+        pos += 4 * n
+        self.offsets = self._cast(view, pos, n + 1, "Q")
+        pos += 8 * (n + 1)
+        self.id_keys = self._cast(view, pos, n, "Q")
+        self.records_start = pos + 8 * n
+
+    def _cast(self, view, pos, count, fmt):
+        part = view[pos:pos + count * struct.calcsize(fmt)].cast(fmt)
+        self._views.append(part)
+        return part
+
+    def close(self):
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self.mm.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @staticmethod
+    def _id_hash(id_str):
+        return zlib.crc32(id_str.encode("utf-8"))
+
+    @classmethod
+    def build(cls, path, items):
+        """items: iter_excel_rows_* akışı (("total", n) / ("row", satır_no, satır)). Kayıtlar
+        geçici dosyaya akıtılır; bellekte satır başına sadece numara, ofset ve ID anahtarı
+        kalır. Döner: satır sayısı"""
+        numbers = array.array("I")
+        offsets = array.array("Q", [0])
+        keys = array.array("Q")
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        records_tmp = tmp + ".rec"
+        try:
+            with open(records_tmp, "wb") as rec:
+                for item in items:
+                    if item[0] != "row":
+                        continue
+                    _, row_no, row = item
+                    blob = json.dumps([_cache_tag(v) for v in row], ensure_ascii=False).encode("utf-8")
+                    rec.write(blob)
+                    keys.append(cls._id_hash(format_row_id(row[0])) << 32 | len(numbers))
+                    numbers.append(row_no)
+                    offsets.append(offsets[-1] + len(blob))
+            keys = array.array("Q", sorted(keys))
+            header = json.dumps({"rows": len(numbers), "byteorder": sys.byteorder}).encode("utf-8")
+            with open(tmp, "wb") as f:
+                f.write(_ROW_INDEX_MAGIC + struct.pack("<HI", ROW_INDEX_VERSION, len(header)) + header)
+                for part in (numbers, offsets, keys):
+                    f.write(part.tobytes())
+                with open(records_tmp, "rb") as rec:
+                    shutil.copyfileobj(rec, f, 1 << 20)
+            os.replace(tmp, path)
+        finally:
+            for leftover in (tmp, records_tmp):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+        return len(numbers)
+
+    def positions_in_range(self, first, last=None):
+        """Excel satırı first..last (dahil) aralığındaki kayıtların konumları"""
+        lo = bisect.bisect_left(self.row_numbers, first)
+        hi = self.count if last is None else bisect.bisect_right(self.row_numbers, last)
+        return range(lo, max(lo, hi))
+
+    def positions_for_ids(self, ids):
+        """ID'lerin kayıt konumları (sıralı). Aynı ID'li tüm satırlar döner;
+        crc32 çakışmaları kaydın kendi ID'siyle elenir"""
+        positions = set()
+        for id_str in ids:
+            h = self._id_hash(id_str)
+            k = bisect.bisect_left(self.id_keys, h << 32)
+            while k < self.count and self.id_keys[k] >> 32 == h:
+                pos = self.id_keys[k] & 0xFFFFFFFF
+                if format_row_id(self.record(pos)[0]) == id_str:
+                    positions.add(pos)
+                k += 1
+        return sorted(positions)
+
+    def record(self, pos):
+        start = self.records_start + self.offsets[pos]
+        end = self.records_start + self.offsets[pos + 1]
+        return tuple(_cache_untag(v) for v in json.loads(self.mm[start:end].decode("utf-8")))
+
+    def rows(self, positions):
+        """(satır_no, satır) listesi, sayfa sırasıyla"""
+        return [(self.row_numbers[pos], self.record(pos)) for pos in positions]
+
+def read_row_subset(file_path, sheet_name=None, columns=None, row_range=None, ids=None,
+                    native=True, cache=None):
+    """Kısmi çalıştırma: sadece satır aralığındaki ve/veya ID listesindeki satırlar.
+
+    İkisi birden verilirse kesişim alınır. İndeks Cache/ altında yoksa sayfa bir kez
+    okunup kurulur; sonraki çalıştırmalar sadece istenen kayıtları diskten okur.
+    Önbellek kapalıysa sayfa tam okunup bellekte süzülür.
+    Akışlı okuma formül hesaplamaz; önbellek değeri olmayan formül varsa satırlar
+    read_excel_table (FormulaEvaluator) ile yeniden okunur, indekse None yazılmaz.
+    Döner: (row_numbers, rows, sonuçta olmayan id'ler, durum)
+    """
+    t0 = time.perf_counter()
+    formulas = {}
+
+    def source():
+        yield from iter_excel_rows_cached(file_path, sheet_name, columns, native, cache, formulas)
+
+    def evaluated():
+        APP_LOGGER.info(f"Kısmi okuma: {formulas['uncached_formulas']} formül hücresi hesaplanarak yeniden okunuyor")
+        row_numbers, rows, _ = read_excel_table(file_path, sheet_name, columns, native)
+        yield ("total", len(rows))
+        for row_no, row in zip(row_numbers, rows):
+            yield ("row", row_no, row)
+
+    if cache is None:
+        wanted = set(ids or ())
+        first, last = row_range or (1, None)
+
+        def select(items):
+            selected = []
+            for item in items:
+                if item[0] != "row" or item[1] < first or (last is not None and item[1] > last):
+                    continue
+                if not ids or format_row_id(item[2][0]) in wanted:
+                    selected.append(item[1:])
+            return selected
+
+        numbered = select(source())
+        if formulas.get("uncached_formulas"):
+            numbered = select(evaluated())
+        seen = {format_row_id(row[0]) for _, row in numbered}
+        missing = [i for i in (ids or ()) if i not in seen]
+        status = f"tam okuma, bellekte süzüldü ({time.perf_counter() - t0:.2f} sn)"
+    else:
+        path = cache.entry_path(file_path, "rowidx", sheet_name, columns)
+        built = ""
+        index = None
+        if os.path.exists(path):
+            try:
+                index = RowIndex(path)
+                os.utime(path)  # LRU: son kullanım
+            except (ValueError, OSError) as e:
+                APP_LOGGER.info(f"Satır indeksi yeniden kurulacak: {e}")
+        if index is None:
+            with _CACHE_LOCK:
+                os.makedirs(cache.cache_dir, exist_ok=True)
+            count = RowIndex.build(path, source())
+            if formulas.get("uncached_formulas"):
+                count = RowIndex.build(path, evaluated())
+                built = f"{formulas['uncached_formulas']} formül hesaplandı, "
+            built = f"indeks kuruldu ({count} satır, {built}{time.perf_counter() - t0:.2f} sn), "
+            APP_LOGGER.info(f"Satır indeksi kuruldu: {os.path.basename(file_path)} [{sheet_name or 'aktif sayfa'}] {count} satır")
+            index = RowIndex(path)
+        t_lookup = time.perf_counter()
+        with index:
+            positions = index.positions_in_range(*row_range) if row_range else range(index.count)
+            if ids:
+                positions = [p for p in index.positions_for_ids(ids) if p in positions]
+            numbered = index.rows(positions)
+        seen = {format_row_id(row[0]) for _, row in numbered} if ids else set()
+        missing = [i for i in (ids or ()) if i not in seen]
+        status = f"{built}arama {(time.perf_counter() - t_lookup) * 1000:.0f} ms"
+        if built:
+            with _CACHE_LOCK:
+                cache._evict()
+    APP_LOGGER.info(f"Kısmi okuma: {len(numbered)} satır, {status}")
+    return [n for n, _ in numbered], [row for _, row in numbered], missing, status
+
+# ==========================================
+# PARALEL SAYFA AYRIŞTIRMA (süreç havuzu)
+# ==========================================
+def list_worksheets(file_path):
+    """Çalışma sayfası adları kitap sırasıyla (chartsheet'ler hariç)"""
+    if is_tabular_file(file_path):
+        return [tabular_sheet_name(file_path)]
+    if file_path.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            with NativeXlsxReader(file_path) as reader:
+                return [name for name, path in reader.sheets if path]
+        except (NativeXlsxUnsupported, zipfile.BadZipFile, ET.ParseError) as e:
+            APP_LOGGER.info(f"Sayfa listesi native okunamadı, openpyxl'e geçiliyor: {e}")
+    wb = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        return [ws.title for ws in wb.worksheets]
+    finally:
+        wb.close()
+
+def select_sheets(sheet_names, name_filter=""):
+    """Virgülle ayrılmış fnmatch desenleriyle sayfa seçimi (örn. "Gövde_*, Kanat*"); boş filtre tüm sayfalar"""
+    patterns = [p.strip() for p in (name_filter or "").split(",") if p.strip()]
+    return [name for name in sheet_names if not patterns or any(fnmatch.fnmatch(name, p) for p in patterns)]
+
+def parse_sheet_columnar(file_path, sheet_name, columns, native=True):
+    """Süreç havuzunda çalışır: sayfayı okuyup encode_table biçiminde tek bytes olarak döndürür.
+    Satır/tuple listesi yerine sütunlu blob taşındığı için süreçler arası aktarım ucuzdur."""
+    row_numbers, data, sheets = read_excel_table(file_path, sheet_name, columns, native)
+    return encode_table(row_numbers, data, {"sheets": sheets})
+
+def iter_sheets_parallel(file_path, sheet_names, columns, native=True, cache=None, max_workers=None,
+                         stop_event=None):
+    """Seçili sayfaları süreç havuzunda eşzamanlı ayrıştırır, satırları sayfa sırasıyla üretir.
+
+    Mesajlar: ("total", n), ("sheet", isim, satır_sayısı), ("row", satır_no, satır). Tüketici
+    (COM thread'i) ilk sayfayı yazarken diğer sayfalar arka planda ayrışmaya devam eder.
+    Önbellekte olan sayfalar havuza gönderilmez, ayrıştırılanlar önbelleğe yazılır.
+    Toplam <dimension>'lardan gelir; bilinmeyen sayfalar ayrıştıkça eklenir.
+    stop_event set edilince sonuç beklemeyi bırakır; kapanışta başlamamış işler iptal edilir.
+    """
+    meta = probe_workbook(file_path)
+    dims = meta["dimensions"] if meta else {}
+    tables = {}
+    pending = []
+    for name in sheet_names:
+        hit = cache.load(file_path, "rows", name, columns) if cache is not None else None
+        if hit:
+            tables[name] = hit[:2]
+        else:
+            pending.append(name)
+    total = 0
+    for name in sheet_names:
+        if name in tables:
+            total += len(tables[name][1])
+        elif dims.get(name):
+            total += max(0, dims[name][0] - 1)
+    yield ("total", total)
+    
+    executor = None
+    futures = {}
+    if pending:
+        workers = max(1, min(len(pending), max_workers or os.cpu_count() or 1))
+        # spawn: Windows'ta zaten tek seçenek; Linux'ta da thread'li (Tk + COM) süreçten fork edilmez
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                          mp_context=multiprocessing.get_context("spawn"))
+        APP_LOGGER.info(f"Paralel ayrıştırma: {len(pending)} sayfa, {workers} süreç")
+    try:
+        for name in pending:
+            futures[name] = executor.submit(parse_sheet_columnar, file_path, name, columns, native)
+        for name in sheet_names:
+            if name in futures:
+                future = futures[name]
+                while stop_event is not None and not stop_event.is_set():
+                    if concurrent.futures.wait([future], timeout=0.1).done:
+                        break
+                if stop_event is not None and stop_event.is_set():
+                    APP_LOGGER.info("Paralel ayrıştırma durduruldu, kalan sayfalar iptal ediliyor")
+                    return
+                blob = futures.pop(name).result()
+                row_numbers, rows, _ = decode_table(blob)
+                if cache is not None:
+                    cache.store_blob(file_path, "rows", name, columns, blob)
+                del blob
+                if not dims.get(name):
+                    total += len(rows)
+                    yield ("total", total)
+            else:
+                row_numbers, rows = tables.pop(name)
+            yield ("sheet", name, len(rows))
+            for row_no, row in zip(row_numbers, rows):
+                yield ("row", row_no, row)
+    finally:
+        if executor is not None:
+            # Kuyruktaki sayfalar iptal; o an ayrışan süreçler kendi işini bitirip kapanır
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def read_excel_table_cached(file_path, sheet_name=None, columns=None, native=True, cache=None, report=None):
+    """read_excel_table + sütunlu önbellek. Döner: (excel_satır_numaraları, data, sheets)"""
+    if cache is not None:
+        hit = cache.load(file_path, "rows", sheet_name, columns)
+        if hit:
+            return hit[0], hit[1], hit[2].get("sheets")
+    row_numbers, data, sheets = read_excel_table(file_path, sheet_name, columns, native, report)
+    if cache is not None:
+        cache.store(file_path, "rows", sheet_name, columns, row_numbers, data, {"sheets": sheets})
+    return row_numbers, data, sheets
+
+def iter_excel_rows_cached(file_path, sheet_name=None, columns=None, native=True, cache=None, report=None):
+    """Akışlı mod: önbellekte varsa oradan, yoksa iter_excel_rows_fast ile okur.
+    Akış belleği sınırlı kalsın diye bu yol önbelleği doldurmaz."""
+    hit = cache.load(file_path, "rows", sheet_name, columns) if cache is not None else None
+    if hit:
+        row_numbers, rows, _ = hit
+        yield ("total", len(rows))
+        for row_no, row in zip(row_numbers, rows):
+            yield ("row", row_no, row)
+        return
+    yield from iter_excel_rows_fast(file_path, sheet_name, columns, native, report)
+
+def read_excel_preview_cached(file_path, max_rows=10, cache=None, sheet_name=None, cancelled=None, report=None):
+    """read_excel_preview_openpyxl + önbellek (satırlar liste olarak döner).
+    İptal edilen okuma önbelleğe yazılmaz; okunan sayfanın adı report["sheet"]'e yazılır."""
+    report = {} if report is None else report
+    if cache is not None:
+        hit = cache.load(file_path, "preview", sheet_name, [max_rows])
+        if hit:
+            sheets = hit[2].get("sheets")
+            report["sheet"] = hit[2].get("sheet") or sheet_name or (sheets[0] if sheets else None)
+            return [list(r) for r in hit[1]], sheets
+    raise_if_cancelled(cancelled)
+    if is_tabular_file(file_path):
+        data, sheets = read_tabular_preview(file_path, max_rows=max_rows)
+        report["sheet"] = sheets[0]
+    else:
+        data, sheets = read_excel_preview_openpyxl(file_path, max_rows=max_rows, sheet_name=sheet_name,
+                                                   cancelled=cancelled, report=report)
+    raise_if_cancelled(cancelled)
+    if cache is not None:
+        cache.store(file_path, "preview", sheet_name, [max_rows], list(range(1, len(data) + 1)), data,
+                    {"sheets": sheets, "sheet": report.get("sheet")})
+    return data, sheets
+
+class PreviewLRU:
+    """Sayfa önizlemeleri için küçük bellek içi LRU: (dosya kimliği, sayfa) -> (sheets, data).
+
+    Dosya kimliği (mutlak yol, boyut, mtime_ns) olduğundan dosya değişince eski
+    önizlemeler kendiliğinden ıska olur. Sadece GUI thread'inden kullanılır.
+    """
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self._items = OrderedDict()
+
+    @staticmethod
+    def file_identity(file_path):
+        st = os.stat(file_path)
+        return (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+# ==========================================
+# CATIA GÜNCELLEME POLİTİKASI (part.Update)
+# ==========================================
+UPDATE_POLICIES = {
+    "parameter": "Her parametrede",
+    "row": "Her satırda",
+    "batch": "Her N satırda",
+    "end": "Sadece sonda",
+    "adaptive": "Adaptif",
+}
+
+class PartUpdatePolicy:
+    """part.Update() çağrılarını seçilen politikaya göre erteler ve maliyetini ölçer.
+
+    parameter: her parametre yazımından sonra (eski davranış)
+    row:       her satır bittiğinde
+    batch:     her N satırda bir
+    end:       sadece işlem sonunda
+    adaptive:  Update süresini ölçüp UI gecikmesini hedef altında tutacak N'yi seçer
+    """
+    def __init__(self, mode="parameter", batch_rows=50, target_latency=0.5, max_batch_rows=1000):
+        if mode not in UPDATE_POLICIES:
+            raise ValueError(f"Bilinmeyen güncelleme politikası: {mode}")
+        self.mode = mode
+        self.batch_rows = max(1, int(batch_rows))
+        self.target_latency = max(0.01, float(target_latency))
+        self.max_batch_rows = max(1, int(max_batch_rows))
+        if mode == "adaptive":
+            self.batch_rows = 1  # İlk ölçüme kadar her satırda
+
+        self.pending = False
+        self.rows_since_update = 0
+        self.update_count = 0
+        self.update_time = 0.0
+        self.max_update_cost = 0.0
+        self.last_update_cost = 0.0
+        self.row_time = 0.0  # Satır yazma süresi (üstel ortalama, Update hariç)
+        self._row_started = time.perf_counter()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(mode=config.get("update_policy", "parameter"),
+                   batch_rows=config.get("update_batch_rows", 50),
+                   target_latency=config.get("update_target_latency", 0.5))
+
+    def on_parameter_written(self, part):
+        """Bir parametre yazıldıktan sonra çağrılır"""
+        self.pending = True
+        if self.mode == "parameter":
+            self._do_update(part)
+
+    def on_row_done(self, part):
+        """Bir satırın tüm parametreleri yazıldıktan sonra çağrılır"""
+        now = time.perf_counter()
+        elapsed = now - self._row_started
+        self.row_time = elapsed if self.row_time == 0 else (0.8 * self.row_time + 0.2 * elapsed)
+        self.rows_since_update += 1
+
+        if self.pending and self.mode != "parameter" and self.mode != "end":
+            if self.mode == "row" or self.rows_since_update >= self.batch_rows:
+                self._do_update(part)
+        self._row_started = time.perf_counter()
+
+    def on_rows_done(self, part, rows):
+        """Toplu yazan backend'ler için (script vb.): bir parça satır bittiğinde çağrılır.
+        Parametre/satır politikaları burada parça başına bir Update'e dönüşür."""
+        rows = max(1, rows)
+        elapsed = time.perf_counter() - self._row_started
+        per_row = elapsed / rows
+        self.row_time = per_row if self.row_time == 0 else (0.8 * self.row_time + 0.2 * per_row)
+        self.rows_since_update += rows
+
+        if self.pending and self.mode != "end":
+            if self.mode in ("parameter", "row") or self.rows_since_update >= self.batch_rows:
+                self._do_update(part)
+        self._row_started = time.perf_counter()
+
+    def finish(self, part):
+        """İşlem sonunda (veya durdurulduğunda) bekleyen değişiklikleri uygula"""
+        if self.pending:
+            self._do_update(part)
+
+    def _do_update(self, part):
+        if part is None:
+            self.pending = False
+            return
+        t0 = time.perf_counter()
+        part.Update()
+        cost = time.perf_counter() - t0
+
+        self.update_count += 1
+        self.update_time += cost
+        self.last_update_cost = cost
+        self.max_update_cost = max(self.max_update_cost, cost)
+        self.pending = False
+        self.rows_since_update = 0
+
+        if self.mode == "adaptive":
+            self._adapt(cost)
+
+    def _adapt(self, cost):
+        """N satır yazma + 1 Update süresi hedef gecikmeyi aşmayacak en büyük N"""
+        if self.row_time <= 0:
+            return
+        budget = self.target_latency - cost
+        new_size = int(budget / self.row_time) if budget > 0 else 1
+        self.batch_rows = min(self.max_batch_rows, max(1, new_size))
+
+    def describe(self):
+        label = UPDATE_POLICIES.get(self.mode, self.mode)
+        if self.mode == "batch":
+            return f"{label} (N={self.batch_rows})"
+        if self.mode == "adaptive":
+            return f"{label} (hedef {self.target_latency * 1000:.0f} ms, son N={self.batch_rows})"
+        return label
+
+    def summary(self):
+        """Results dosyası için özet"""
+        avg = (self.update_time / self.update_count) if self.update_count else 0.0
+        return {
+            "Güncelleme Politikası": self.describe(),
+            "Part.Update Sayısı": self.update_count,
+            "Toplam Update Süresi": f"{self.update_time:.2f} sn",
+            "Ortalama Update Süresi": f"{avg * 1000:.1f} ms",
+            "En Uzun Update": f"{self.max_update_cost * 1000:.1f} ms",
+        }
+
+# ==========================================
+# CATIA PARAMETRE ÖNBELLEĞİ
+# ==========================================
+class CatiaParameterCache:
+    """Part ve Parameters koleksiyonunu çalışma başına bir kez çözer,
+    parametre COM nesnelerini isimle önbellekte tutar.
+
+    Her yazımda ActiveDocument/Part/Parameters.Item zinciri yerine sadece
+    param.Value çağrısı yapılır. Aktif döküman değişirse önbellek sıfırlanır.
+    """
+    def __init__(self, catia):
+        self.catia = catia
+        self.document = None
+        self.part = None
+        self.parameters = None
+        self.handles = {}
+        self.item_calls = 0      # Parameters.Item() çağrı sayısı
+        self.hits = 0            # Önbellekten dönen handle sayısı
+        self.invalidations = 0   # Döküman değişimi nedeniyle sıfırlama
+        self.index = None        # İsim indeksi (build_index sonrası): isim -> handle
+        self.index_scope = None
+        self.resolve()
+
+    def resolve(self):
+        """Aktif dökümanın Part ve Parameters nesnelerini çöz"""
+        self.document = self.catia.ActiveDocument
+        self.part = self.document.Part
+        self.parameters = self.part.Parameters
+        self.handles.clear()
+        if self.index is not None:
+            self.build_index(self.index_scope)
+
+    def _scoped_parameters(self, scope):
+        """Kapsam: parametre seti adı (AllParameters) veya nesne adı (SubList)"""
+        if not scope:
+            return self.parameters
+        try:
+            param_set = self.parameters.RootParameterSet.ParameterSets.Item(scope)
+            return param_set.AllParameters
+        except Exception:
+            # Parametre seti değilse Part içindeki nesnenin alt listesi (örn. bir Body)
+            obj = self.part.FindObjectByName(scope)
+            return self.parameters.SubList(obj, True)
+
+    def build_index(self, scope=None):
+        """Parameters koleksiyonunu tek geçişte dolaşıp isim indeksi oluşturur.
+
+        CATIA isimleri yol içerebilir (Part1\\Parametreler\\Rib_1H), bu yüzden hem tam
+        isim hem de son segment indekslenir. Döner: indekslenen parametre sayısı.
+        """
+        collection = self._scoped_parameters(scope)
+        index = {}
+        count = collection.Count
+        for i in range(1, count + 1):
+            param = collection.Item(i)
+            name = param.Name
+            index.setdefault(name, param)
+            short_name = name.rsplit("\\", 1)[-1]
+            if short_name != name:
+                index.setdefault(short_name, param)
+        self.index = index
+        self.index_scope = scope
+        self.handles.update(index)
+        return count
+
+    def has(self, name):
+        """İsim indeksinde var mı (indeks yoksa her isim 'var' kabul edilir)"""
+        return self.index is None or name in self.index
+
+    def check_document(self):
+        """Aktif döküman değiştiyse önbelleği yenile. Değişmediyse True döner."""
+        doc = self.catia.ActiveDocument
+        if doc == self.document:
+            return True
+        APP_LOGGER.warning("Aktif CATIA dökümanı değişti, parametre önbelleği yenileniyor")
+        self.invalidations += 1
+        self.resolve()
+        return False
+
+    def get(self, name):
+        """Parametre handle'ı (ilk erişimde Parameters.Item ile çözülür)"""
+        param = self.handles.get(name)
+        if param is not None:
+            self.hits += 1
+            return param
+        self.item_calls += 1
+        param = self.parameters.Item(name)
+        self.handles[name] = param
+        return param
+
+    def set_value(self, name, value):
+        self.get(name).Value = value
+
+    def get_value(self, name):
+        return self.get(name).Value
+
+    def summary(self):
+        return {
+            "Parametre Önbelleği": f"{len({id(h) for h in self.handles.values()})} handle, {self.hits} isabet, "
+                                   f"{self.item_calls} Item() çağrısı, {self.invalidations} yenileme",
+        }
+
+    def preflight(self, names, scope=None):
+        """İsim indeksini kurar ve listede olup CATIA'da olmayanları döndürür"""
+        t0 = time.perf_counter()
+        indexed = self.build_index(scope)
+        missing = {name: row for name, row in names.items() if name not in self.index}
+        elapsed = time.perf_counter() - t0
+        APP_LOGGER.info(f"Ön kontrol: {indexed} parametre indekslendi ({elapsed:.2f} sn), "
+                        f"{len(names)} isim kontrol edildi, {len(missing)} eksik")
+        return missing, indexed, elapsed
+
+# ==========================================
+# CATIA BATCH OTURUMU (ekran / uyarı / etkileşim)
+# ==========================================
+class CatiaBatchSession:
+    """Çalışma süresince CATIA'nın ekran yenilemesini, dosya uyarılarını ve
+    etkileşimini kapatır (Excel'deki ScreenUpdating/DisplayAlerts karşılığı).
+
+    with bloğu ile kullanılır; durdurma ve hata durumunda __exit__ eski değerleri
+    geri yükler. restore() birden fazla çağrılabilir, sadece ilki etkilidir.
+    """
+    PROPERTIES = (("RefreshDisplay", False), ("DisplayFileAlerts", False), ("Interactive", False))
+
+    def __init__(self, catia):
+        self.catia = catia
+        self.saved = {}  # özellik -> orijinal değer (sadece değiştirilebilenler)
+        self.active = False
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.restore()
+        return False
+
+    def begin(self):
+        for prop, value in self.PROPERTIES:
+            try:
+                original = getattr(self.catia, prop)
+                setattr(self.catia, prop, value)
+                self.saved[prop] = original
+            except Exception as e:
+                APP_LOGGER.warning(f"CATIA.{prop} ayarlanamadı: {e}")
+        self.active = bool(self.saved)
+        if self.active:
+            APP_LOGGER.info(f"CATIA batch modu açık: {', '.join(self.saved)}")
+
+    def restore(self, catia=None):
+        """Orijinal değerleri geri yükler. catia verilirse o bağlantı kullanılır
+        (worker thread'i bitmeden uygulama kapanırken yeni bağlantı ile)."""
+        if not self.active:
+            return
+        self.active = False
+        target = catia or self.catia
+        for prop, original in self.saved.items():
+            try:
+                setattr(target, prop, original)
+            except Exception as e:
+                APP_LOGGER.error(f"CATIA.{prop} geri yüklenemedi: {e}")
+        APP_LOGGER.info("CATIA batch modu kapatıldı, ayarlar geri yüklendi")
+
+    def summary(self):
+        return {"CATIA Batch Modu": ", ".join(f"{p}=Kapalı" for p in self.saved) or "Uygulanamadı"}
+
+# ==========================================
+# İLİŞKİLERİ (Relations) GEÇİCİ KAPATMA
+# ==========================================
+class RelationSuspender:
+    """Yazma süresince Part.Relations'daki formül/kural/check'leri devre dışı bırakır.
+
+    Her parametre yazımı ilişki ağını yeniden değerlendirir; kapalıyken yazılıp
+    restore() ile tekrar açıldıktan sonra tek bir Update yeterlidir. Zaten kapalı
+    olan ilişkilere dokunulmaz, restore sadece bu sınıfın kapattıklarını açar.
+    name_filter: virgülle ayrılmış isim desenleri (örn. "Rule*, Check*"), boşsa hepsi.
+    """
+    def __init__(self, part, name_filter=""):
+        self.part = part
+        self.patterns = [p.strip() for p in (name_filter or "").split(",") if p.strip()]
+        self.deactivated = []
+        self.total = 0
+        self.failed = 0
+        self.suspend_time = 0.0
+        self.restore_time = 0.0
+        self.suspended_at = None
+        self.write_time = 0.0
+        self.baseline_update = None  # Kapatmadan önce ölçülen Part.Update süresi (sn)
+
+    def matches(self, name):
+        return not self.patterns or any(fnmatch.fnmatch(name, p) for p in self.patterns)
+
+    def measure_baseline(self):
+        """İlişkiler açıkken tek Part.Update süresi; raporda kapalıyken ölçülen Update
+        süreleriyle karşılaştırma için (yazmadan önce, bir kez)"""
+        t0 = time.perf_counter()
+        self.part.Update()
+        self.baseline_update = time.perf_counter() - t0
+        APP_LOGGER.info(f"Referans Update (ilişkiler açık): {self.baseline_update * 1000:.0f} ms")
+        return self.baseline_update
+
+    def suspend(self):
+        t0 = time.perf_counter()
+        relations = self.part.Relations
+        self.total = relations.Count
+        for i in range(1, self.total + 1):
+            try:
+                rel = relations.Item(i)
+                if rel.IsDeactivated() or not self.matches(rel.Name):
+                    continue
+                rel.Deactivate()
+                self.deactivated.append(rel)
+            except Exception as e:
+                self.failed += 1
+                APP_LOGGER.warning(f"İlişki {i} devre dışı bırakılamadı: {e}")
+        self.suspended_at = time.perf_counter()
+        self.suspend_time = self.suspended_at - t0
+        APP_LOGGER.info(f"İlişkiler: {len(self.deactivated)}/{self.total} devre dışı ({self.suspend_time:.2f} sn)")
+        return len(self.deactivated)
+
+    def restore(self):
+        """Kapatılan ilişkileri tekrar açar; açılan ilişki sayısını döndürür"""
+        rels, self.deactivated = self.deactivated, []
+        if not rels:
+            return 0
+        t0 = time.perf_counter()
+        if self.suspended_at is not None:
+            self.write_time = t0 - self.suspended_at
+        for rel in rels:
+            try:
+                rel.Activate()
+            except Exception as e:
+                self.failed += 1
+                APP_LOGGER.error(f"İlişki tekrar etkinleştirilemedi: {e}")
+        self.restore_time = time.perf_counter() - t0
+        APP_LOGGER.info(f"İlişkiler: {len(rels)} tekrar etkin ({self.restore_time:.2f} sn)")
+        return len(rels)
+
+    def summary(self, count):
+        """count: bu nesnenin kapattığı ilişki sayısı (restore öncesi)"""
+        filt = ", ".join(self.patterns) if self.patterns else "tümü"
+        result = {
+            "İlişkiler (Relations)": f"{count}/{self.total} devre dışı bırakıldı (filtre: {filt})",
+            "İlişki Kapatma / Açma": f"{self.suspend_time * 1000:.0f} ms / {self.restore_time * 1000:.0f} ms",
+            "Yazma Süresi (ilişkiler kapalı)": f"{self.write_time:.2f} sn",
+        }
+        if self.baseline_update is not None:
+            result["Referans Update (ilişkiler açık)"] = f"{self.baseline_update * 1000:.0f} ms"
+        if self.failed:
+            result["İlişki Hataları"] = self.failed
+        return result
+
+# ==========================================
+# YAZMA PLANI & SCRIPT YAZICI
+# ==========================================
+WRITE_BACKENDS = {
+    "com": "Parametre başına COM",
+    "script": "Toplu CATScript",
+    "designtable": "Design Table (konfigürasyon)",
+}
+
+class WriteOp:
+    """Doğrulanmış tek parametre yazımı (Excel satır no, CATIA adı, değer)"""
+    __slots__ = ("row", "name", "value")
+
+    def __init__(self, row, name, value):
+        self.row = row
+        self.name = name
+        self.value = value
+
+    def __repr__(self):
+        return f"WriteOp({self.row}, {self.name!r}, {self.value!r})"
+
+def row_to_ops(row_no, row, param_map, skip_names=()):
+    """Tek satırı doğrulanmış WriteOp'lara çevirir.
+
+    Döner: (id_str, ops, errors) - ID boşsa id_str boş string, errors: [(excel_satır, isim, mesaj)]
+    """
+    ops = []
+    errors = []
+    id_val = row[0] if len(row) > 0 else None
+    id_str = format_row_id(id_val) if id_val else ""
+    if not id_str:
+        return "", ops, errors
+    for suffix, col_idx in param_map:
+        if col_idx < len(row):
+            val = row[col_idx]
+            if val is None or val == "":
+                continue
+            full_name = id_str + suffix
+            if full_name in skip_names:
+                continue
+            try:
+                ops.append(WriteOp(row_no, full_name, validate_parameter_value(val, full_name)))
+            except ValueError as ve:
+                errors.append((row_no, full_name, str(ve)))
+    return id_str, ops, errors
+
+def build_write_plan(data, param_map, skip_names=(), row_numbers=None):
+    """Satırları doğrulanmış WriteOp listesine çevirir.
+
+    Döner: (ops, errors) - errors: [(excel_satır, isim, mesaj)]. skip_names'teki
+    isimler (ön kontrolde bulunamayanlar) plana alınmaz.
+    """
+    ops = []
+    errors = []
+    for i, row in enumerate(data):
+        _, row_ops, row_errors = row_to_ops(row_numbers[i] if row_numbers else i + 2, row, param_map, skip_names)
+        ops.extend(row_ops)
+        errors.extend(row_errors)
+    return ops, errors
+
+def _vb_string(text):
+    """VBScript string literali; ASCII dışı karakterler ChrW() ile (dosya saf ASCII kalır)"""
+    parts = []
+    literal = ""
+    for ch in str(text):
+        if ord(ch) < 128:
+            literal += '""' if ch == '"' else ch
+        else:
+            if literal:
+                parts.append(f'"{literal}"')
+                literal = ""
+            parts.append(f"ChrW({ord(ch)})")
+    if literal or not parts:
+        parts.append(f'"{literal}"')
+    return " & ".join(parts)
+
+def _vb_number(value):
+    text = repr(float(value))
+    if text in ("inf", "-inf", "nan"):
+        raise ValueError(f"VBScript'e yazılamayan değer: {value}")
+    return text.upper()
+
+def build_catscript(ops, delta_tolerance=None):
+    """WriteOp listesinden tek seferde çalışacak VBScript (.catvbs) üretir.
+
+    CATMain, her parametre için bir karakterlik durum döndürür:
+    "1" yazıldı, "0" hata (bulunamadı / yazılamadı), "2" değişmedi (delta modu).
+    Çıktı deterministiktir (aynı plan -> aynı metin).
+    """
+    lines = [
+        "' CATIA Automation Suite - otomatik uretilmis yazma scripti",
+        f"' Parametre sayisi: {len(ops)}",
+        "Function CATMain()",
+        "    Dim params, s",
+        "    Set params = CATIA.ActiveDocument.Part.Parameters",
+        "    s = \"\"",
+    ]
+    for op in ops:
+        lines.append(f"    s = s & W(params, {_vb_string(op.name)}, {_vb_number(op.value)})")
+    lines += [
+        "    CATMain = s",
+        "End Function",
+        "",
+        "Function W(params, name, value)",
+        "    On Error Resume Next",
+        "    Dim p",
+        "    W = \"0\"",
+        "    Set p = params.Item(name)",
+        "    If Err.Number <> 0 Then Exit Function",
+    ]
+    if delta_tolerance is not None:
+        lines += [
+            "    Dim d",
+            "    d = Abs(p.Value - value)",
+            "    If Err.Number = 0 Then",
+            f"        If d <= {_vb_number(delta_tolerance)} Then",
+            "            W = \"2\"",
+            "            Exit Function",
+            "        End If",
+            "    End If",
+            "    Err.Clear",
+        ]
+    lines += [
+        "    p.Value = value",
+        "    If Err.Number = 0 Then W = \"1\"",
+        "End Function",
+        "",
+    ]
+    return "\r\n".join(lines)
+
+def parse_script_status(result, ops):
+    """CATMain dönüşünü doğrular: ops başına bir karakter, sadece "0" / "1" / "2"."""
+    status = str(result or "")
+    if len(status) != len(ops):
+        raise RuntimeError(f"Script durum vektörü uyuşmuyor ({len(status)} / {len(ops)})")
+    bad = set(status) - set("012")
+    if bad:
+        raise RuntimeError(f"Script durum vektöründe beklenmeyen karakter: {''.join(sorted(bad))!r}")
+    return status
+
+def status_by_row(ops, status):
+    """Durum vektörünü Excel satırlarına geri dağıtır.
+
+    Döner: OrderedDict {excel_satır: (yazılan, değişmeyen, hatalı)} - her biri isim listesi,
+    satırlar plandaki sırayla.
+    """
+    rows = OrderedDict()
+    for op, code in zip(ops, status):
+        written, unchanged, failed = rows.setdefault(op.row, ([], [], []))
+        if code == "1":
+            written.append(op.name)
+        elif code == "2":
+            unchanged.append(op.name)
+        else:
+            failed.append(op.name)
+    return rows
+
+class CatiaScriptWriter:
+    """Yazma planını parçalar halinde CATScript olarak tek COM çağrısıyla çalıştırır
+    (CATIA.SystemService.ExecuteScript, dizin kütüphanesi)."""
+    LIBRARY_TYPE_DIRECTORY = 1  # catScriptLibraryTypeDirectory
+
+    def __init__(self, catia, chunk_size=500, delta_tolerance=None, script_dir=None):
+        self.catia = catia
+        self.chunk_size = max(1, int(chunk_size))
+        self.delta_tolerance = delta_tolerance
+        self.script_dir = script_dir or os.path.join(tempfile.gettempdir(), "s2d_scripts")
+        self.script_name = f"s2d_write_{os.getpid()}.catvbs"
+        self.calls = 0
+        self.script_time = 0.0
+
+    def chunks(self, ops):
+        """Planı satır bütünlüğünü bozmadan ~chunk_size parametrelik parçalara böler"""
+        chunk = []
+        for op in ops:
+            if len(chunk) >= self.chunk_size and op.row != chunk[-1].row:
+                yield chunk
+                chunk = []
+            chunk.append(op)
+        if chunk:
+            yield chunk
+
+    def execute(self, ops):
+        """Bir parçayı çalıştırır, parametre başına durum karakterlerini döndürür"""
+        os.makedirs(self.script_dir, exist_ok=True)
+        path = os.path.join(self.script_dir, self.script_name)
+        with open(path, "w", encoding="ascii", newline="") as f:
+            f.write(build_catscript(ops, self.delta_tolerance))
+        
+        t0 = time.perf_counter()
+        result = self.catia.SystemService.ExecuteScript(
+            self.script_dir, self.LIBRARY_TYPE_DIRECTORY, self.script_name, "CATMain", [])
+        self.script_time += time.perf_counter() - t0
+        self.calls += 1
+        return parse_script_status(result, ops)
+
+    def cleanup(self):
+        try:
+            os.remove(os.path.join(self.script_dir, self.script_name))
+        except OSError:
+            pass
+
+    def summary(self):
+        return {"Script Yazıcı": f"{self.calls} ExecuteScript çağrısı, parça {self.chunk_size}, "
+                                 f"toplam {self.script_time:.2f} sn"}
+
+# ==========================================
+# DESIGN TABLE BACKEND'İ
+# ==========================================
+def build_design_table_text(data, param_map, row_numbers=None):
+    """Her satırı bir konfigürasyon olan sekme ayraçlı design table metni üretir.
+
+    Sütunlar: ID + eşleştirilmiş parametre adları (suffix = CATIA parametre adı).
+    Döner: (metin, satır_sayısı, hatalar) - hatalar: [(excel_satır, mesaj)]
+    """
+    columns = [suffix for suffix, _ in param_map]
+    lines = ["\t".join(["ID"] + columns)]
+    errors = []
+    for i, row in enumerate(data):
+        id_val = row[0] if len(row) > 0 else None
+        if not id_val:
+            continue
+        id_str = format_row_id(id_val)
+        if not id_str:
+            continue
+        values = []
+        try:
+            for suffix, col_idx in param_map:
+                val = row[col_idx] if col_idx < len(row) else None
+                if val is None or val == "":
+                    raise ValueError(f"{suffix} boş")
+                values.append(repr(validate_parameter_value(val, suffix)))
+        except ValueError as ve:
+            errors.append((row_numbers[i] if row_numbers else i + 2, str(ve)))
+            continue
+        lines.append("\t".join([id_str.replace("\t", " ")] + values))
+    return "\r\n".join(lines) + "\r\n", len(lines) - 1, errors
+
+class DesignTableWriter:
+    """Eşleştirilmiş sütunlardan design table dosyası üretir, Part'a bağlar ve
+    her konfigürasyonu tek COM çağrısı (Configuration = k) + tek Update ile uygular.
+
+    Bağlanan sütunlar tablonun Comment'ine JSON olarak yazılır (CATIA ilişkilendirmeleri
+    okumaya izin vermez); sütun eşlemesi değişince tablo silinip yeniden oluşturulur."""
+    TABLE_DIR = "DesignTables"
+    COMMENT = "CATIA Automation Suite"
+
+    def __init__(self, excel_path, sheet_name, hash_check=True):
+        base = os.path.splitext(os.path.basename(excel_path))[0]
+        safe_sheet = re.sub(r"[^\w\-]+", "_", sheet_name or "Sheet")
+        self.table_name = f"S2D_{safe_sheet}"
+        self.path = os.path.abspath(os.path.join(self.TABLE_DIR, f"{base}_{safe_sheet}.txt"))
+        self.hash_check = hash_check
+        self.regenerated = False
+        self.rows = 0
+
+    def export(self, data, param_map, row_numbers=None):
+        """Tablo dosyasını yazar. hash_check açıksa içerik değişmediyse dosyaya dokunmaz.
+        Döner: satır hataları listesi"""
+        text, self.rows, errors = build_design_table_text(data, param_map, row_numbers)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        hash_path = self.path + ".sha256"
+        
+        if self.hash_check and os.path.exists(self.path) and os.path.exists(hash_path):
+            with open(hash_path, "r", encoding="ascii") as f:
+                if f.read().strip() == digest:
+                    APP_LOGGER.info(f"Design table değişmedi, yeniden üretilmedi: {self.path}")
+                    self.regenerated = False
+                    return errors
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        with open(hash_path, "w", encoding="ascii") as f:
+            f.write(digest)
+        self.regenerated = True
+        APP_LOGGER.info(f"Design table yazıldı: {self.path} ({self.rows} konfigürasyon)")
+        return errors
+
+    @classmethod
+    def associated_columns(cls, table):
+        """Tablo Comment'inden bağlı sütunlar; kayıt yoksa (eski sürüm / elle oluşturulmuş) None"""
+        try:
+            comment = table.Comment or ""
+            start = comment.index("[")
+            columns = json.loads(comment[start:])
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return columns if isinstance(columns, list) else None
+
+    def attach(self, part, param_cache, columns):
+        """Part'taki design table'ı bulur (dosya değiştiyse senkronize eder) ya da oluşturur.
+        Mevcut tablonun bağlı sütunları columns'tan farklıysa tablo yeniden oluşturulur."""
+        relations = part.Relations
+        try:
+            table = relations.Item(self.table_name)
+        except Exception:
+            table = None
+        if table is not None:
+            associated = self.associated_columns(table)
+            if associated is not None and set(associated) == set(columns):
+                if self.regenerated:
+                    table.Synchronize()
+                return table
+            APP_LOGGER.info(f"Design table sütun eşlemesi değişti ({associated} -> {columns}), "
+                            f"yeniden oluşturuluyor: {self.table_name}")
+            try:
+                relations.Remove(self.table_name)
+            except Exception as e:
+                raise RuntimeError(f"Eski design table '{self.table_name}' kaldırılamadı, sütun eşlemesi "
+                                   f"değiştiği için yeniden oluşturulmalı (CATIA'da elle silin): {e}")
+        
+        comment = f"{self.COMMENT} {json.dumps(list(columns), ensure_ascii=False)}"
+        table = relations.CreateDesignTable(self.table_name, comment, False, self.path)
+        for column in columns:
+            table.AddAssociation(param_cache.get(column), column)
+        APP_LOGGER.info(f"Design table oluşturuldu: {self.table_name} ({len(columns)} ilişki)")
+        return table
+
+# ==========================================
+# VERİ HATTI (OKUMA -> DOĞRULAMA -> YAZMA)
+# ==========================================
+STREAMING_THRESHOLD_MB = 100  # Bu boyutun üstündeki dosyalar parça parça akışlı modda işlenir
+
+class ExcelWritePipeline:
+    """Excel okuma, doğrulama ve CATIA yazma aşamalarını sınırlı kuyruklarla bağlar.
+
+    Okuyucu ve doğrulayıcı kendi thread'lerinde çalışır; yazıcı (COM sahibi worker)
+    hattı iterasyonla tüketir. Kuyruklar doluysa üretici bekler (backpressure),
+    stop() tüm aşamaları durdurur. Okuma hataları yazıcıya iletilir.
+
+    Satırlar kuyruklarda chunk_rows'luk parçalar halinde taşınır; her kuyrukta en
+    fazla queue_size satır bekler, yani bellekteki satır sayısı dosya boyutundan
+    bağımsızdır.
+    """
+    def __init__(self, row_source, param_map, queue_size=256, chunk_rows=1, stop_event=None):
+        self.row_source = row_source
+        self.param_map = param_map
+        self.chunk_rows = max(1, chunk_rows)
+        slots = max(1, queue_size // self.chunk_rows)
+        self.rows_q = queue.Queue(maxsize=slots)
+        self.ops_q = queue.Queue(maxsize=slots)
+        self.stop_event = stop_event or threading.Event()  # Kaynakla paylaşılabilir (iter_sheets_parallel)
+        self.threads = []
+
+    def start(self):
+        for target, name in ((self._read, "S2D-Okuyucu"), (self._validate, "S2D-Dogrulayici")):
+            t = threading.Thread(target=target, name=name, daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def stop(self):
+        self.stop_event.set()
+        for t in self.threads:
+            t.join(timeout=2)
+
+    def depths(self):
+        """(okuma kuyruğu, yazma kuyruğu) doluluk (satır, parça boyutuna yuvarlanmış)"""
+        return self.rows_q.qsize() * self.chunk_rows, self.ops_q.qsize() * self.chunk_rows
+
+    def _put(self, q, item):
+        while not self.stop_event.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        while not self.stop_event.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _read(self):
+        try:
+            chunk = []
+            for item in self.row_source:
+                if item[0] != "row":
+                    if not self._put(self.rows_q, item):
+                        return
+                    continue
+                chunk.append(item)
+                if len(chunk) >= self.chunk_rows:
+                    if not self._put(self.rows_q, ("chunk", chunk)):
+                        return
+                    chunk = []
+            if chunk and not self._put(self.rows_q, ("chunk", chunk)):
+                return
+            self._put(self.rows_q, ("end",))
+        except Exception as e:
+            self._put(self.rows_q, ("error", e, traceback.format_exc()))
+        finally:
+            close = getattr(self.row_source, "close", None)
+            if close:
+                close()
+
+    def _validate(self):
+        while True:
+            item = self._get(self.rows_q)
+            if item is None:
+                return
+            if item[0] == "chunk":
+                validated = []
+                for _, row_no, row in item[1]:
+                    id_str, ops, errors = row_to_ops(row_no, row, self.param_map)
+                    if id_str:
+                        validated.append(("row", row_no, ops, errors))
+                if not validated:
+                    continue
+                item = ("chunk", validated)
+            if not self._put(self.ops_q, item):
+                return
+            if item[0] in ("end", "error"):
+                return
+
+    def __iter__(self):
+        """Yazıcı tarafı: ("total", n) ve ("row", satır_no, ops, hatalar) mesajları"""
+        while True:
+            item = self._get(self.ops_q)
+            if item is None or item[0] == "end":
+                return
+            if item[0] == "error":
+                APP_LOGGER.error(f"Okuma aşaması hatası:\n{item[2]}")
+                raise RuntimeError(f"Excel okuma hatası: {item[1]}")
+            if item[0] == "chunk":
+                yield from item[1]
+            else:
+                yield item
+
+# ==========================================
+# CATIA COM SERVİSİ (kalıcı STA thread)
+# ==========================================
+COM_REQUESTS = ("probe", "enumerate", "check_document", "write_batch", "update", "call", "marshal_catia",
+                "marshal_excel", "marshal_parameter")
+
+def _default_catia_connector():
+    import win32com.client
+    return win32com.client.GetActiveObject("CATIA.Application")
+
+def _default_excel_connector():
+    import win32com.client
+    return win32com.client.Dispatch("Excel.Application")
+
+class ComRequest:
+    __slots__ = ("kind", "args", "kwargs", "future")
+
+    def __init__(self, kind, args, kwargs):
+        if kind not in COM_REQUESTS:
+            raise ValueError(f"Bilinmeyen COM isteği: {kind}")
+        self.kind = kind
+        self.args = args
+        self.kwargs = kwargs
+        self.future = concurrent.futures.Future()
+
+class CatiaComService(threading.Thread):
+    """Uygulama ömrü boyunca CATIA ve Excel COM bağlantılarının sahibi olan tek STA thread'i.
+
+    İstekler (probe, enumerate, write_batch, update, call) herhangi bir thread'den
+    kuyruğa atılır, bu thread'de sırayla çalışır ve Future ile sonuçlanır. Boşta
+    kalınca bağlantının sağlığı kontrol edilir; kopan bağlantı bir sonraki istekte
+    yeniden kurulur ve istek bir kez tekrarlanır. Worker parametre yazımlarını
+    (write_batch), part.Update'i (update, ServicePart üzerinden), ön kontrolü
+    (enumerate) ve satır başına döküman kontrolünü (check_document) istek olarak
+    gönderir; ilişkiler, design table ve CATScript gibi
+    seyrek işlemler için catia_for_current_thread() marshal edilmiş proxy döndürür.
+
+    connector / excel_connector enjekte edilebilir (win32com olmadan sahte dispatcher ile).
+    """
+    def __init__(self, connector=None, excel_connector=None, health_interval=5.0):
+        super().__init__(name="S2D-COM", daemon=True)
+        self.connector = connector or _default_catia_connector
+        self.excel_connector = excel_connector or _default_excel_connector
+        self.available = connector is not None or WIN32COM_AVAILABLE
+        self.use_com = connector is None and WIN32COM_AVAILABLE  # Gerçek COM: CoInitialize/marshal
+        self.health_interval = health_interval
+        self.requests = queue.Queue()
+        self.catia = None
+        self.excel = None
+        self.param_cache = None
+        self.connects = 0
+        self.reconnects = 0
+        self.request_count = 0
+        self._stopping = False
+
+    # --- İstemci tarafı (her thread) ---
+    def submit(self, kind, *args, **kwargs):
+        if self._stopping or not self.is_alive():
+            raise RuntimeError("COM servisi çalışmıyor")
+        request = ComRequest(kind, args, kwargs)
+        self.requests.put(request)
+        return request.future
+
+    def call(self, kind, *args, timeout=None, **kwargs):
+        return self.submit(kind, *args, **kwargs).result(timeout)
+
+    def catia_for_current_thread(self, timeout=30):
+        """Çağıran thread'de kullanılabilir CATIA nesnesi (COM'da marshal edilmiş proxy)"""
+        return self._unmarshal(self.call("marshal_catia", timeout=timeout))
+
+    def excel_for_current_thread(self, timeout=30):
+        return self._unmarshal(self.call("marshal_excel", timeout=timeout))
+
+    def shutdown(self, timeout=5):
+        if not self.is_alive():
+            return
+        self._stopping = True
+        self.requests.put(None)
+        self.join(timeout)
+
+    # --- Servis thread'i ---
+    def run(self):
+        if self.use_com:
+            import pythoncom
+            pythoncom.CoInitialize()
+        try:
+            while True:
+                try:
+                    request = self.requests.get(timeout=self.health_interval)
+                except queue.Empty:
+                    self.health_check()
+                    continue
+                if request is None:
+                    break
+                self._execute(request)
+        finally:
+            self._release()
+            if self.use_com:
+                import pythoncom
+                pythoncom.CoUninitialize()
+
+    def _execute(self, request):
+        if not request.future.set_running_or_notify_cancel():
+            return
+        self.request_count += 1
+        handler = getattr(self, f"_do_{request.kind}")
+        try:
+            try:
+                result = handler(*request.args, **request.kwargs)
+            except Exception:
+                # Bağlantı koptuysa yeniden bağlanıp bir kez dene; değilse hata isteğindir
+                if request.kind == "probe" or self.catia is None or self.health_check():
+                    raise
+                result = handler(*request.args, **request.kwargs)
+            request.future.set_result(result)
+        except Exception as e:
+            request.future.set_exception(e)
+
+    def health_check(self):
+        """Bağlantı sağlıklıysa True; kopmuşsa bağlantıyı bırakır ve False döner"""
+        if self.catia is None:
+            return True
+        try:
+            self.catia.Name
+            return True
+        except Exception as e:
+            APP_LOGGER.warning(f"CATIA bağlantısı koptu, yeniden bağlanılacak: {e}")
+            self.catia = None
+            self.param_cache = None
+            return False
+
+    def ensure_catia(self):
+        if self.catia is None:
+            self.catia = self.connector()
+            self.param_cache = None
+            if self.connects:
+                self.reconnects += 1
+            self.connects += 1
+            APP_LOGGER.info(f"COM servisi: CATIA bağlantısı kuruldu (#{self.connects})")
+        return self.catia
+
+    def ensure_cache(self):
+        """Servis önbelleği; aktif döküman her istekte değil, satır başına bir kez
+        check_document isteğiyle kontrol edilir"""
+        catia = self.ensure_catia()
+        if self.param_cache is None:
+            self.param_cache = CatiaParameterCache(catia)
+        return self.param_cache
+
+    def _release(self):
+        if self.excel is not None:
+            try:
+                self.excel.Quit()
+            except Exception as e:
+                APP_LOGGER.warning(f"Excel kapatılamadı: {e}")
+        self.excel = None
+        self.catia = None
+        self.param_cache = None
+
+    def _marshal(self, obj):
+        if not self.use_com:
+            return obj
+        import pythoncom
+        return ("stream", pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch, obj._oleobj_))
+
+    def _unmarshal(self, token):
+        if not self.use_com:
+            return token
+        import pythoncom
+        import win32com.client
+        disp = pythoncom.CoGetInterfaceAndReleaseStream(token[1], pythoncom.IID_IDispatch)
+        return win32com.client.Dispatch(disp)
+
+    # --- İstek işleyicileri ---
+    def _do_probe(self):
+        """Döner: {"connected": bool, "document": isim veya None, "error": mesaj veya None}"""
+        try:
+            self.health_check()  # Kopmuş bağlantı bırakılır, ensure_catia yeniden kurar
+            catia = self.ensure_catia()
+        except Exception as e:
+            return {"connected": False, "document": None, "error": str(e)}
+        try:
+            doc = catia.ActiveDocument
+            return {"connected": True, "document": doc.Name if doc else None, "error": None}
+        except Exception as e:
+            return {"connected": True, "document": None, "error": str(e)}
+
+    def _do_enumerate(self, scope=None):
+        """Aktif Part'taki parametreleri indeksler. Döner: {"count": parametre sayısı,
+        "names": tam yol ve son segment isimleri (CatiaParameterCache.index anahtarları)}.
+        İndeks servis önbelleğinde kalır; sonraki write_batch'ler Item() çağırmaz."""
+        cache = self.ensure_cache()
+        count = cache.build_index(scope)
+        return {"count": count, "names": sorted(cache.index)}
+
+    def _do_check_document(self, attach=False):
+        """Worker satır başına bir kez çağırır: aktif döküman değiştiyse servis önbelleği yenilenir.
+        Döner: değiştiyse (veya attach=True ise) (worker thread'ine marshal edilmiş Part, yeni
+        dökümanın indeksli isimleri veya None), aksi halde None"""
+        fresh = self.param_cache is None
+        cache = self.ensure_cache()
+        if fresh or not cache.check_document() or attach:
+            return self._marshal(cache.part), sorted(cache.index) if cache.index is not None else None
+        return None
+
+    def _do_marshal_parameter(self, name):
+        """Parametre handle'ı worker thread'ine (design table ilişkilendirmesi)"""
+        return self._marshal(self.ensure_cache().get(name))
+
+    def _do_write_batch(self, ops, delta_tolerance=None):
+        """ops: (isim, değer) listesi. Döner: "1" yazıldı / "0" hata / "2" değişmedi (ops sırasında)"""
+        cache = self.ensure_cache()
+        status = []
+        for name, value in ops:
+            try:
+                if delta_tolerance is not None:
+                    try:
+                        if abs(float(cache.get_value(name)) - value) <= delta_tolerance:
+                            status.append("2")
+                            continue
+                    except (TypeError, ValueError):
+                        pass  # Sayısal olmayan parametre: karşılaştırmadan yaz (WorkerThread.write_parameter gibi)
+                cache.set_value(name, value)
+                status.append("1")
+            except Exception as e:
+                APP_LOGGER.error(f"COM servisi: {name} yazılamadı: {e}")
+                status.append("0")
+        return "".join(status)
+
+    def _do_update(self):
+        """part.Update(); döner: süre (sn)"""
+        cache = self.ensure_cache()
+        t0 = time.perf_counter()
+        cache.part.Update()
+        return time.perf_counter() - t0
+
+    def _do_call(self, func, *args):
+        """Serbest çağrı: func(catia, *args) servis thread'inde çalışır"""
+        return func(self.ensure_catia(), *args)
+
+    def _do_marshal_catia(self):
+        return self._marshal(self.ensure_catia())
+
+    def _do_marshal_excel(self):
+        if self.excel is None:
+            self.excel = self.excel_connector()
+        return self._marshal(self.excel)
+
+    def summary(self):
+        return {"COM Servisi": f"{self.request_count} istek, {self.connects} bağlantı, {self.reconnects} yeniden bağlanma"}
+
+class ServicePart:
+    """Worker'ın Part proxy'si yerine PartUpdatePolicy'ye verilir: Update() COM servisine
+    "update" isteği olarak gider, diğer öznitelikler proxy'ye iletilir."""
+    def __init__(self, service, part):
+        self.service = service
+        self.part = part
+
+    def Update(self):
+        return self.service.call("update")
+
+    def __getattr__(self, name):
+        return getattr(self.part, name)
+
+class ServiceParameterCache:
+    """Servis modunda worker'ın CatiaParameterCache'i: ActiveDocument/Part/Parameters servis
+    önbelleğinde çözülür, burada sadece worker thread'ine marshal edilmiş Part proxy'si tutulur
+    (ilişkiler, design table). Döküman kontrolü satır başına tek check_document isteğidir."""
+    def __init__(self, service):
+        self.service = service
+        self.names = None  # enumerate isteğinin döndürdüğü isimler (ön kontrol)
+        self.part = service._unmarshal(service.call("check_document", True)[0])
+
+    def build_index(self, scope=None):
+        result = self.service.call("enumerate", scope)
+        self.names = set(result["names"])
+        return result["count"]
+
+    def has(self, name):
+        return self.names is None or name in self.names
+
+    def check_document(self):
+        """Aktif döküman değiştiyse Part proxy'sini ve isimleri yenile. Değişmediyse True döner."""
+        changed = self.service.call("check_document")
+        if changed is None:
+            return True
+        token, names = changed
+        self.part = self.service._unmarshal(token)
+        if self.names is not None:
+            self.names = set(names or ())
+        return False
+
+    def get(self, name):
+        return self.service._unmarshal(self.service.call("marshal_parameter", name))
+
+    def summary(self):
+        cache = self.service.param_cache
+        return cache.summary() if cache else {}
+
+# ==========================================
+# ARAYÜZ OLAY KANALI (worker -> Tk thread)
+# ==========================================
+class UiEventChannel:
+    """Worker thread'lerinden arayüze tek yönlü olay kanalı.
+
+    Worker'lar Tk nesnelerine dokunmaz, app.after da çağırmaz. Sıralı olaylar (log
+    satırları, finish_process gibi tek seferlik çağrılar) bir deque'ya eklenir; ilerleme,
+    istatistik ve kuyruk doluluğu anahtar başına son değerle üzerine yazılır. deque
+    append/popleft ve dict atama/pop GIL altında atomik olduğundan kilit gerekmez.
+
+    Tk thread'i kanalı DRAIN_MS aralıklı tek zamanlayıcıyla boşaltır: durum anahtarları
+    tick başına en fazla bir kez uygulanır, log satırları tek render'la toplu eklenir.
+    """
+    DRAIN_MS = 50
+    MAX_EVENTS = 5000  # Tick başına en fazla sıralı olay; kalanı sonraki tick'e
+    LATEST_ORDER = (("max_progress", "update_max_progress"), ("stats", "update_stats"),
+                    ("queue_depth", "update_queue_depth"))
+
+    def __init__(self, app):
+        self.app = app
+        self._events = deque()
+        self._latest = {}
+        self._timer = None
+
+    # --- worker tarafı (herhangi bir thread) ---
+    def log(self, msg, type="info"):
+        self._events.append((None, (msg, type)))
+
+    def post(self, fn, *args):
+        """Tk thread'inde sırayla çalışacak tek seferlik çağrı"""
+        self._events.append((fn, args))
+
+    def max_progress(self, total):
+        self._latest["max_progress"] = (total,)
+
+    def stats(self, current, updates, errors):
+        self._latest["stats"] = (current, updates, errors)
+
+    def queue_depth(self, read_depth, write_depth):
+        self._latest["queue_depth"] = (read_depth, write_depth)
+
+    # --- Tk thread'i ---
+    def start(self):
+        if self._timer is None:
+            self._timer = self.app.after(self.DRAIN_MS, self._tick)
 
-def num2col(n):
-    """Sayıyı harfe çevirir (1->A, 27->AA)"""
-    string = ""
-    while n > 0:
-        n, remainder = divmod(n - 1, 26)
-        string = chr(65 + remainder) + string
-    return string
+    def stop(self):
+        if self._timer is not None:
+            self.app.after_cancel(self._timer)
+            self._timer = None
+
+    def _tick(self):
+        try:
+            self.drain()
+        except Exception as e:
+            APP_LOGGER.error(f"Arayüz olay kanalı hatası: {e}\n{traceback.format_exc()}")
+        finally:
+            self._timer = self.app.after(self.DRAIN_MS, self._tick)
+
+    def _apply_latest(self):
+        for key, method in self.LATEST_ORDER:
+            args = self._latest.pop(key, None)
+            if args is not None:
+                getattr(self.app, method)(*args)
+
+    def drain(self):
+        """Bekleyen olayları uygular (sadece Tk thread'inden)"""
+        self._apply_latest()
+        logs = []
+        for _ in range(min(len(self._events), self.MAX_EVENTS)):
+            fn, args = self._events.popleft()
+            if fn is None:
+                logs.append(args)
+                continue
+            if logs:
+                self.app.log_batch(logs)
+                logs = []
+            self._apply_latest()  # Tek seferlik çağrı (örn. finish_process) en güncel durumu görür
+            fn(*args)
+        if logs:
+            self.app.log_batch(logs)
 
 # ==========================================
 # ARKA PLAN İŞÇİSİ (DATA OKUMA & YAZMA)
@@ -315,31 +3935,97 @@ class WorkerThread(threading.Thread):
     def __init__(self, app, excel_path, config, dynamic_params):
         super().__init__()
         self.app = app
+        self.ui = app.events  # Arayüze sadece olay kanalıyla yazılır
         self.excel_path = excel_path
         self.config = config
         self.dynamic_params = dynamic_params # List of tuples: (Suffix, ColChar)
         self.running = True
         self.daemon = True
+        self.run_report = {}  # Results dosyasına yazılacak performans bilgileri
+        self.write_counts = {"written": 0, "skipped": 0, "unchanged": 0}
+        self.batch_session = None  # CatiaBatchSession (connect_catia içinde açılır)
+        self.relation_suspenders = []  # Part başına RelationSuspender
+        self.com = None  # CatiaComService: bağlantı servis üzerinden kurulduysa yazımlar istek olarak gider
+        self.logged_errors = 0  # Arayüze yazılan satır hatası sayısı (ilk 10)
 
     def run(self):
-        if TEST_MODE:
-            self.run_simulation()
-        else:
-            self.run_real_process()
+        com_initialized = False
+        try:
+            if WIN32COM_AVAILABLE and not TEST_MODE:
+                import pythoncom
+                pythoncom.CoInitialize()  # COM servisinden gelen proxy'ler bu thread'de kullanılır
+                com_initialized = True
+            if TEST_MODE:
+                self.run_simulation()
+            else:
+                self.run_real_process()
+        finally:
+            # Durdurma, hata veya normal bitiş: ilişkiler ve CATIA ekran/uyarı ayarları her durumda geri gelir
+            self.restore_relations()
+            self.end_batch_session()
+            if com_initialized:
+                pythoncom.CoUninitialize()
+
+    def end_batch_session(self):
+        if self.batch_session:
+            self.batch_session.restore()
+
+    def suspend_relations(self, part):
+        """Seçiliyse part'ın ilişkilerini yazma süresince devre dışı bırakır (part başına bir kez)"""
+        if part is None or not self.config.get("suspend_relations", False):
+            return
+        if any(s.part == part for s in self.relation_suspenders):
+            return
+        suspender = RelationSuspender(part, self.config.get("relations_filter", ""))
+        try:
+            suspender.measure_baseline()
+        except Exception as e:
+            APP_LOGGER.warning(f"Referans Update ölçülemedi: {e}")
+        try:
+            suspender.suspend()
+        except Exception as e:
+            APP_LOGGER.warning(f"Part.Relations okunamadı, ilişkiler açık kalacak: {e}")
+        self.relation_suspenders.append(suspender)
+
+    def restore_relations(self, update_policy=None, part=None):
+        """İlişkileri tekrar açar. update_policy verilirse son Update'i zorunlu kılar
+        (ilişkiler açıkken tek bir değerlendirme). part verilirse sadece o part'ınkiler
+        açılır ve listeden çıkar (döküman değişimi; part'a geri dönülürse yeniden kapatılır)."""
+        for suspender in list(self.relation_suspenders):
+            if part is not None:
+                if suspender.part != part:
+                    continue
+                self.relation_suspenders.remove(suspender)
+            count = len(suspender.deactivated)
+            if suspender.restore() and update_policy is not None:
+                update_policy.pending = True
+            if count:
+                self.run_report.update(suspender.summary(count))
+
+    def switch_document(self, param_cache, update_policy, previous_part):
+        """Aktif döküman yazma sırasında değişti: önceki part'ın ilişkileri açılıp bekleyen
+        Update'i o part'a uygulanır, sonra yeni part'ın ilişkileri kapatılır.
+        previous_part COM proxy'sidir (servis modunda da ServicePart değil)."""
+        self.restore_relations(update_policy, previous_part)
+        try:
+            self.finish_update(update_policy, previous_part)
+        except Exception as e:
+            APP_LOGGER.error(f"Önceki dökümanın son Update'i başarısız: {e}")
+        self.suspend_relations(param_cache.part)
 
     def run_simulation(self):
         sheet_name = self.config.get("sheet_name", "Sheet1")
-        self.app.log(f"Başladı: {sheet_name}", "info")
+        self.ui.log(f"Başladı: {sheet_name}", "info")
         
         # Dinamik parametreleri logla
         msg = "Parametreler: "
         for suffix, col in self.dynamic_params:
             msg += f"[{suffix}->{col}] "
-        self.app.log(msg, "info")
+        self.ui.log(msg, "info")
         
         time.sleep(1)
         total = 50
-        self.app.after(0, self.app.update_max_progress, total)
+        self.ui.max_progress(total)
         
         updates = 0
         errors = 0
@@ -347,25 +4033,16 @@ class WorkerThread(threading.Thread):
         for i in range(1, total + 1):
             if not self.running: break
             time.sleep(0.05)
-            # Progress güncelle
-            if hasattr(self.app, 'progress_bar'):
-                self.app.after(0, lambda x=i, t=total: self.app.progress_bar.set(x / t))
-            if hasattr(self.app, 'lbl_progress'):
-                self.app.after(0, lambda x=i, t=total: self.app.lbl_progress.configure(text=f"{x} / {t}"))
-            # İstatistikleri güncelle
-            if hasattr(self.app, 'card_success') and hasattr(self.app, 'card_error'):
-                self.app.after(0, lambda u=updates, e=errors: (
-                    self.app.card_success.configure(text=str(u)),
-                    self.app.card_error.configure(text=str(e))
-                ))
+            # Progress ve istatistikler (kanalda son değerle birleştirilir)
+            self.ui.stats(i, updates, errors)
             
             if i % 5 == 0:
                 updates += 1
                 # Örnek: İlk dinamik parametreyi update etmiş gibi yapalım
                 p_name = f"Rib_{i}_{self.dynamic_params[0][0]}" if self.dynamic_params else "Param"
-                self.app.after(0, self.app.log, f"{p_name} güncellendi.", "update")
+                self.ui.log(f"{p_name} güncellendi.", "update")
 
-        self.app.after(0, self.app.finish_process)
+        self.ui.post(self.app.finish_process)
 
     def run_real_process(self):
         """Gerçek işlem - Excel okuma ve CATIA yazma"""
@@ -375,8 +4052,8 @@ class WorkerThread(threading.Thread):
         try:
             APP_LOGGER.info("İşlem başlatıldı")
             
-            # openpyxl ile okuma (varsa, daha hızlı)
-            if OPENPYXL_AVAILABLE:
+            # openpyxl ile okuma (varsa, daha hızlı); CSV/TSV/Parquet openpyxl gerektirmez
+            if OPENPYXL_AVAILABLE or is_tabular_file(self.excel_path):
                 APP_LOGGER.info("openpyxl ile Excel okunuyor...")
                 self.run_with_openpyxl()
                 return
@@ -387,11 +4064,11 @@ class WorkerThread(threading.Thread):
             
             APP_LOGGER.info("win32com ile Excel okunuyor...")
             import win32com.client
-            import pythoncom
-            pythoncom.CoInitialize()
 
-            # Excel'i görünmez modda aç ve performans ayarları
-            excel = win32com.client.Dispatch("Excel.Application")
+            # Excel'i görünmez modda aç ve performans ayarları (COM servisi varsa kalıcı Excel örneği)
+            service = getattr(self.app, "com_service", None)
+            own_excel = service is None
+            excel = win32com.client.Dispatch("Excel.Application") if own_excel else service.excel_for_current_thread()
             excel.Visible = False  # Görünmez mod - daha hızlı
             excel.ScreenUpdating = False  # Ekran güncellemelerini kapat
             excel.DisplayAlerts = False  # Uyarıları kapat
@@ -424,7 +4101,7 @@ class WorkerThread(threading.Thread):
             # raw_data tuple of tuples döner. raw_data[satir_idx][sutun_idx]
             
             total_rows = len(raw_data) if raw_data else 0
-            self.app.after(0, self.app.update_max_progress, total_rows)
+            self.ui.max_progress(total_rows)
             
             updates = 0
             errors = 0
@@ -438,21 +4115,24 @@ class WorkerThread(threading.Thread):
                 # suffix boş string olsa bile ekle (sadece ID kullanılacak)
                 param_map.append((suffix if suffix else "", col_idx))
             
-            # CATIA bağlantısı (eğer gerekiyorsa)
-            catia = None
-            try:
-                catia = win32com.client.GetActiveObject("CATIA.Application")
-                # CATIA optimizasyonları
-                if catia:
-                    # Screen refresh'i kapat (batch update için)
-                    # catia.DisplayFileAlerts = False
-                    pass
-            except:
-                pass  # CATIA yoksa devam et
+            # CATIA bağlantısı (batch modu açıksa ekran yenileme/uyarılar kapatılır)
+            catia = self.connect_catia()
             
             # Batch update için değişiklikleri topla
             batch_size = 50  # Her 50 satırda bir UI güncelle
             last_update = 0
+            update_policy = PartUpdatePolicy.from_config(self.config)
+            APP_LOGGER.info(f"Güncelleme politikası: {update_policy.describe()}")
+            
+            # Part/Parameters bir kez çözülür, handle'lar önbellekte tutulur
+            param_cache = self.parameter_cache(catia)
+            part = self.update_target(param_cache)
+            self.preflight_parameters(param_cache, raw_data or [], param_map)
+            self.suspend_relations(param_cache.part if param_cache else None)
+            
+            def is_missing(op):
+                # Ön kontrolün eksik kümesi değil aktif dökümanın indeksi (döküman değişiminde yenilenir)
+                return param_cache is not None and not self.has_parameter(param_cache, op.name)
             
             # DÖNGÜ (optimize edilmiş)
             if raw_data:
@@ -462,80 +4142,52 @@ class WorkerThread(threading.Thread):
                 for i, row in enumerate(data_list):
                     if not self.running: break
                     
-                    # ID Okuma (A Sütunu -> index 0)
-                    try: 
-                        id_val = row[0] if len(row) > 0 else None
-                    except: 
-                        continue
-                    
-                    if not id_val: continue
-                    
-                    # ID Formatlama (optimize edilmiş)
-                    if isinstance(id_val, float) and id_val.is_integer():
-                        id_str = str(int(id_val))
-                    else:
-                        id_str = str(id_val).strip()
-                    
+                    # ID (A sütunu) + parametreler; CATIA adı ID + suffix (suffix boşsa sadece ID)
+                    id_str, ops, row_errors = row_to_ops(i + 2, row, param_map)
                     if not id_str: continue
                     
-                    # Dinamik Parametreleri Güncelle
-                    row_updates = 0
-                    for suffix, col_idx in param_map:
-                        if col_idx < len(row):
-                            val = row[col_idx]
-                            if val is not None and val != "":
-                                # CATIA Parametre Adı: ID + Suffix (suffix boş olsa bile ID kullan)
-                                # Eğer suffix boşsa, sadece ID kullanılır (örn: "10" yerine "10Thickness" değil "10")
-                                full_name = id_str + (suffix if suffix else "")
-                                
-                                # --- CATIA YAZMA KODU ---
-                                try:
-                                    # Değeri doğrula
-                                    validated_value = validate_parameter_value(val, full_name)
-                                    
-                                    if catia:
-                                        # CATIA'ya parametre yaz
-                                        try:
-                                            doc = catia.ActiveDocument
-                                            part = doc.Part
-                                            param = part.Parameters.Item(full_name)
-                                            param.Value = validated_value
-                                            # Parametreyi güncelle
-                                            part.Update()
-                                            APP_LOGGER.debug(f"{full_name} = {validated_value}")
-                                        except Exception as catia_err:
-                                            APP_LOGGER.error(f"CATIA parametresi yazılamadı ({full_name}): {catia_err}")
-                                            raise
-                                    
-                                    updates += 1
-                                    row_updates += 1
-                                except ValueError as ve:
-                                    errors += 1
-                                    APP_LOGGER.warning(f"Doğrulama hatası - Satır {i+2}: {ve}")
-                                    if errors <= 10:
-                                        self.app.after(0, self.app.log, f"Satır {i+2}: {str(ve)}", "error")
-                                except Exception as e:
-                                    errors += 1
-                                    APP_LOGGER.error(f"Beklenmeyen hata - Satır {i+2}: {e}\n{traceback.format_exc()}")
-                                    if errors <= 10:
-                                        self.app.after(0, self.app.log, f"Satır {i+2}: {full_name} = {str(e)}", "error")
+                    # Aktif döküman değiştiyse handle'ları yenile (satır başına tek COM çağrısı)
+                    if param_cache:
+                        previous_part = param_cache.part
+                        if not param_cache.check_document():
+                            self.switch_document(param_cache, update_policy, previous_part)
+                        part = self.update_target(param_cache)
+                    
+                    # Yaz (delta modunda değişmeyenler atlanır), Update politikaya göre
+                    row_updates, row_error_count = self.write_row(i + 2, ops, row_errors, param_cache, update_policy,
+                                                                  part, is_missing)
+                    updates += row_updates
+                    errors += row_error_count
                     
                     # Batch UI güncelleme (her N satırda bir veya son satır)
                     if (i + 1 - last_update >= batch_size) or (i + 1 == total_rows):
-                        self.app.after(0, self.app.update_stats, i+1, updates, errors)
+                        self.ui.stats(i+1, updates, errors)
                         last_update = i + 1
 
-            # Excel'i kapat
+            # İlişkiler tekrar açılır, bekleyen part.Update uygulanır (durdurulsa bile)
+            self.restore_relations(update_policy)
+            try:
+                self.finish_update(update_policy, part)
+            except Exception as upd_err:
+                errors += 1
+                APP_LOGGER.error(f"Son part.Update hatası: {upd_err}")
+            self.run_report.update(update_policy.summary())
+            self.run_report.update(self.write_summary())
+            if param_cache:
+                self.run_report.update(param_cache.summary())
+            
+            # Excel'i kapat (servisin Excel'i uygulama kapanana kadar açık kalır)
             wb.Close(False)
-            excel.Quit()
+            if own_excel:
+                excel.Quit()
             
             # Son güncelleme
-            self.app.after(0, self.app.update_stats, total_rows, updates, errors)
-            self.app.after(0, self.app.finish_process)
+            self.ui.stats(total_rows, updates, errors)
+            self.ui.post(self.app.finish_process)
 
         except Exception as e:
             APP_LOGGER.critical(f"Kritik hata (real_process): {e}\n{traceback.format_exc()}")
-            self.app.after(0, self.app.log, f"KRİTİK HATA: {e}", "error")
+            self.ui.log(f"KRİTİK HATA: {e}", "error")
             
             # Cleanup - Excel'i güvenli şekilde kapat
             try:
@@ -543,7 +4195,8 @@ class WorkerThread(threading.Thread):
                     APP_LOGGER.info("Excel kapatılıyor...")
                     if 'wb' in locals():
                         wb.Close(False)
-                    excel.Quit()
+                    if own_excel:
+                        excel.Quit()
                     APP_LOGGER.info("Excel kapatıldı")
             except Exception as cleanup_err:
                 APP_LOGGER.error(f"Excel cleanup hatası: {cleanup_err}")
@@ -556,50 +4209,115 @@ class WorkerThread(threading.Thread):
                 pass
             
             # İşlemi bitir
-            self.app.after(0, self.app.finish_process)
+            self.ui.post(self.app.finish_process)
 
     def run_with_openpyxl(self):
         """openpyxl ile hızlı Excel okuma ve işleme"""
         try:
+            # Akışlı mod: okuma ve yazma eşzamanlı (sadece parametre başına COM backend'i)
+            # Eşiği aşan dosyalar her zaman akışlı işlenir; tüm satırlar belleğe alınmaz
+            backend = self.config.get("write_backend", "com")
+            partial = bool(self.config.get("row_range") or self.config.get("id_filter"))
+            if self.config.get("multi_sheet", False) and not is_tabular_file(self.excel_path):
+                if partial:
+                    APP_LOGGER.info("Çoklu sayfa modunda satır aralığı / ID filtresi uygulanmaz")
+                    self.ui.log("Çoklu sayfa: satır aralığı / ID filtresi yok sayıldı", "info")
+                sheets = select_sheets(list_worksheets(self.excel_path), self.config.get("sheet_filter", ""))
+                if not sheets:
+                    raise ValueError(f"Sayfa filtresiyle eşleşen sayfa yok: '{self.config.get('sheet_filter', '')}'")
+                if backend != "com":
+                    APP_LOGGER.info(f"Çoklu sayfa: '{backend}' yerine parametre başına COM yazımı kullanılıyor")
+                    self.ui.log("Çoklu sayfa: parametre başına COM yazımı kullanılıyor", "info")
+                self.run_pipeline(sheets=sheets)
+                return
+            if self.is_large_file() and not partial:
+                if backend != "com":
+                    APP_LOGGER.info(f"Büyük dosya: '{backend}' yerine parametre başına COM yazımı kullanılıyor")
+                    self.ui.log("Büyük dosya: akışlı modda parametre başına COM yazımı kullanılıyor", "info")
+                self.run_pipeline(streaming=True)
+                return
+            if self.config.get("pipeline", False) and backend == "com" and not partial:
+                self.run_pipeline()
+                return
+            
             APP_LOGGER.info(f"openpyxl ile dosya açılıyor: {self.excel_path}")
             sheet_name = self.config.get("sheet_name", None)
             
+            # Parametre mapping'i hazırla; sadece ID + eşlenen sütunlar okunur
+            columns, param_map = project_columns(self.build_param_map())
+            
             # Excel'i oku
-            data, sheets = read_excel_openpyxl(self.excel_path, sheet_name)
+            t_read = time.perf_counter()
+            cache = ColumnarCache.from_config(self.config)
+            if partial:
+                # Kısmi çalıştırma: satır indeksinden sadece istenen satırlar (ilk seferde indeks kurulur)
+                row_range = self.config.get("row_range")
+                ids = self.config.get("id_filter") or None
+                row_numbers, data, missing_ids, status = read_row_subset(self.excel_path, sheet_name, columns, row_range, ids,
+                                                               self.config.get("native_reader", True), cache)
+                scope = []
+                if row_range:
+                    scope.append(f"satır {row_range[0]}-{row_range[1] or 'son'}")
+                if ids:
+                    scope.append(f"{len(ids)} ID")
+                self.run_report["Kısmi Çalıştırma"] = f"{', '.join(scope)}: {len(data)} satır ({status})"
+                self.ui.log(f"Kısmi çalıştırma ({', '.join(scope)}): {len(data)} satır", "info")
+                if missing_ids:
+                    listed = ", ".join(missing_ids[:50]) + (" ..." if len(missing_ids) > 50 else "")
+                    self.run_report["Bulunamayan ID'ler"] = listed
+                    self.ui.log(f"Seçilen satırlarda bulunamayan ID'ler: {listed}", "error")
+            else:
+                row_numbers, data, sheets = read_excel_table_cached(self.excel_path, sheet_name, columns,
+                                                                    self.config.get("native_reader", True), cache,
+                                                                    self.run_report)
+            if "Desteklenmeyen Formüller" in self.run_report:
+                self.ui.log("Hesaplanamayan formüller: "
+                               f"{self.run_report['Desteklenmeyen Formüller']}", "error")
+            if cache is not None and cache.last_status:
+                self.run_report["Excel Önbelleği"] = cache.last_status
+            self.run_report["Excel Okuma"] = f"{time.perf_counter() - t_read:.2f} sn ({len(columns)} sütun)"
             
             total_rows = len(data)
-            self.app.after(0, self.app.update_max_progress, total_rows)
+            self.ui.max_progress(total_rows)
             APP_LOGGER.info(f"Toplam {total_rows} satır okundu")
             
             updates = 0
             errors = 0
             
-            # Parametre mapping'i hazırla
-            param_map = []
-            for suffix, col_letter in self.dynamic_params:
-                if not col_letter:
-                    continue
-                col_idx = col2num(col_letter) - 1  # Python 0-based index
-                param_map.append((suffix, col_idx))
-            
-            APP_LOGGER.info(f"Parametre mapping: {param_map}")
-            
             # CATIA bağlantısı
-            catia = None
-            try:
-                if WIN32COM_AVAILABLE:
-                    import win32com.client
-                    catia = win32com.client.GetActiveObject("CATIA.Application")
-                    APP_LOGGER.info("CATIA bağlantısı başarılı")
-                else:
-                    APP_LOGGER.warning("win32com yok, CATIA'ya yazılamayacak (sadece simülasyon)")
-            except Exception as catia_err:
-                APP_LOGGER.warning(f"CATIA bağlanamadı: {catia_err}")
-                self.app.after(0, self.app.log, "CATIA bağlanamadı - sadece simülasyon modu", "error")
+            catia = self.connect_catia()
             
             # Batch güncelleme
             batch_size = 50
             last_update = 0
+            update_policy = PartUpdatePolicy.from_config(self.config)
+            APP_LOGGER.info(f"Güncelleme politikası: {update_policy.describe()}")
+            
+            # Part/Parameters bir kez çözülür, handle'lar önbellekte tutulur
+            param_cache = self.parameter_cache(catia)
+            part = self.update_target(param_cache)
+            backend = self.config.get("write_backend", "com")
+            if catia and backend == "designtable":
+                # Design table modunda parametre adları ID'siz suffix'lerdir, satırlar konfigürasyon
+                self.run_report["Yazma Backend'i"] = WRITE_BACKENDS["designtable"]
+                updates, errors, total_rows = self.run_design_table_backend(param_cache, data, param_map, update_policy,
+                                                                            row_numbers)
+                data = []  # Satır döngüsü atlanır
+            
+            missing_names = self.preflight_parameters(param_cache, data, param_map, row_numbers) if data else set()
+            if backend != "designtable" and param_cache:
+                self.suspend_relations(param_cache.part)  # Design table'ın kendisi de bir ilişki
+            
+            # Toplu CATScript backend'i (tek COM çağrısı / parça)
+            if catia and backend == "script":
+                self.run_report["Yazma Backend'i"] = WRITE_BACKENDS["script"]
+                updates, errors = self.run_script_backend(catia, param_cache, data, param_map,
+                                                          missing_names, update_policy, row_numbers)
+                data = []  # Satır döngüsü atlanır
+            
+            def is_missing(op):
+                # Ön kontrolün eksik kümesi değil aktif dökümanın indeksi (döküman değişiminde yenilenir)
+                return param_cache is not None and not self.has_parameter(param_cache, op.name)
             
             # Satırları işle
             for i, row in enumerate(data):
@@ -607,74 +4325,503 @@ class WorkerThread(threading.Thread):
                     APP_LOGGER.info("İşlem kullanıcı tarafından durduruldu")
                     break
                 
-                # ID oku (ilk sütun)
-                id_val = row[0] if len(row) > 0 else None
-                if not id_val:
-                    continue
-                
-                # ID formatla
-                if isinstance(id_val, (int, float)):
-                    id_str = str(int(id_val)) if float(id_val).is_integer() else str(id_val)
-                else:
-                    id_str = str(id_val).strip()
-                
+                # ID (ilk sütun) + doğrulanmış parametreler; hatalarda gerçek Excel satır numarası
+                row_no = row_numbers[i]
+                id_str, ops, row_errors = row_to_ops(row_no, row, param_map)
                 if not id_str:
                     continue
                 
-                # Parametreleri güncelle
-                row_updates = 0
-                for suffix, col_idx in param_map:
-                    if col_idx < len(row):
-                        val = row[col_idx]
-                        if val is not None and val != "":
-                            full_name = id_str + suffix
-                            
-                            try:
-                                # Değeri doğrula
-                                validated_value = validate_parameter_value(val, full_name)
-                                
-                                if catia:
-                                    # CATIA'ya yaz
-                                    try:
-                                        doc = catia.ActiveDocument
-                                        part = doc.Part
-                                        param = part.Parameters.Item(full_name)
-                                        param.Value = validated_value
-                                        part.Update()
-                                        APP_LOGGER.debug(f"{full_name} = {validated_value}")
-                                    except Exception as catia_err:
-                                        APP_LOGGER.error(f"CATIA yazma hatası ({full_name}): {catia_err}")
-                                        raise
-                                
-                                updates += 1
-                                row_updates += 1
-                                
-                            except ValueError as ve:
-                                errors += 1
-                                APP_LOGGER.warning(f"Doğrulama hatası - Satır {i+2}: {ve}")
-                                if errors <= 10:
-                                    self.app.after(0, self.app.log, f"Satır {i+2}: {str(ve)}", "error")
-                            except Exception as e:
-                                errors += 1
-                                APP_LOGGER.error(f"Hata - Satır {i+2}: {e}\n{traceback.format_exc()}")
-                                if errors <= 10:
-                                    self.app.after(0, self.app.log, f"Satır {i+2}: {full_name} = {str(e)}", "error")
+                # Aktif döküman değiştiyse handle'ları yenile (satır başına tek COM çağrısı)
+                if param_cache:
+                    previous_part = param_cache.part
+                    if not param_cache.check_document():
+                        self.switch_document(param_cache, update_policy, previous_part)
+                    part = self.update_target(param_cache)
+                
+                # Aktif dökümanın indeksinde olmayan parametreler COM çağrısı yapılmadan atlanır
+                row_updates, row_error_count = self.write_row(row_no, ops, row_errors, param_cache, update_policy,
+                                                              part, is_missing)
+                updates += row_updates
+                errors += row_error_count
                 
                 # Batch UI güncelleme
                 if (i + 1 - last_update >= batch_size) or (i + 1 == total_rows):
-                    self.app.after(0, self.app.update_stats, i+1, updates, errors)
+                    self.ui.stats(i+1, updates, errors)
                     last_update = i + 1
             
-            # Son güncelleme
-            self.app.after(0, self.app.update_stats, total_rows, updates, errors)
-            self.app.after(0, self.app.finish_process)
-            APP_LOGGER.info(f"İşlem tamamlandı - Başarılı: {updates}, Hata: {errors}")
+            self.finish_write_run(update_policy, param_cache, part, total_rows, updates, errors)
             
         except Exception as e:
             APP_LOGGER.error(f"Kritik hata (openpyxl): {e}\n{traceback.format_exc()}")
-            self.app.after(0, self.app.log, f"KRİTİK HATA: {e}", "error")
-            self.app.after(0, self.app.finish_process)
+            self.ui.log(f"KRİTİK HATA: {e}", "error")
+            self.ui.post(self.app.finish_process)
+    
+    def build_param_map(self):
+        """(suffix, 0-tabanlı sütun indeksi) listesi"""
+        param_map = []
+        for suffix, col_letter in self.dynamic_params:
+            if not col_letter:
+                continue
+            col_idx = col2num(col_letter) - 1  # Python 0-based index
+            param_map.append((suffix, col_idx))
+        APP_LOGGER.info(f"Parametre mapping: {param_map}")
+        return param_map
+    
+    def connect_catia(self):
+        """Çalışan CATIA'ya bağlanır; bağlanamazsa None (sadece simülasyon)"""
+        try:
+            service = getattr(self.app, "com_service", None)
+            if service is not None and not service.available:
+                service = None
+            if service is not None or WIN32COM_AVAILABLE:
+                if service is not None:
+                    # Kalıcı bağlantı: yazma/Update istek olarak servise, seyrek işlemler için
+                    # servis thread'inden bu thread'e marshal edilmiş proxy
+                    catia = service.catia_for_current_thread()
+                    self.com = service
+                else:
+                    import win32com.client
+                    catia = win32com.client.GetActiveObject("CATIA.Application")
+                APP_LOGGER.info("CATIA bağlantısı başarılı")
+                if self.config.get("catia_batch_mode", True) and self.batch_session is None:
+                    self.batch_session = CatiaBatchSession(catia)
+                    self.batch_session.begin()
+                    self.run_report.update(self.batch_session.summary())
+                return catia
+            APP_LOGGER.warning("win32com yok, CATIA'ya yazılamayacak (sadece simülasyon)")
+        except Exception as catia_err:
+            APP_LOGGER.warning(f"CATIA bağlanamadı: {catia_err}")
+            self.ui.log("CATIA bağlanamadı - sadece simülasyon modu", "error")
+        return None
+    
+    def finish_update(self, update_policy, part):
+        """Son Update; ilişkiler kapatıldıysa süresi ayrıca raporlanır"""
+        t0 = time.perf_counter()
+        update_policy.finish(part)
+        if self.relation_suspenders and "İlişkiler (Relations)" in self.run_report:
+            self.run_report["Son Update (ilişkiler açık)"] = f"{(time.perf_counter() - t0) * 1000:.0f} ms"
+    
+    def finish_write_run(self, update_policy, param_cache, part, total_rows, updates, errors):
+        """Bekleyen Update'i uygular, performans raporunu toplar ve UI'ya bitişi bildirir"""
+        # İlişkiler tekrar açılır, bekleyen part.Update uygulanır (durdurulsa bile)
+        self.restore_relations(update_policy)
+        try:
+            self.finish_update(update_policy, part)
+        except Exception as upd_err:
+            errors += 1
+            APP_LOGGER.error(f"Son part.Update hatası: {upd_err}")
+        self.run_report.update(update_policy.summary())
+        self.run_report.update(self.write_summary())
+        APP_LOGGER.info(f"part.Update: {update_policy.summary()}, {self.write_summary()}")
+        if param_cache:
+            self.run_report.update(param_cache.summary())
+            APP_LOGGER.info(f"Parametre önbelleği: {param_cache.summary()}")
+        service = getattr(self.app, "com_service", None)
+        if service is not None:
+            self.run_report.update(service.summary())
+        
+        # Son güncelleme
+        self.ui.stats(total_rows, updates, errors)
+        self.ui.post(self.app.finish_process)
+        APP_LOGGER.info(f"İşlem tamamlandı - Başarılı: {updates}, Hata: {errors}")
+    
+    def is_large_file(self):
+        """Dosya akışlı mod eşiğini (streaming_threshold_mb) aşıyor mu"""
+        try:
+            size = os.path.getsize(self.excel_path)
+        except OSError:
+            return False
+        return size > self.config.get("streaming_threshold_mb", STREAMING_THRESHOLD_MB) * 1024 * 1024
+
+    def run_pipeline(self, streaming=False, sheets=None):
+        """Akışlı işleme: okuyucu ve doğrulayıcı thread'ler satırları kuyruğa doldururken
+        bu thread (COM sahibi) gelen satırları hemen CATIA'ya yazar.
+
+        streaming: büyük dosya modu; satırlar sabit boyutlu parçalarla taşınır ve
+        önbellek kullanılmaz (önbellek isabeti tabloyu komple belleğe açardı).
+        İlerleme toplamı sayfanın <dimension> öğesinden gelir.
+
+        sheets: çoklu sayfa modu; sayfalar süreç havuzunda paralel ayrıştırılır,
+        yazma bu thread'de sayfa sırasıyla yapılır."""
+        t_start = time.perf_counter()
+        sheet_name = self.config.get("sheet_name", None)
+        columns, param_map = project_columns(self.build_param_map())
+        catia = self.connect_catia()
+        
+        update_policy = PartUpdatePolicy.from_config(self.config)
+        param_cache = self.parameter_cache(catia)
+        part = self.update_target(param_cache)
+        
+        # Akışta tüm isimler önceden bilinmez: indeks baştan kurulur, eksikler yazarken atlanır
+        if param_cache and self.config.get("preflight_check", True):
+            scope = self.config.get("parameter_scope", "") or None
+            indexed = self.index_parameters(param_cache, scope)
+            self.run_report["Ön Kontrol"] = f"{indexed} parametre indekslendi{f' ({scope})' if scope else ''} (akışlı)"
+        
+        self.suspend_relations(param_cache.part if param_cache else None)
+        native = self.config.get("native_reader", True)
+        if sheets:
+            workers = self.config.get("parse_workers", 0) or None
+            stop_event = threading.Event()
+            rows = iter_sheets_parallel(self.excel_path, sheets, columns, native,
+                                        ColumnarCache.from_config(self.config), workers, stop_event)
+            pipeline = ExcelWritePipeline(rows, param_map, self.config.get("pipeline_queue_size", 256),
+                                          self.config.get("pipeline_chunk_rows", 1), stop_event)
+            self.run_report["Okuma"] = (f"Paralel ayrıştırma: {len(sheets)} sayfa, "
+                                        f"en fazla {min(len(sheets), workers or os.cpu_count() or 1)} süreç")
+            self.run_report["Sayfalar"] = ", ".join(sheets)
+        elif streaming:
+            chunk_rows = self.config.get("streaming_chunk_rows", 500)
+            rows = iter_excel_rows_fast(self.excel_path, sheet_name, columns, native)
+            pipeline = ExcelWritePipeline(rows, param_map, self.config.get("streaming_queue_rows", 4000), chunk_rows)
+            size_mb = os.path.getsize(self.excel_path) / (1024 * 1024)
+            self.run_report["Okuma"] = f"Akışlı, büyük dosya ({size_mb:.0f} MB, {chunk_rows} satırlık parçalar)"
+        else:
+            cache = ColumnarCache.from_config(self.config)
+            rows = iter_excel_rows_cached(self.excel_path, sheet_name, columns, native, cache)
+            pipeline = ExcelWritePipeline(rows, param_map, self.config.get("pipeline_queue_size", 256),
+                                          self.config.get("pipeline_chunk_rows", 1))
+            self.run_report["Okuma"] = "Akışlı (okuma/doğrulama/yazma eşzamanlı)"
+        pipeline.start()
+        
+        updates = 0
+        errors = 0
+        processed = 0
+        total_rows = 0
+        last_update = 0
+        batch_size = 50
+        first_write = None
+        missing = {}
+        
+        def is_missing(op):
+            if not param_cache or self.has_parameter(param_cache, op.name):
+                return False
+            missing.setdefault(op.name, op.row)
+            return True
+        
+        try:
+            for item in pipeline:
+                if not self.running:
+                    APP_LOGGER.info("İşlem kullanıcı tarafından durduruldu")
+                    break
+                if item[0] == "total":
+                    total_rows = item[1]
+                    self.ui.max_progress(total_rows)
+                    self.ui.stats(processed, updates, errors)
+                    continue
+                if item[0] == "sheet":
+                    APP_LOGGER.info(f"Sayfa yazılıyor: {item[1]} ({item[2]} satır)")
+                    self.ui.log(f"Sayfa: {item[1]} ({item[2]} satır)", "info")
+                    continue
+                
+                _, row_no, ops, row_errors = item
+                processed += 1
+                
+                if param_cache:
+                    previous_part = param_cache.part
+                    if not param_cache.check_document():
+                        self.switch_document(param_cache, update_policy, previous_part)
+                    part = self.update_target(param_cache)
+                
+                row_updates, row_error_count = self.write_row(row_no, ops, row_errors, param_cache, update_policy,
+                                                              part, is_missing)
+                updates += row_updates
+                errors += row_error_count
+                if row_updates and param_cache and first_write is None:
+                    first_write = time.perf_counter() - t_start
+                
+                if processed - last_update >= batch_size:
+                    self.ui.stats(processed, updates, errors)
+                    self.ui.queue_depth(*pipeline.depths())
+                    last_update = processed
+        finally:
+            pipeline.stop()
+            self.ui.queue_depth(None, None)
+        
+        if missing:
+            listed = [f"{name} (satır {row})" for name, row in missing.items()]
+            APP_LOGGER.warning(f"CATIA'da bulunamayan parametreler ({len(missing)}): {', '.join(listed)}")
+            self.run_report["Eksik Parametreler"] = ", ".join(listed[:50]) + (" ..." if len(listed) > 50 else "")
+            sample = ", ".join(listed[:10]) + (" ..." if len(listed) > 10 else "")
+            self.ui.log(f"{len(missing)} parametre CATIA'da bulunamadı, atlandı: {sample}", "error")
+        if first_write is not None:
+            self.run_report["İlk Yazmaya Kadar"] = f"{first_write * 1000:.0f} ms"
+        
+        self.finish_write_run(update_policy, param_cache, part, max(processed, total_rows) if self.running else processed,
+                              updates, errors)
     
+    def parameter_cache(self, catia):
+        """Çalışma başına parametre önbelleği; servis modunda servis önbelleğinin worker tarafı"""
+        if catia is None:
+            return None
+        if self.com is not None:
+            return ServiceParameterCache(self.com)
+        return CatiaParameterCache(catia)
+
+    def update_target(self, param_cache):
+        """PartUpdatePolicy'nin Update çağıracağı nesne: servis modunda ServicePart
+        ("update" isteği), aksi halde Part proxy'si"""
+        if param_cache is None:
+            return None
+        if self.com is not None:
+            return ServicePart(self.com, param_cache.part)
+        return param_cache.part
+
+    def index_parameters(self, param_cache, scope):
+        """Ön kontrol için parametre indeksini kurar (servis modunda enumerate isteği).
+        Döner: indekslenen parametre sayısı"""
+        return param_cache.build_index(scope)
+
+    def has_parameter(self, param_cache, name):
+        """İsim aktif dökümanın indeksinde var mı; döküman değişiminde indeks yenilendiği için
+        satır döngüleri ön kontrolün eksik kümesi yerine bunu kullanır"""
+        return param_cache.has(name)
+
+    def log_row_error(self, row_no, msg):
+        """Satır hatasını arayüze yazar (ilk 10 hata; tamamı log dosyasında)"""
+        if self.logged_errors < 10:
+            self.logged_errors += 1
+            self.ui.log(f"Satır {row_no}: {msg}", "error")
+
+    def write_ops(self, param_cache, update_policy, part, ops):
+        """Bir satırın doğrulanmış WriteOp'larını CATIA'ya yazar.
+
+        Servis modunda op'lar tek write_batch isteğiyle gider ("parameter" politikasında
+        her parametre ayrı istek, ardından update isteği); aksi halde write_parameter ile
+        tek tek. Döner: (yazılan sayısı, [(op, hata mesajı)])
+        """
+        written = 0
+        failed = []
+        if self.com is None:
+            for op in ops:
+                try:
+                    if self.write_parameter(param_cache, update_policy, op.name, op.value) == "written":
+                        written += 1
+                        APP_LOGGER.debug(f"{op.name} = {op.value}")
+                except Exception as e:
+                    APP_LOGGER.error(f"CATIA yazma hatası ({op.name}): {e}\n{traceback.format_exc()}")
+                    failed.append((op, str(e)))
+            return written, failed
+        
+        delta = self.config.get("delta_tolerance", 1e-6) if self.config.get("delta_sync", False) else None
+        batches = [[op] for op in ops] if update_policy.mode == "parameter" else [ops]
+        for batch in batches:
+            if not batch:
+                continue
+            try:
+                status = self.com.call("write_batch", [(op.name, op.value) for op in batch], delta)
+            except Exception as e:
+                APP_LOGGER.error(f"write_batch isteği başarısız (satır {batch[0].row}): {e}")
+                failed.extend((op, str(e)) for op in batch)
+                continue
+            for op, code in zip(batch, status):
+                if code == "2":
+                    self.write_counts["unchanged"] += 1
+                elif code != "1":
+                    failed.append((op, "yazılamadı"))
+                else:
+                    try:
+                        update_policy.on_parameter_written(part)
+                    except Exception as e:
+                        failed.append((op, f"part.Update: {e}"))
+                        continue
+                    self.write_counts["written"] += 1
+                    written += 1
+        return written, failed
+
+    def write_row(self, row_no, ops, row_errors, param_cache, update_policy, part, is_missing):
+        """Tek satırı işler: doğrulama hataları, ön kontrolde eksik çıkanlar, yazma ve satır
+        sonu Update. is_missing(op) True dönen op'lar COM çağrısı yapılmadan atlanır.
+        Döner: (yazılan, hata)"""
+        errors = 0
+        for _, full_name, msg in row_errors:
+            errors += 1
+            APP_LOGGER.warning(f"Doğrulama hatası - Satır {row_no}: {msg}")
+            self.log_row_error(row_no, msg)
+        
+        to_write = []
+        for op in ops:
+            if is_missing(op):
+                errors += 1
+                self.write_counts["skipped"] += 1
+            else:
+                to_write.append(op)
+        
+        if param_cache:
+            updates, failed = self.write_ops(param_cache, update_policy, part, to_write)
+            for op, msg in failed:
+                errors += 1
+                self.log_row_error(row_no, f"{op.name} = {msg}")
+        else:
+            updates = len(to_write)  # CATIA yok: sadece simülasyon
+        
+        try:
+            update_policy.on_row_done(part)
+        except Exception as upd_err:
+            errors += 1
+            APP_LOGGER.error(f"part.Update hatası - Satır {row_no}: {upd_err}")
+        return updates, errors
+
+    def write_parameter(self, param_cache, update_policy, full_name, value):
+        """Tek parametreyi CATIA'ya yazar.
+
+        Delta modunda önce mevcut param.Value okunur; fark tolerans içindeyse
+        yazma ve part.Update yapılmaz. Döner: "written" veya "unchanged".
+        """
+        if self.config.get("delta_sync", False):
+            try:
+                current = float(param_cache.get_value(full_name))
+                if abs(current - value) <= self.config.get("delta_tolerance", 1e-6):
+                    self.write_counts["unchanged"] += 1
+                    return "unchanged"
+            except (TypeError, ValueError):
+                pass  # Sayısal olmayan parametre: karşılaştırmadan yaz
+        param_cache.set_value(full_name, value)
+        update_policy.on_parameter_written(param_cache.part)
+        self.write_counts["written"] += 1
+        return "written"
+
+    def run_script_backend(self, catia, param_cache, data, param_map, missing_names, update_policy, row_numbers=None):
+        """Toplu CATScript backend'i: plan parça parça tek ExecuteScript ile yazılır.
+        Döner: (updates, errors)"""
+        updates = 0
+        skipped = sum(1 for name in collect_parameter_names(data, param_map, row_numbers) if name in missing_names)
+        errors = skipped
+        self.write_counts["skipped"] += skipped
+        
+        ops, plan_errors = build_write_plan(data, param_map, missing_names, row_numbers)
+        for row_no, full_name, msg in plan_errors:
+            errors += 1
+            APP_LOGGER.warning(f"Doğrulama hatası - Satır {row_no}: {msg}")
+            if errors <= 10:
+                self.ui.log(f"Satır {row_no}: {msg}", "error")
+        
+        delta_tol = self.config.get("delta_tolerance", 1e-6) if self.config.get("delta_sync", False) else None
+        writer = CatiaScriptWriter(catia, self.config.get("script_chunk_size", 500), delta_tol)
+        part = self.update_target(param_cache)
+        APP_LOGGER.info(f"Script backend: {len(ops)} parametre, parça boyutu {writer.chunk_size}")
+        
+        try:
+            for chunk in writer.chunks(ops):
+                if not self.running:
+                    APP_LOGGER.info("İşlem kullanıcı tarafından durduruldu")
+                    break
+                try:
+                    status = writer.execute(chunk)
+                except Exception as e:
+                    # Parça tamamen başarısız: tüm parametreleri hata say
+                    status = "0" * len(chunk)
+                    APP_LOGGER.error(f"ExecuteScript hatası (satır {chunk[0].row}-{chunk[-1].row}): {e}\n{traceback.format_exc()}")
+                    self.ui.log(f"Script hatası (satır {chunk[0].row}-{chunk[-1].row}): {e}", "error")
+                
+                rows = status_by_row(chunk, status)
+                for row_no, (written, unchanged, failed) in rows.items():
+                    updates += len(written)
+                    self.write_counts["written"] += len(written)
+                    self.write_counts["unchanged"] += len(unchanged)
+                    if written:
+                        update_policy.pending = True
+                    for name in failed:
+                        errors += 1
+                        APP_LOGGER.error(f"CATIA yazma hatası - Satır {row_no}: {name}")
+                        if errors <= 10:
+                            self.ui.log(f"Satır {row_no}: {name} yazılamadı", "error")
+                
+                try:
+                    update_policy.on_rows_done(part, len(rows))
+                except Exception as upd_err:
+                    errors += 1
+                    APP_LOGGER.error(f"part.Update hatası - Satır {chunk[-1].row}: {upd_err}")
+                
+                # Excel satır no -> data index (başlık satırı 1)
+                self.ui.stats(chunk[-1].row - 1, updates, errors)
+        finally:
+            writer.cleanup()
+        
+        self.run_report.update(writer.summary())
+        return updates, errors
+
+    def run_design_table_backend(self, param_cache, data, param_map, update_policy, row_numbers=None):
+        """Design table backend'i: her satır bir konfigürasyon, konfigürasyon başına tek Update.
+        Döner: (updates, errors, konfigürasyon_sayısı)"""
+        updates = 0
+        errors = 0
+        columns = [suffix for suffix, _ in param_map]
+        if not all(columns) or len(set(columns)) != len(columns):
+            raise ValueError("Design table modunda her sütunun benzersiz bir CATIA parametre adı olmalı")
+        
+        writer = DesignTableWriter(self.excel_path, self.config.get("sheet_name", ""),
+                                   self.config.get("dt_hash_check", True))
+        for row_no, msg in writer.export(data, param_map, row_numbers):
+            errors += 1
+            APP_LOGGER.warning(f"Design table - Satır {row_no} atlandı: {msg}")
+            if errors <= 10:
+                self.ui.log(f"Satır {row_no}: {msg}", "error")
+        
+        table = writer.attach(param_cache.part, param_cache, columns)
+        configs = table.ConfigurationsNb
+        part = self.update_target(param_cache)
+        self.ui.max_progress(configs)
+        
+        last_update = 0
+        for k in range(1, configs + 1):
+            if not self.running:
+                APP_LOGGER.info("İşlem kullanıcı tarafından durduruldu")
+                break
+            try:
+                table.Configuration = k
+                update_policy.pending = True
+                update_policy.on_rows_done(part, 1)  # Parametre/satır politikası -> konfigürasyon başına Update
+                updates += len(columns)
+                self.write_counts["written"] += len(columns)
+            except Exception as e:
+                errors += 1
+                APP_LOGGER.error(f"Design table konfigürasyon {k} uygulanamadı: {e}")
+                if errors <= 10:
+                    self.ui.log(f"Konfigürasyon {k}: {e}", "error")
+            
+            if k - last_update >= 10 or k == configs:
+                self.ui.stats(k, updates, errors)
+                last_update = k
+        
+        self.run_report["Design Table"] = (f"{writer.path} ({configs} konfigürasyon, "
+                                           f"{'yeniden üretildi' if writer.regenerated else 'değişmedi'})")
+        return updates, errors, configs
+
+    def write_summary(self):
+        """Results dosyası için yazılan/atlanan/değişmeyen sayıları"""
+        c = self.write_counts
+        summary = {"Yazılan / Atlanan / Değişmeyen": f"{c['written']} / {c['skipped']} / {c['unchanged']}"}
+        if self.config.get("delta_sync", False):
+            summary["Delta Senkron"] = f"Açık (tolerans {self.config.get('delta_tolerance', 1e-6):g})"
+        return summary
+
+    def preflight_parameters(self, param_cache, data, param_map, row_numbers=None):
+        """Yazmadan önce sayfadaki tüm parametre isimlerini CATIA'ya karşı toplu kontrol eder.
+        Eksik isimler kümesi döner; yazma fazında bunlar COM çağrısı yapılmadan atlanır."""
+        if not param_cache or not self.config.get("preflight_check", True):
+            return set()
+        
+        scope = self.config.get("parameter_scope", "") or None
+        names = collect_parameter_names(data, param_map, row_numbers)
+        if self.com is not None:
+            t0 = time.perf_counter()
+            indexed = self.index_parameters(param_cache, scope)
+            missing = {name: row for name, row in names.items() if not param_cache.has(name)}
+            elapsed = time.perf_counter() - t0
+        else:
+            missing, indexed, elapsed = param_cache.preflight(names, scope)
+        
+        self.run_report["Ön Kontrol"] = (f"{indexed} parametre indekslendi{f' ({scope})' if scope else ''}, "
+                                         f"{len(names)} isim kontrol edildi, {len(missing)} eksik, {elapsed:.2f} sn")
+        if missing:
+            listed = [f"{name} (satır {row})" for name, row in missing.items()]
+            APP_LOGGER.warning(f"CATIA'da bulunamayan parametreler ({len(missing)}): {', '.join(listed)}")
+            self.run_report["Eksik Parametreler"] = ", ".join(listed[:50]) + (" ..." if len(listed) > 50 else "")
+            sample = ", ".join(listed[:10]) + (" ..." if len(listed) > 10 else "")
+            self.ui.log(f"{len(missing)} parametre CATIA'da bulunamadı, atlanacak: {sample}", "error")
+        return set(missing)
+
     def stop(self):
         self.running = False
         APP_LOGGER.info("Durdurma talebi alındı")
@@ -683,19 +4830,33 @@ class WorkerThread(threading.Thread):
 # EXCEL PREVIEW & ANALİZ
 # ==========================================
 class ExcelPreviewLoader(threading.Thread):
-    def __init__(self, app, path):
+    """Tek bir sayfanın önizlemesini arka planda okur (sheet_name None ise aktif sayfa).
+
+    Yeni bir sayfa seçilince önceki yükleyici cancel() ile iptal edilir; run() kitap
+    açıldıktan sonra, sayfa ve satır aralarında iptali kontrol edip okumayı bırakır.
+    İptal edilen yükleyicinin sonucu (ve hatası) arayüze hiç gönderilmez.
+    """
+    def __init__(self, app, path, sheet_name=None, key=None):
         super().__init__()
         self.app = app
         self.path = path
+        self.sheet_name = sheet_name
+        self.key = key  # PreviewLRU anahtarı
+        self.resolved_sheet = sheet_name  # sheet_name None ise okunan (aktif) sayfa
+        self.cancelled = threading.Event()
         self.daemon = True
 
+    def cancel(self):
+        self.cancelled.set()
+
     def run(self):
         try:
             data_preview = []
             sheets = []
             
             if TEST_MODE:
-                time.sleep(0.5)
+                if self.cancelled.wait(0.5):
+                    raise PreviewCancelled()
                 sheets = ["Visualization Data", "Sheet2"]
                 # Fake Data: Header + 5 Rows
                 data_preview = [
@@ -705,10 +4866,15 @@ class ExcelPreviewLoader(threading.Thread):
                     ["103", "5.4", "22.0", "ST", "14", "24", "34", "-", "-", "-", "1.7", "0.7", "2.2", "1.0"],
                     ["104", "5.6", "23.0", "ST", "16", "26", "36", "-", "-", "-", "1.8", "0.8", "2.3", "1.1"],
                 ]
-            elif OPENPYXL_AVAILABLE:
-                # openpyxl ile önizleme (daha hızlı)
+            elif OPENPYXL_AVAILABLE or is_tabular_file(self.path):
+                # openpyxl ile önizleme (daha hızlı); CSV/TSV/Parquet kendi okuyucusuyla
                 APP_LOGGER.info("openpyxl ile önizleme yükleniyor...")
-                data_preview, sheets = read_excel_preview_openpyxl(self.path, max_rows=10)
+                report = {}
+                data_preview, sheets = read_excel_preview_cached(self.path, max_rows=10,
+                                                                 cache=ColumnarCache.from_config(self.app.config),
+                                                                 sheet_name=self.sheet_name,
+                                                                 cancelled=self.cancelled, report=report)
+                self.resolved_sheet = report.get("sheet") or self.sheet_name
             elif WIN32COM_AVAILABLE:
                 # Fallback: win32com ile önizleme
                 APP_LOGGER.info("win32com ile önizleme yükleniyor...")
@@ -722,50 +4888,64 @@ class ExcelPreviewLoader(threading.Thread):
                 excel.EnableEvents = False
                 excel.Calculation = -4135  # xlCalculationManual
                 
-                wb = excel.Workbooks.Open(self.path, ReadOnly=True)
-                
-                # Sayfaları al
-                sheets = [s.Name for s in wb.Sheets]
-                
-                # İlk sayfadan önizleme al
-                ws = wb.Sheets(1)
-                
-                # En son dolu satır ve sütunu bul
-                last_row = ws.Cells(ws.Rows.Count, 1).End(-4162).Row  # xlUp = -4162
-                last_col = ws.Cells(1, ws.Columns.Count).End(-4159).Column  # xlToLeft = -4159
-                
-                # Maksimum 10 satır ve tüm sütunları oku
-                max_preview_rows = min(10, last_row)
-                end_col_letter = num2col(last_col)
-                
-                # Range oluştur (A1:SonSütun10)
-                range_str = f"A1:{end_col_letter}{max_preview_rows}"
-                vals = ws.Range(range_str).Value
-                
-                # Tuple to List (batch conversion)
-                if vals:
-                    if isinstance(vals, tuple):
-                        data_preview = [list(row) if row else [] for row in vals]
-                    else:
-                        data_preview = [list(row) if row else [] for row in [vals]]
-                
-                wb.Close(False)
-                excel.Quit()
+                try:
+                    raise_if_cancelled(self.cancelled)
+                    wb = excel.Workbooks.Open(self.path, ReadOnly=True)
+                    try:
+                        # Sayfaları al (iptal sayfa aralarında kontrol edilir)
+                        for ws in wb.Sheets:
+                            raise_if_cancelled(self.cancelled)
+                            sheets.append(ws.Name)
+                        
+                        # Seçili (yoksa ilk) sayfadan önizleme al
+                        ws = wb.Sheets(self.sheet_name) if self.sheet_name else wb.Sheets(1)
+                        self.resolved_sheet = ws.Name
+                        
+                        # En son dolu satır ve sütunu bul
+                        last_row = ws.Cells(ws.Rows.Count, 1).End(-4162).Row  # xlUp = -4162
+                        last_col = ws.Cells(1, ws.Columns.Count).End(-4159).Column  # xlToLeft = -4159
+                        raise_if_cancelled(self.cancelled)
+                        
+                        # Maksimum 10 satır ve tüm sütunları oku
+                        max_preview_rows = min(10, last_row)
+                        end_col_letter = num2col(last_col)
+                        
+                        # Range oluştur (A1:SonSütun10)
+                        range_str = f"A1:{end_col_letter}{max_preview_rows}"
+                        vals = ws.Range(range_str).Value
+                        
+                        # Tuple to List (batch conversion)
+                        if vals:
+                            if isinstance(vals, tuple):
+                                data_preview = [list(row) if row else [] for row in vals]
+                            else:
+                                data_preview = [list(row) if row else [] for row in [vals]]
+                    finally:
+                        wb.Close(False)
+                finally:
+                    excel.Quit()
             else:
                 raise ImportError("Excel okuma için openpyxl veya pywin32 gerekli")
 
-            self.app.after(0, self.app.update_ui_with_excel_data, sheets, data_preview)
+            raise_if_cancelled(self.cancelled)
+            if self.resolved_sheet is None and sheets:
+                self.resolved_sheet = sheets[0]
+            self.app.events.post(self.app.on_preview_loaded, self, sheets, data_preview)
 
+        except PreviewCancelled:
+            APP_LOGGER.info(f"Önizleme iptal edildi: {self.sheet_name or 'aktif sayfa'}")
         except Exception as e:
+            if self.cancelled.is_set():
+                return
             APP_LOGGER.error(f"Önizleme hatası: {e}\n{traceback.format_exc()}")
-            self.app.after(0, self.app.log, f"Önizleme hatası: {e}", "error")
+            self.app.events.log(f"Önizleme hatası: {e}", "error")
             
             # Hata detayını göster
             error_msg = f"Excel önizlemesi yüklenemedi:\n\n{str(e)}\n\n"
             if not OPENPYXL_AVAILABLE and not WIN32COM_AVAILABLE:
                 error_msg += "Çözüm: 'pip install openpyxl' veya 'pip install pywin32' ile gerekli kütüphaneleri yükleyin."
             
-            self.app.after(0, messagebox.showerror, "Önizleme Hatası", error_msg)
+            self.app.events.post(messagebox.showerror, "Önizleme Hatası", error_msg)
 
 # ==========================================
 # ÖZEL BUTON WIDGET'LARI
@@ -792,6 +4972,10 @@ class AutomationSuite(ctk.CTk):
         # Config
         self.config = {"sheet_name": "", "always_on_top": False}
         self.param_rows = [] 
+        
+        # CATIA/Excel COM bağlantılarının sahibi (uygulama ömrü boyunca tek STA thread'i)
+        self.com_service = CatiaComService()
+        self.com_service.start()
 
         # Tema ve Pencere
         ctk.set_appearance_mode("Dark")
@@ -882,13 +5066,22 @@ class AutomationSuite(ctk.CTk):
             APP_LOGGER.debug(f"Icon oluşturulamadı: {e}")
         
         # Değişkenler
-        self.log_entries = []
+        self.log_ring = LogRing()
+        self._log_view_seq = -1    # log kutusuna son eklenen kaydın seq'i
+        self._log_view_lines = 0   # log kutusundaki satır sayısı
         self.show_errors_only = False
+        self.throughput = ThroughputSeries()   # işlem hızı grafiğinin verisi
         self.preview_table = None
+        self.preview_grid = None   # PreviewGrid; yeniden yüklemede korunur
         self.tab_titles = {"monitor": "  🚀 Monitör  ", "settings": "  ⚙️ Ayarlar  "}
         self.current_run_has_error = False
         self.selected_file = None
+        self.workbook_meta = None  # probe_workbook sonucu (sayfalar + <dimension>)
+        self.preview_cache = PreviewLRU()
+        self.preview_loader = None  # Sürmekte olan ExcelPreviewLoader
+        self.preview_key = None     # Ekranda gösterilen önizlemenin LRU anahtarı
         self.worker = None
+        self.events = UiEventChannel(self)  # Worker/önizleme thread'lerinden gelen olaylar
         self.total_work = 1
         self.start_time = 0
         
@@ -918,6 +5111,7 @@ class AutomationSuite(ctk.CTk):
         self.bind("<Control-f>", lambda e: self.select_file())
         
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.events.start()
         
         # Pencereyi ekranın önüne getir
         self.lift()
@@ -1087,6 +5281,128 @@ class AutomationSuite(ctk.CTk):
                                      height=40, font=("Roboto", 14, "bold"), corner_radius=10, state="disabled")
         self.btn_stop.pack(fill="x", padx=20, pady=(0, 20))
 
+        # 3. Performans Kartı (CATIA yazma ayarları)
+        perf_card = ctk.CTkFrame(left_col, fg_color=THEME["bg_card"], corner_radius=15)
+        perf_card.pack(fill="x", pady=(0, 15))
+        self.perf_card = perf_card
+        
+        ctk.CTkLabel(perf_card, text="Performans", font=("Roboto", 16, "bold"), text_color=THEME["text_main"]).pack(anchor="w", padx=20, pady=(15, 10))
+        
+        ctk.CTkLabel(perf_card, text="part.Update() Politikası", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(anchor="w", padx=20)
+        self.combo_update_policy = ctk.CTkComboBox(perf_card, values=list(UPDATE_POLICIES.values()),
+                                                  fg_color=THEME["bg_dark"], border_color=THEME["border"],
+                                                  button_color=THEME["primary"],
+                                                  button_hover_color=THEME["primary_hover"],
+                                                  height=32, font=("Roboto", 12))
+        self.combo_update_policy.set(UPDATE_POLICIES["parameter"])
+        self.combo_update_policy.pack(fill="x", padx=20, pady=(2, 8))
+        
+        policy_opts = ctk.CTkFrame(perf_card, fg_color="transparent")
+        policy_opts.pack(fill="x", padx=20, pady=(0, 8))
+        ctk.CTkLabel(policy_opts, text="N satır:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left")
+        self.entry_update_rows = ctk.CTkEntry(policy_opts, width=60, height=28, justify="center",
+                                              fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_update_rows.insert(0, "50")
+        self.entry_update_rows.pack(side="left", padx=(5, 15))
+        ctk.CTkLabel(policy_opts, text="Hedef (ms):", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left")
+        self.entry_update_latency = ctk.CTkEntry(policy_opts, width=60, height=28, justify="center",
+                                                 fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_update_latency.insert(0, "500")
+        self.entry_update_latency.pack(side="left", padx=(5, 0))
+        
+        ctk.CTkLabel(perf_card, text="Parametre Seti / Kapsam (opsiyonel)", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(anchor="w", padx=20)
+        self.entry_param_scope = ctk.CTkEntry(perf_card, height=28, placeholder_text="Tüm Part",
+                                              fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_param_scope.pack(fill="x", padx=20, pady=(2, 8))
+        
+        self.chk_preflight = ctk.CTkCheckBox(perf_card, text="Ön kontrol (eksik parametreleri atla)",
+                                             font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_preflight.select()
+        self.chk_preflight.pack(anchor="w", padx=20, pady=(0, 8))
+        
+        delta_opts = ctk.CTkFrame(perf_card, fg_color="transparent")
+        delta_opts.pack(fill="x", padx=20, pady=(0, 8))
+        self.chk_delta_sync = ctk.CTkCheckBox(delta_opts, text="Sadece değişenleri yaz",
+                                              font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_delta_sync.pack(side="left")
+        ctk.CTkLabel(delta_opts, text="Tolerans:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left", padx=(15, 0))
+        self.entry_delta_tol = ctk.CTkEntry(delta_opts, width=70, height=28, justify="center",
+                                            fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_delta_tol.insert(0, "1e-6")
+        self.entry_delta_tol.pack(side="left", padx=(5, 0))
+        
+        rel_opts = ctk.CTkFrame(perf_card, fg_color="transparent")
+        rel_opts.pack(fill="x", padx=20, pady=(0, 8))
+        self.chk_suspend_relations = ctk.CTkCheckBox(rel_opts, text="İlişkileri yazarken kapat",
+                                                     font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_suspend_relations.pack(side="left")
+        ctk.CTkLabel(rel_opts, text="Filtre:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left", padx=(15, 0))
+        self.entry_relations_filter = ctk.CTkEntry(rel_opts, height=28, placeholder_text="Rule*, Check*",
+                                                   fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_relations_filter.pack(side="left", fill="x", expand=True, padx=(5, 0))
+        
+        ctk.CTkLabel(perf_card, text="Yazma Yöntemi", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(anchor="w", padx=20)
+        backend_opts = ctk.CTkFrame(perf_card, fg_color="transparent")
+        backend_opts.pack(fill="x", padx=20, pady=(2, 8))
+        self.combo_write_backend = ctk.CTkComboBox(backend_opts, values=list(WRITE_BACKENDS.values()),
+                                                  fg_color=THEME["bg_dark"], border_color=THEME["border"],
+                                                  button_color=THEME["primary"],
+                                                  button_hover_color=THEME["primary_hover"],
+                                                  height=32, font=("Roboto", 12))
+        self.combo_write_backend.set(WRITE_BACKENDS["com"])
+        self.combo_write_backend.pack(side="left", fill="x", expand=True)
+        ctk.CTkLabel(backend_opts, text="Parça:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left", padx=(10, 0))
+        self.entry_script_chunk = ctk.CTkEntry(backend_opts, width=60, height=28, justify="center",
+                                               fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_script_chunk.insert(0, "500")
+        self.entry_script_chunk.pack(side="left", padx=(5, 0))
+        
+        self.chk_dt_hash = ctk.CTkCheckBox(perf_card, text="Design table: sadece içerik değişince yenile",
+                                           font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_dt_hash.select()
+        self.chk_dt_hash.pack(anchor="w", padx=20, pady=(0, 8))
+        
+        self.chk_pipeline = ctk.CTkCheckBox(perf_card, text="Akışlı okuma (okurken yaz)",
+                                            font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_pipeline.pack(anchor="w", padx=20, pady=(0, 8))
+        
+        self.chk_native_reader = ctk.CTkCheckBox(perf_card, text="Hızlı xlsx okuyucu (desteklenmezse openpyxl)",
+                                                 font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_native_reader.select()
+        self.chk_native_reader.pack(anchor="w", padx=20, pady=(0, 8))
+        
+        self.chk_excel_cache = ctk.CTkCheckBox(perf_card, text="Okunan sayfaları önbelleğe al (Cache/)",
+                                               font=("Roboto", 12), fg_color=THEME["primary"],
+                                               command=lambda: self.config.update(excel_cache=bool(self.chk_excel_cache.get())))
+        self.chk_excel_cache.select()
+        self.chk_excel_cache.pack(anchor="w", padx=20, pady=(0, 8))
+        
+        self.chk_catia_batch = ctk.CTkCheckBox(perf_card, text="CATIA batch modu (ekran yenileme/uyarılar kapalı)",
+                                               font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_catia_batch.select()
+        self.chk_catia_batch.pack(anchor="w", padx=20, pady=(0, 8))
+        
+        sheet_opts = ctk.CTkFrame(perf_card, fg_color="transparent")
+        sheet_opts.pack(fill="x", padx=20, pady=(0, 8))
+        self.chk_multi_sheet = ctk.CTkCheckBox(sheet_opts, text="Çoklu sayfa (paralel ayrıştır)",
+                                               font=("Roboto", 12), fg_color=THEME["primary"])
+        self.chk_multi_sheet.pack(side="left")
+        ctk.CTkLabel(sheet_opts, text="Sayfalar:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left", padx=(15, 0))
+        self.entry_sheet_filter = ctk.CTkEntry(sheet_opts, height=28, placeholder_text="Boş: tümü  |  Gövde_*, Kanat*",
+                                               fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_sheet_filter.pack(side="left", fill="x", expand=True, padx=(5, 0))
+        
+        partial_opts = ctk.CTkFrame(perf_card, fg_color="transparent")
+        partial_opts.pack(fill="x", padx=20, pady=(0, 15))
+        ctk.CTkLabel(partial_opts, text="Satırlar:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left")
+        self.entry_row_range = ctk.CTkEntry(partial_opts, width=110, height=28, placeholder_text="4000-4200",
+                                            fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_row_range.pack(side="left", padx=(5, 0))
+        ctk.CTkLabel(partial_opts, text="ID'ler:", font=("Roboto", 12), text_color=THEME["text_muted"]).pack(side="left", padx=(15, 0))
+        self.entry_id_filter = ctk.CTkEntry(partial_opts, height=28, placeholder_text="Boş: tümü  |  Rib_1, Rib_7",
+                                            fg_color=THEME["bg_dark"], border_color=THEME["border"])
+        self.entry_id_filter.pack(side="left", fill="x", expand=True, padx=(5, 0))
+
         # --- SAĞ KOLON (İstatistik & Log) ---
         right_col = ctk.CTkFrame(self.tab_monitor, fg_color="transparent")
         right_col.grid(row=0, column=1, sticky="nsew")
@@ -1110,14 +5426,20 @@ class AutomationSuite(ctk.CTk):
         ctk.CTkLabel(header_frame, text="📊 İlerleme", font=("Roboto", 14, "bold")).pack(side="left")
         self.lbl_progress = ctk.CTkLabel(header_frame, text="0 / 0", text_color=THEME["text_muted"], font=("Roboto", 13))
         self.lbl_progress.pack(side="right")
+        self.lbl_queue = ctk.CTkLabel(header_frame, text="", text_color=THEME["text_muted"], font=("Roboto", 12))
+        self.lbl_queue.pack(side="right", padx=(0, 15))
         
         self.progress_bar = ctk.CTkProgressBar(progress_card, height=25, corner_radius=12,
                                               progress_color=THEME["primary"], 
                                               fg_color=THEME["bg_dark"],
                                               border_width=0)
-        self.progress_bar.pack(fill="x", padx=20, pady=(0, 20))
+        self.progress_bar.pack(fill="x", padx=20, pady=(0, 10))
         self.progress_bar.set(0)
         
+        # İşlem hızı grafiği (update_stats'tan beslenir)
+        self.throughput_chart = ThroughputChart(progress_card, self.throughput)
+        self.throughput_chart.pack(fill="x", padx=20, pady=(0, 20))
+        
         # 3. Terminal/Log Kartı
         log_card = ctk.CTkFrame(right_col, fg_color=THEME["bg_card"], corner_radius=15)
         log_card.pack(fill="both", expand=True)
@@ -1371,6 +5693,13 @@ class AutomationSuite(ctk.CTk):
             self.btn_clear_params.configure(state=state)
         if hasattr(self, "combo_sheet"):
             self.combo_sheet.configure(state=combo_state)
+        for widget_name in ("combo_update_policy", "entry_update_rows", "entry_update_latency",
+                            "entry_param_scope", "chk_preflight", "chk_delta_sync", "entry_delta_tol",
+                            "combo_write_backend", "entry_script_chunk", "chk_dt_hash", "chk_pipeline", "chk_native_reader", "chk_excel_cache",
+                            "chk_catia_batch", "chk_suspend_relations", "entry_relations_filter",
+                            "chk_multi_sheet", "entry_sheet_filter", "entry_row_range", "entry_id_filter"):
+            if hasattr(self, widget_name):
+                getattr(self, widget_name).configure(state=state)
         for row in self.param_rows:
             row["col"].configure(state=state)
             row["name"].configure(state=state)
@@ -1387,6 +5716,62 @@ class AutomationSuite(ctk.CTk):
     def on_sheet_change(self, value: str):
         self.config["sheet_name"] = value
         self.update_summary_label()
+        self.show_sheet_dimension(value)
+        self.request_preview(value)
+
+    def request_preview(self, sheet_name=None):
+        """Sayfa önizlemesini LRU'dan hemen göster ya da arka planda yükle (önceki yükleme iptal edilir)"""
+        if not self.selected_file:
+            return
+        try:
+            key = (PreviewLRU.file_identity(self.selected_file), sheet_name)
+        except OSError as e:
+            self.log(f"Önizleme için dosya okunamadı: {e}", "error")
+            return
+        if key == self.preview_key:
+            return
+        if self.preview_loader is not None:
+            self.preview_loader.cancel()
+            self.preview_loader = None
+        hit = self.preview_cache.get(key)
+        if hit is not None:
+            self.preview_key = key
+            self.update_ui_with_excel_data(*hit, sheet_name)
+            return
+        self.log(f"Önizleme oluşturuluyor{f' ({sheet_name})' if sheet_name else ''}...", "info")
+        self.preview_loader = ExcelPreviewLoader(self, self.selected_file, sheet_name, key)
+        self.preview_loader.start()
+
+    def on_preview_loaded(self, loader, sheets, data):
+        """ExcelPreviewLoader sonucu; yerine yenisi başlatılmış yükleyicinin sonucu atılır"""
+        if loader is not self.preview_loader or loader.cancelled.is_set():
+            return
+        self.preview_loader = None
+        key = loader.key
+        if loader.sheet_name is None and loader.resolved_sheet:
+            # Aktif sayfa okundu: sayfa adıyla kaydedilir, combo aynı sayfayı seçince tekrar okunmaz
+            key = (key[0], loader.resolved_sheet)
+        self.preview_key = key
+        if data:
+            self.preview_cache.put(key, (sheets, data))
+        self.update_ui_with_excel_data(sheets, data, loader.resolved_sheet)
+
+    def apply_workbook_metadata(self, meta):
+        """Meta veri sondası sonucunu önizleme beklemeden sayfa listesine ve ilerleme toplamına uygula"""
+        self.workbook_meta = meta
+        if not meta or not meta["sheets"] or not hasattr(self, 'combo_sheet'):
+            return
+        self.combo_sheet.configure(values=meta["sheets"])
+        self.combo_sheet.set(meta["active"])
+        self.on_sheet_change(meta["active"])
+
+    def show_sheet_dimension(self, sheet_name):
+        """<dimension> satır sayısını (başlık hariç) çalışma dışındayken ilerleme toplamı olarak göster"""
+        meta = self.workbook_meta
+        dim = meta["dimensions"].get(sheet_name) if meta else None
+        if not dim or (self.worker and self.worker.is_alive()):
+            return
+        self.update_max_progress(max(0, dim[0] - 1))
 
     def update_error_button_text(self):
         # Yeni tasarımda switch kullanıyoruz, text güncellemesi gerekmiyor
@@ -1398,7 +5783,9 @@ class AutomationSuite(ctk.CTk):
     def select_file(self):
         was_topmost = bool(self.attributes("-topmost"))
         self.attributes("-topmost", False)
-        path = ctk.filedialog.askopenfilename(filetypes=[("Excel Files", "*.xlsx *.xlsm *.xls")])
+        path = ctk.filedialog.askopenfilename(filetypes=[("Excel / Tablo Dosyaları", "*.xlsx *.xlsm *.xls *.csv *.tsv *.parquet"),
+                                                         ("Excel Files", "*.xlsx *.xlsm *.xls"),
+                                                         ("CSV / TSV / Parquet", "*.csv *.tsv *.parquet")])
         
         if path:
             if self.validate_excel_file(path):
@@ -1418,10 +5805,15 @@ class AutomationSuite(ctk.CTk):
         self.log(f"Dosya seçildi: {os.path.basename(path)}", "info")
         self.show_toast("Dosya Yüklendi", f"{os.path.basename(path)} hazır.", type="success")
         
+        # Sayfa listesi ve satır sayısı hemen (workbook.xml + <dimension>), önizleme arkadan gelir
+        self.preview_key = None
+        self.apply_workbook_metadata(probe_workbook(path))
+        
         # Tabı Ayarlar'a geçir (opsiyonel)
         # self.tab_view.set("  ⚙️ Ayarlar  ")
-        self.log("Önizleme oluşturuluyor...", "info")
-        ExcelPreviewLoader(self, path).start()
+        if not self.workbook_meta:
+            # Sonda kullanılamadı (.xls vb.): aktif sayfanın önizlemesi
+            self.request_preview(None)
         self.update_summary_label()
     
     def remove_file(self):
@@ -1434,6 +5826,11 @@ class AutomationSuite(ctk.CTk):
                               f"'{os.path.basename(self.selected_file)}' dosyasını kaldırmak istediğinize emin misiniz?"):
             # Dosyayı temizle
             self.selected_file = None
+            self.workbook_meta = None
+            self.preview_key = None
+            if self.preview_loader is not None:
+                self.preview_loader.cancel()
+                self.preview_loader = None
             
             # UI'yi güncelle
             if hasattr(self, 'lbl_file_info'):
@@ -1454,6 +5851,7 @@ class AutomationSuite(ctk.CTk):
                 
                 # Referansları temizle
                 self.preview_table = None
+                self.preview_grid = None
                 self.empty_state_frame = None
                 
                 # Yeni empty state oluştur
@@ -1488,19 +5886,22 @@ class AutomationSuite(ctk.CTk):
                 return False
             
             # Format kontrolü
-            if not path.lower().endswith(('.xlsx', '.xlsm', '.xls')):
-                self.log("Geçersiz dosya formatı! (.xlsx, .xlsm veya .xls olmalı)", "error")
+            if not path.lower().endswith(('.xlsx', '.xlsm', '.xls') + TABULAR_EXTENSIONS):
+                self.log("Geçersiz dosya formatı! (.xlsx, .xlsm, .xls, .csv, .tsv veya .parquet olmalı)", "error")
                 APP_LOGGER.error(f"Geçersiz format: {path}")
                 return False
+            if path.lower().endswith(".parquet") and not PYARROW_AVAILABLE:
+                self.log("Parquet dosyaları için pyarrow gerekli: 'pip install pyarrow'", "error")
+                APP_LOGGER.error(f"pyarrow yok, Parquet açılamaz: {path}")
+                return False
             
-            # Dosya boyutu kontrolü (max 100MB)
+            # Dosya boyutu kontrolü: büyük dosyalar reddedilmez, akışlı modda işlenir
             file_size = os.path.getsize(path)
-            max_size = 100 * 1024 * 1024  # 100 MB
-            if file_size > max_size:
+            threshold_mb = self.config.get("streaming_threshold_mb", STREAMING_THRESHOLD_MB)
+            if file_size > threshold_mb * 1024 * 1024:
                 size_mb = file_size / (1024 * 1024)
-                self.log(f"Dosya çok büyük! ({size_mb:.1f}MB - Max: 100MB)", "error")
-                APP_LOGGER.error(f"Dosya çok büyük: {size_mb:.1f}MB")
-                return False
+                self.log(f"Büyük dosya ({size_mb:.1f}MB): parça parça akışlı modda işlenecek", "info")
+                APP_LOGGER.info(f"Büyük dosya, akışlı mod: {size_mb:.1f}MB")
             
             # Dosya okuma izni kontrolü
             if not os.access(path, os.R_OK):
@@ -1516,196 +5917,38 @@ class AutomationSuite(ctk.CTk):
             APP_LOGGER.error(f"Validasyon hatası: {e}\n{traceback.format_exc()}")
             return False
 
-    def update_ui_with_excel_data(self, sheets, data):
-        # Sayfa listesini güncelle
+    def update_ui_with_excel_data(self, sheets, data, sheet_name=None):
+        # Sayfa listesini güncelle (sheet_name: önizlemesi okunan sayfa)
         self.combo_sheet.configure(values=sheets)
-        if sheets:
-            self.combo_sheet.set(sheets[0])
+        if sheets and self.combo_sheet.get() not in sheets:
+            # Meta veri sondası seçimi zaten yaptıysa kullanıcının seçimi korunur
+            self.combo_sheet.set(sheet_name if sheet_name in sheets else sheets[0])
             self.on_sheet_change(self.combo_sheet.get())
 
-        # preview_box içindeki TÜM widget'ları temizle
-        if hasattr(self, 'preview_box'):
-            for widget in self.preview_box.winfo_children():
+        # Boş durum / hata etiketi kaldırılır; tablo (PreviewGrid) yeniden kullanılır
+        grid = self.preview_grid if self.preview_grid is not None and self.preview_grid.winfo_exists() else None
+        for widget in self.preview_box.winfo_children():
+            if widget is not grid:
                 try:
                     widget.destroy()
                 except:
                     pass
-        
-        # Referansları temizle
-        self.preview_table = None
         self.empty_state_frame = None
             
         if not data:
+            if grid is not None:
+                grid.pack_forget()
             self.preview_table = ctk.CTkFrame(self.preview_box, fg_color="transparent")
             self.preview_table.pack(fill="both", expand=True, padx=15, pady=15)
             ctk.CTkLabel(self.preview_table, text="Veri okunamadı.", text_color="red").pack()
             return
         
-        # Daha iyi tablo görünümü için container
-        table_wrapper = ctk.CTkFrame(self.preview_box, fg_color="transparent")
-        table_wrapper.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Canvas ve scrollbar container
-        canvas_container = ctk.CTkFrame(table_wrapper, fg_color="transparent")
-        canvas_container.pack(fill="both", expand=True)
-        
-        # Canvas için frame
-        canvas_frame = ctk.CTkFrame(canvas_container, fg_color=THEME["bg_dark"], corner_radius=10)
-        canvas_frame.pack(fill="both", expand=True)
-        
-        # Canvas ve scrollbar
-        canvas = Canvas(canvas_frame, bg=THEME["bg_dark"], highlightthickness=0, 
-                       borderwidth=0, relief="flat")
-        h_scrollbar = ctk.CTkScrollbar(canvas_frame, orientation="horizontal", command=canvas.xview)
-        v_scrollbar = ctk.CTkScrollbar(canvas_frame, orientation="vertical", command=canvas.yview)
-        
-        scrollable_frame = ctk.CTkFrame(canvas, fg_color="transparent")
-        
-        canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        
-        def configure_scroll_region(event=None):
-            canvas.update_idletasks()
-            bbox = canvas.bbox("all")
-            if bbox:
-                canvas.configure(scrollregion=bbox)
-        
-        def configure_canvas_width(event):
-            # Canvas window genişliğini içeriğin genişliğine göre ayarla (yatay scroll için)
-            scrollable_frame.update_idletasks()
-            frame_width = scrollable_frame.winfo_reqwidth()
-            # İçeriğin genişliğine göre canvas window'u ayarla
-            if frame_width > 0:
-                canvas.itemconfig(canvas_window, width=frame_width)
-            configure_scroll_region()
-        
-        scrollable_frame.bind("<Configure>", configure_scroll_region)
-        canvas.bind("<Configure>", configure_canvas_width)
-        canvas.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
-        
-        # Layout
-        canvas.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
-        canvas_frame.grid_columnconfigure(0, weight=1)
-        canvas_frame.grid_rowconfigure(0, weight=1)
-        
-        # Tablo
-        self.preview_table = ctk.CTkFrame(scrollable_frame, fg_color="transparent")
-        self.preview_table.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        num_cols = len(data[0]) if data else 0
-        
-        # Grid column ayarları
-        self.preview_table.grid_columnconfigure(0, minsize=50)  # Satır numarası
-        for c_idx in range(num_cols):
-            self.preview_table.grid_columnconfigure(c_idx + 1, minsize=80)  # Her sütun
-        
-        # Başlık satırı
-        row_header = ctk.CTkLabel(self.preview_table, text="#", 
-                                 fg_color=THEME["bg_card_hover"],
-                                 font=("Roboto", 10, "bold"), height=32, corner_radius=6,
-                                 width=50)
-        row_header.grid(row=0, column=0, padx=3, pady=3, sticky="ew")
-        
-        # Sütun başlıkları
-        for c_idx in range(num_cols):
-            col_letter = num2col(c_idx + 1)
-            header = ctk.CTkLabel(self.preview_table, text=col_letter, 
-                                  fg_color=THEME["bg_card_hover"], 
-                                  font=("Roboto", 10, "bold"), height=32, 
-                                  corner_radius=6, width=80)
-            header.grid(row=0, column=c_idx+1, padx=3, pady=3, sticky="ew")
-
-        # Veri satırları
-        for r_idx, row_data in enumerate(data):
-            bg_row = THEME["bg_card"] if r_idx % 2 == 0 else THEME["bg_card_hover"]
-            
-            # Satır numarası
-            row_num = ctk.CTkLabel(self.preview_table, text=str(r_idx+1), 
-                                   text_color=THEME["text_muted"], 
-                                   font=("Roboto", 9),
-                                   fg_color=bg_row, height=28, width=50)
-            row_num.grid(row=r_idx+1, column=0, padx=3, pady=2, sticky="ew")
-            
-            # Hücreler
-            for c_idx, cell_val in enumerate(row_data):
-                val_str = str(cell_val) if cell_val is not None else ""
-                # Metin kısaltma
-                if len(val_str) > 15: 
-                    val_str = val_str[:13] + "..."
-                
-                cell = ctk.CTkLabel(self.preview_table, text=val_str, height=28,
-                                    fg_color=bg_row, font=("Consolas", 10), 
-                                    width=80, anchor="w", padx=6)
-                cell.grid(row=r_idx+1, column=c_idx+1, padx=3, pady=2, sticky="ew")
-        
-        # Canvas scroll ayarı - düzgün çalışması için
-        def update_scroll_region(event=None):
-            canvas.update_idletasks()
-            bbox = canvas.bbox("all")
-            if bbox:
-                canvas.configure(scrollregion=bbox)
-        
-        # Scrollable frame boyutunu ayarla
-        def on_frame_configure(event):
-            # İçeriğin genişliğine göre canvas window'u ayarla
-            scrollable_frame.update_idletasks()
-            frame_width = scrollable_frame.winfo_reqwidth()
-            if frame_width > 0:
-                canvas.itemconfig(canvas_window, width=frame_width)
-            update_scroll_region()
-        
-        def on_canvas_configure(event):
-            # Canvas genişliği değiştiğinde içeriğin genişliğine göre canvas window'u ayarla
-            scrollable_frame.update_idletasks()
-            frame_width = scrollable_frame.winfo_reqwidth()
-            if frame_width > 0:
-                canvas.itemconfig(canvas_window, width=frame_width)
-            update_scroll_region()
-        
-        scrollable_frame.bind("<Configure>", on_frame_configure)
-        canvas.bind("<Configure>", on_canvas_configure)
-        
-        # İlk güncelleme (biraz gecikme ile)
-        def initial_update():
-            canvas.update_idletasks()
-            scrollable_frame.update_idletasks()
-            update_scroll_region()
-        
-        canvas.after(100, initial_update)
-        
-        # Mouse wheel desteği (tüm platformlar için)
-        def on_mousewheel(event):
-            # Windows ve macOS
-            if sys.platform == "win32":
-                if event.state & 0x0001:  # Shift tuşu basılı
-                    canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-                else:
-                    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            elif sys.platform == "darwin":
-                if event.state & 0x0001:  # Shift tuşu basılı
-                    canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-                else:
-                    canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            else:
-                # Linux
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-        
-        if sys.platform == "win32" or sys.platform == "darwin":
-            canvas.bind("<MouseWheel>", on_mousewheel)
-        else:
-            canvas.bind("<Button-4>", on_mousewheel)
-            canvas.bind("<Button-5>", on_mousewheel)
-        
-        # Horizontal scroll için Shift+Wheel
-        def on_shift_wheel(event):
-            canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        if sys.platform in ["win32", "darwin"]:
-            canvas.bind("<Shift-MouseWheel>", on_shift_wheel)
+        # Sanal tablo: sadece görünen hücreler çizilir, binlerce satır/yüzlerce sütunda sabit maliyet
+        if grid is None:
+            grid = self.preview_grid = PreviewGrid(self.preview_box)
+        grid.pack(fill="both", expand=True, padx=5, pady=5)
+        grid.set_data(data)
+        self.preview_table = grid
         self.log("Önizleme yüklendi.", "success")
 
     def start_process(self):
@@ -1715,17 +5958,11 @@ class AutomationSuite(ctk.CTk):
             if not TEST_MODE:
                 catia_available = False
                 try:
-                    if WIN32COM_AVAILABLE:
-                        import win32com.client
-                        catia = win32com.client.GetActiveObject("CATIA.Application")
-                        if catia:
-                            # ActiveDocument kontrolü
-                            try:
-                                doc = catia.ActiveDocument
-                                if doc:
-                                    catia_available = True
-                            except:
-                                pass
+                    # Bağlantı ve ActiveDocument kontrolü COM servisi thread'inde
+                    probe = self.com_service.call("probe", timeout=10)
+                    catia_available = probe["connected"] and bool(probe["document"])
+                    if probe["error"]:
+                        APP_LOGGER.warning(f"CATIA kontrolü: {probe['error']}")
                 except Exception as e:
                     APP_LOGGER.warning(f"CATIA kontrolü: {e}")
                 
@@ -1766,13 +6003,19 @@ class AutomationSuite(ctk.CTk):
                 self.show_toast("Uyarı", "Lütfen bir Excel sayfası seçin!", type="warning")
                 return
             
+            # Performans ayarları
+            if not self.read_performance_settings():
+                return
+            
             # UI'yi hazırla
             self.tab_view.set("  🚀 Monitör  ")
             self.set_controls_state(False)
             self.set_running_state(True)
             self.btn_run.configure(state="disabled", text="ÇALIŞIYOR...", fg_color=THEME["bg_card_hover"])
-            self.log_entries.clear()
-            self.render_log()
+            self.log_ring.clear()
+            self.reset_log_view()
+            self.throughput.reset()
+            self.throughput_chart.redraw()
             self.current_run_has_error = False
             self.btn_stop.configure(state="normal")
             
@@ -1787,48 +6030,130 @@ class AutomationSuite(ctk.CTk):
             APP_LOGGER.error(f"İşlem başlatma hatası: {e}\n{traceback.format_exc()}")
             self.show_toast("Hata", f"İşlem başlatılamadı:\n{str(e)}", type="error")
 
+    def read_performance_settings(self):
+        """Performans kartındaki ayarları config'e aktarır"""
+        policy_label = self.combo_update_policy.get()
+        policy = next((k for k, v in UPDATE_POLICIES.items() if v == policy_label), None)
+        if policy is None:
+            self.show_toast("Hata", f"Geçersiz güncelleme politikası: '{policy_label}'", type="error")
+            return False
+        try:
+            batch_rows = int(self.entry_update_rows.get())
+            latency_ms = float(self.entry_update_latency.get())
+            if batch_rows < 1 or latency_ms <= 0:
+                raise ValueError
+        except ValueError:
+            self.show_toast("Hata", "N satır ve hedef gecikme pozitif sayı olmalı!", type="error")
+            return False
+        try:
+            delta_tol = float(self.entry_delta_tol.get())
+            if delta_tol < 0:
+                raise ValueError
+        except ValueError:
+            self.show_toast("Hata", "Tolerans negatif olmayan bir sayı olmalı!", type="error")
+            return False
+        backend_label = self.combo_write_backend.get()
+        backend = next((k for k, v in WRITE_BACKENDS.items() if v == backend_label), None)
+        if backend is None:
+            self.show_toast("Hata", f"Geçersiz yazma yöntemi: '{backend_label}'", type="error")
+            return False
+        try:
+            script_chunk = int(self.entry_script_chunk.get())
+            if script_chunk < 1:
+                raise ValueError
+        except ValueError:
+            self.show_toast("Hata", "Script parça boyutu pozitif tam sayı olmalı!", type="error")
+            return False
+        try:
+            row_range = parse_row_range(self.entry_row_range.get())
+        except ValueError:
+            self.show_toast("Hata", "Satır aralığı '4000-4200', '4000-' veya '4000' biçiminde olmalı!", type="error")
+            return False
+        
+        self.config["update_policy"] = policy
+        self.config["update_batch_rows"] = batch_rows
+        self.config["update_target_latency"] = latency_ms / 1000.0
+        self.config["parameter_scope"] = self.entry_param_scope.get().strip()
+        self.config["preflight_check"] = bool(self.chk_preflight.get())
+        self.config["delta_sync"] = bool(self.chk_delta_sync.get())
+        self.config["delta_tolerance"] = delta_tol
+        self.config["write_backend"] = backend
+        self.config["script_chunk_size"] = script_chunk
+        self.config["dt_hash_check"] = bool(self.chk_dt_hash.get())
+        self.config["pipeline"] = bool(self.chk_pipeline.get())
+        self.config["native_reader"] = bool(self.chk_native_reader.get())
+        self.config["excel_cache"] = bool(self.chk_excel_cache.get())
+        self.config["catia_batch_mode"] = bool(self.chk_catia_batch.get())
+        self.config["suspend_relations"] = bool(self.chk_suspend_relations.get())
+        self.config["relations_filter"] = self.entry_relations_filter.get().strip()
+        self.config["multi_sheet"] = bool(self.chk_multi_sheet.get())
+        self.config["sheet_filter"] = self.entry_sheet_filter.get().strip()
+        self.config["row_range"] = row_range
+        self.config["id_filter"] = parse_id_list(self.entry_id_filter.get())
+        return True
+
     # (Diğer yardımcı fonksiyonlar: log, update_stats vs. aynı kalır)
-    def log(self, msg, type="info"):
-        icons = {"info": "ℹ", "update": "⚡", "error": "✖", "success": "✔"}
+    def log_batch(self, items):
+        """Olay kanalından toplu gelen (mesaj, tip) satırları: hepsi eklenir, tek render"""
+        for msg, type in items:
+            self.log(msg, type, render=False)
+        self.render_log()
+
+    def log(self, msg, type="info", render=True):
         ts = datetime.datetime.now().strftime("%H:%M:%S")
-        self.log_entries.append({"ts": ts, "type": type, "icon": icons.get(type, ""), "msg": msg})
-        
-        max_logs = 5000
-        if len(self.log_entries) > max_logs:
-            self.log_entries = self.log_entries[-max_logs:]
+        self.log_ring.append(ts, type, msg)
         
         if type == "error":
             self.current_run_has_error = True
             # Btn rengini değiştirme, sadece status badge veya log yeterli
         
-        if not hasattr(self, '_log_render_count'):
-            self._log_render_count = 0
-        self._log_render_count += 1
-        if self._log_render_count % 10 == 0 or type in ["error", "success"]:
+        if render:
             self.render_log()
 
     def render_log(self):
-        """Log render'ını optimize et - sadece son 1000 satırı göster"""
-        self.log_box.configure(state="normal")
-        self.log_box.delete("1.0", "end")
-        
-        filtered = self.log_entries
+        """
+        Log kutusunu artımlı günceller: yalnızca son render'dan sonra gelen kayıtlar
+        sona eklenir, LOG_VIEW_LINES'ı aşan satırlar üstten silinir. Maliyet yeni satır
+        sayısıyla orantılıdır, halkadaki toplam log sayısından bağımsızdır.
+        """
+        ring = self.log_ring
         if self.show_errors_only:
-            filtered = [e for e in self.log_entries if e["type"] == "error"]
-        
-        max_display = 1000
-        if len(filtered) > max_display:
-            filtered = filtered[-max_display:]
-            self.log_box.insert("end", f"... ({len(self.log_entries) - max_display} eski log gizlendi) ...\n")
+            # Hata indeksini sondan geriye, görünümde olmayan ilk kayda kadar yürü
+            seqs = []
+            for seq in reversed(ring.errors):
+                if seq <= self._log_view_seq or len(seqs) >= LOG_VIEW_LINES:
+                    break
+                seqs.append(seq)
+            seqs.reverse()
+        else:
+            start = max(self._log_view_seq + 1, ring.first_seq, ring.next_seq - LOG_VIEW_LINES)
+            seqs = range(start, ring.next_seq)
+        self._log_view_seq = ring.next_seq - 1
+        if not seqs:
+            return
         
-        log_text = "\n".join([f"[{e['ts']}] {e['icon']} {e['msg']}" for e in filtered])
-        self.log_box.insert("end", log_text + "\n")
+        self.log_box.configure(state="normal")
+        self.log_box.insert("end", "\n".join(ring.get(seq).line() for seq in seqs) + "\n")
+        self._log_view_lines += len(seqs)
+        excess = self._log_view_lines - LOG_VIEW_LINES
+        if excess > 0:
+            self.log_box.delete("1.0", f"{excess + 1}.0")
+            self._log_view_lines = LOG_VIEW_LINES
         self.log_box.see("end")
         self.log_box.configure(state="disabled")
 
+    def reset_log_view(self):
+        """Log kutusunu boşaltıp halkadan yeniden kurar (filtre değişimi, yeni çalıştırma)"""
+        self.log_box.configure(state="normal")
+        self.log_box.delete("1.0", "end")
+        self.log_box.configure(state="disabled")
+        self._log_view_lines = 0
+        self._log_view_seq = self.log_ring.first_seq - 1
+        self.render_log()
+
     def toggle_error_filter(self):
         self.show_errors_only = not self.show_errors_only
-        self.render_log()
+        self.reset_log_view()
         
     # update_stats metodunu yukarıda tanımlamıştık, burada tekrar etmeye gerek yok
     # update_max_progress vb. metodlar...
@@ -1841,6 +6166,15 @@ class AutomationSuite(ctk.CTk):
         if hasattr(self, 'lbl_progress'):
             self.lbl_progress.configure(text=f"0 / {val}")
     
+    def update_queue_depth(self, read_depth, write_depth):
+        """Akışlı modda kuyruk doluluğu (None: gizle)"""
+        if not hasattr(self, 'lbl_queue'):
+            return
+        if read_depth is None:
+            self.lbl_queue.configure(text="")
+        else:
+            self.lbl_queue.configure(text=f"Kuyruk  okuma {read_depth} · yazma {write_depth}")
+    
     def update_stats(self, current, updates, errors):
         """İstatistikleri ve progress bar'ı güncelle"""
         # Progress bar
@@ -1850,6 +6184,10 @@ class AutomationSuite(ctk.CTk):
         if hasattr(self, 'lbl_progress'):
             self.lbl_progress.configure(text=f"{current} / {self.total_work}")
         
+        # İşlem hızı grafiği (yeni nokta oluştuysa yeniden çiz)
+        if self.throughput.add(time.perf_counter(), current) and hasattr(self, 'throughput_chart'):
+            self.throughput_chart.redraw()
+        
         # İstatistik kartları
         if hasattr(self, 'card_success'):
             self.card_success.configure(text=str(updates))
@@ -1908,6 +6246,24 @@ class AutomationSuite(ctk.CTk):
                 f.write(f"Hatalar: {errors}\n")
                 f.write(f"Başarı Oranı: {(updates/self.total_work*100) if self.total_work > 0 else 0:.1f}%\n")
                 f.write(f"Geçen Süre: {time.strftime('%M:%S', time.gmtime(elapsed_time))}\n")
+                
+                # Worker'ın topladığı performans bilgileri (politika, Update maliyeti, ...)
+                report = getattr(self.worker, "run_report", None)
+                if report:
+                    f.write(f"\nPerformans\n{'-'*50}\n")
+                    for key, value in report.items():
+                        f.write(f"{key}: {value}\n")
+                
+                # İşlem hızı serisi (grafikteki min/max seyreltilmiş kovalar)
+                series = self.throughput
+                if series.buckets:
+                    f.write(f"\nİşlem Hızı (satır/sn)\n{'-'*50}\n")
+                    f.write(f"Genel Ortalama: {series.overall():.1f}\n")
+                    f.write(f"Tepe (anlık): {series.peak:.1f}\n")
+                    f.write(f"Kova Genişliği: {series.span:g} sn\n")
+                    f.write(f"{'t (sn)':>8}  {'min':>9}  {'max':>9}  {'ortalama':>9}\n")
+                    for start, lo, hi, avg in series.buckets:
+                        f.write(f"{start:8.2f}  {lo:9.1f}  {hi:9.1f}  {avg:9.1f}\n")
             self.log(f"Sonuçlar otomatik kaydedildi: {os.path.basename(filename)}", "info")
         except Exception as e:
             self.log(f"Sonuç kaydedilemedi: {e}", "error")
@@ -1919,6 +6275,16 @@ class AutomationSuite(ctk.CTk):
             self.log("Durdurma talebi gönderildi.", "info")
     
     
+    def restore_catia_session(self):
+        """Worker zamanında bitmediyse CATIA batch ayarlarını yeni bir bağlantı ile geri yükler"""
+        session = getattr(self.worker, "batch_session", None)
+        if not session or not session.active:
+            return
+        try:
+            self.com_service.call("call", session.restore, timeout=5)
+        except Exception as e:
+            APP_LOGGER.error(f"CATIA ayarları geri yüklenemedi: {e}")
+    
     def on_closing(self):
         """Uygulama kapatılırken"""
         APP_LOGGER.info("Uygulama kapatılıyor...")
@@ -1928,11 +6294,17 @@ class AutomationSuite(ctk.CTk):
             if messagebox.askyesnocancel("Çıkış", "İşlem devam ediyor!\n\nYine de çıkmak istiyor musunuz?"):
                 self.worker.stop()
                 self.worker.join(timeout=2)
+                self.restore_catia_session()
+                self.events.stop()
+                self.com_service.shutdown()
                 self.destroy()
         else:
+            self.events.stop()
+            self.com_service.shutdown()
             self.destroy()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Paralel sayfa ayrıştırma, PyInstaller exe'sinde de süreç başlatabilsin
     APP_LOGGER.info("=" * 50)
     APP_LOGGER.info("AFT Sizing Automation - Başlatılıyor")
     APP_LOGGER.info(f"Test Modu: {TEST_MODE}")
@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Native xlsx okuyucu için uyumluluk seti ve hız karşılaştırması
+s2dgui4.read_excel_native çıktısını read_excel_openpyxl ile karşılaştırır;
+CSV/TSV/Parquet girişini de aynı tablo üzerinden xlsx yoluyla kıyaslar
+
+Kullanım:
+    python xlsx_native_check.py               # uyumluluk + formüller + benchmark (5000 x 200)
+    python xlsx_native_check.py 20000 200     # benchmark boyutu: satır sütun
+    python xlsx_native_check.py --bellek 500 200
+        # ~500 MB'lık kitabı akışlı modda işler; tepe bellek artışı 200 MB'ı aşarsa hata
+    python xlsx_native_check.py --tablo 100000 20
+        # aynı tablo xlsx / csv / tsv / parquet: satır/sn karşılaştırması
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import zipfile
+import tempfile
+import warnings
+import subprocess
+import csv
+
+try:
+    import openpyxl
+except ImportError:
+    print("⚠️ openpyxl bulunamadı. 'pip install openpyxl' ile yükleyin.")
+    sys.exit(1)
+
+import s2dgui4 as app
+
+# Elle yazılmış paketlerde openpyxl'in stil uyarıları karşılaştırmayı etkilemez
+warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+{sheets}
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+STYLES = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="{MAIN_NS}">
+<numFmts count="1"><numFmt numFmtId="164" formatCode="0.00&quot;mm&quot;"/></numFmts>
+<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="1"><fill><patternFill patternType="none"/></fill></fills>
+<borders count="1"><border/></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="3">
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>
+<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+</cellXfs>
+</styleSheet>"""
+
+SHARED_STRINGS = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<sst xmlns="{MAIN_NS}" count="6" uniqueCount="6">
+<si><t>ID</t></si>
+<si><t>Rib_1</t></si>
+<si><r><rPr><b/></rPr><t>Zengin</t></r><r><t xml:space="preserve"> metin</t></r></si>
+<si><t>Kaçış_x005F_x000D_</t></si>
+<si><t>Fonetik</t><rPh sb="0" eb="1"><t>FO</t></rPh></si>
+<si><t>A &amp; B &lt;C&gt; ğüşiöç</t></si>
+</sst>"""
+
+
+def build_xlsx(path, sheets, active_tab=0, shared=True, styles=True):
+    """Elle yazılmış XML'lerden xlsx paketi oluşturur. sheets: [(isim, sheetData XML, dimension veya None)]"""
+    sheet_entries = []
+    rels = []
+    overrides = []
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for i, (name, sheet_data, dimension) in enumerate(sheets, start=1):
+            dim = f'<dimension ref="{dimension}"/>' if dimension else ""
+            z.writestr(f"xl/worksheets/sheet{i}.xml",
+                       f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                       f'<worksheet xmlns="{MAIN_NS}" xmlns:r="{REL_NS}" '
+                       f'xmlns:x14ac="http://schemas.microsoft.com/office/spreadsheetml/2009/9/ac">'
+                       f'{dim}<sheetData>{sheet_data}</sheetData></worksheet>')
+            sheet_entries.append(f'<sheet name="{name}" sheetId="{i}" r:id="rId{i}"/>')
+            rels.append(f'<Relationship Id="rId{i}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>')
+            overrides.append(f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                             f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>')
+        n = len(sheets)
+        if shared:
+            rels.append(f'<Relationship Id="rId{n + 1}" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>')
+            z.writestr("xl/sharedStrings.xml", SHARED_STRINGS)
+        if styles:
+            rels.append(f'<Relationship Id="rId{n + 2}" Type="{REL_NS}/styles" Target="styles.xml"/>')
+            z.writestr("xl/styles.xml", STYLES)
+        z.writestr("[Content_Types].xml", CONTENT_TYPES.format(sheets="\n".join(overrides)))
+        z.writestr("_rels/.rels", ROOT_RELS)
+        z.writestr("xl/workbook.xml",
+                   f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                   f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">'
+                   f'<bookViews><workbookView activeTab="{active_tab}"/></bookViews>'
+                   f'<sheets>{"".join(sheet_entries)}</sheets></workbook>')
+        z.writestr("xl/_rels/workbook.xml.rels",
+                   f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                   f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                   f'{"".join(rels)}</Relationships>')
+    return path
+
+
+HEADER = '<row r="1"><c r="A1" t="s"><v>0</v></c></row>'
+
+# (isim, sheetData, dimension, beklenen: "ok" veya "fallback")
+CORPUS = [
+    ("sayılar ve tipler",
+     HEADER +
+     '<row r="2" spans="1:6" x14ac:dyDescent="0.25"><c r="A2" t="s"><v>1</v></c><c r="B2"><v>5</v></c>'
+     '<c r="C2"><v>5.25</v></c><c r="D2"><v>1E-3</v></c><c r="E2" t="b"><v>1</v></c><c r="F2" t="e"><v>#N/A</v></c></row>'
+     '<row r="3"><c r="A3"><v>102</v></c><c r="B3" t="b"><v>0</v></c><c r="C3" s="2"><v>-7</v></c></row>',
+     "A1:F3", "ok"),
+    ("metinler",
+     HEADER +
+     '<row r="2"><c r="A2" t="inlineStr"><is><t>Satır içi</t></is></c><c r="B2" t="s"><v>2</v></c>'
+     '<c r="C2" t="s"><v>3</v></c><c r="D2" t="s"><v>4</v></c><c r="E2" t="s"><v>5</v></c>'
+     '<c r="F2" t="inlineStr"><is><r><t>a</t></r><r><t>b</t></r></is></c></row>',
+     "A1:F2", "ok"),
+    ("formül önbellek değerleri",
+     HEADER +
+     '<row r="2"><c r="A2" t="str"><f>"R"&amp;1</f><v>R1</v></c><c r="B2"><f>1+1</f><v>2</v></c>'
+     '<c r="C2"><f>NOW()</f></c><c r="D2" t="str"><f>""</f><v></v></c></row>',
+     "A1:D2", "ok"),
+    ("boşluklu satır ve sütunlar",
+     HEADER +
+     '<row r="2"><c r="A2"><v>1</v></c><c r="E2"><v>5</v></c></row>'
+     '<row r="4" customHeight="1" ht="20"/>'
+     '<row r="6"><c r="A6"><v>6</v></c><c r="B6" s="0"/><c r="D6"><v>4</v></c></row>',
+     "A1:E6", "ok"),
+    ("r özniteliği olmayan satır/hücreler",
+     HEADER +
+     '<row><c t="s"><v>1</v></c><c><v>2</v></c><c><v>3</v></c></row>'
+     '<row><c><v>7</v></c><c/><c><v>9</v></c></row>',
+     "A1:C3", "ok"),
+    ("farklı öznitelik sırası",
+     HEADER +
+     '<row r="2"><c s="0" r="A2"><v>11</v></c><c t="n" r="B2"><v>2.5</v></c><c r="C2"><v>3</v></c></row>',
+     "A1:C2", "ok"),
+    ("dimension dışında kalan satırlar",
+     HEADER +
+     '<row r="2"><c r="A2"><v>1</v></c><c r="B2"><v>2</v></c></row>'
+     '<row r="3"><c r="A3"><v>3</v></c><c r="B3"><v>4</v></c><c r="C3"><v>5</v></c></row>',
+     "A1:B2", "ok"),
+    ("dimension yok",
+     HEADER +
+     '<row r="2"><c r="A2"><v>1</v></c><c r="C2"><v>3</v></c></row>'
+     '<row r="3"><c r="A3"><v>2</v></c></row>',
+     None, "ok"),
+    ("tarih biçimli hücre (openpyxl'e düşer)",
+     HEADER +
+     '<row r="2"><c r="A2"><v>1</v></c><c r="B2" s="1"><v>45000</v></c><c r="C2"><v>3</v></c></row>',
+     "A1:C2", "fallback"),
+]
+
+
+def compare_case(path, sheet_name, columns):
+    """Döner: ("ok" | "fallback" | "FARKLI", detay)"""
+    expected, expected_sheets = app.read_excel_openpyxl(path, sheet_name, columns)
+    try:
+        got, sheets = app.read_excel_native(path, sheet_name, columns)
+    except app.NativeXlsxUnsupported as e:
+        fast, _ = app.read_excel_fast(path, sheet_name, columns)
+        return ("fallback" if fast == expected else "FARKLI"), str(e)
+    if got != expected or sheets != expected_sheets:
+        return "FARKLI", f"\n      native:   {got}\n      openpyxl: {expected}"
+    return "ok", f"{len(got)} satır"
+
+
+def run_conformance(work_dir):
+    print("=" * 60)
+    print("Uyumluluk seti (native == openpyxl)")
+    print("=" * 60)
+    failures = 0
+    cases = []
+    for i, (name, sheet_data, dimension, expect) in enumerate(CORPUS):
+        path = build_xlsx(os.path.join(work_dir, f"case{i}.xlsx"), [("S", sheet_data, dimension)])
+        cases.append((name, path, None, expect))
+
+    # Çok sayfalı: aktif sayfa (activeTab) ve isimle seçim
+    multi = build_xlsx(os.path.join(work_dir, "multi.xlsx"), [
+        ("Birinci", HEADER + '<row r="2"><c r="A2"><v>1</v></c></row>', "A1:A2"),
+        ("İkinci", HEADER + '<row r="2"><c r="A2"><v>2</v></c><c r="B2"><v>3</v></c></row>', "A1:B2"),
+    ], active_tab=1)
+    cases.append(("aktif sayfa (activeTab=1)", multi, None, "ok"))
+    cases.append(("sayfa adıyla seçim", multi, "Birinci", "ok"))
+
+    # openpyxl'in kendi yazdığı dosya (paylaşılan metinler, stiller)
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Veri"
+    ws.append(["ID", "T", "H", "Malzeme", "Not"])
+    for r in range(1, 51):
+        ws.append([f"Rib_{r}", r * 0.5, r, "AL" if r % 2 else "ST", None if r % 3 else "x & y"])
+    ws.append([None, 1, 2])
+    ws.append([0, 1, 2])
+    generated = os.path.join(work_dir, "openpyxl.xlsx")
+    wb.save(generated)
+    cases.append(("openpyxl ile yazılmış dosya", generated, "Veri", "ok"))
+
+    for name, path, sheet_name, expect in cases:
+        for columns in (None, [0, 1, 3]):
+            status, detail = compare_case(path, sheet_name, columns)
+            mark = "✅" if status == expect else "❌"
+            if status != expect:
+                failures += 1
+            print(f"{mark} {name} [{'tüm sütunlar' if columns is None else 'projeksiyon'}]: {status} - {detail}")
+    print(f"\n{'✅ Tüm durumlar uyumlu' if not failures else f'❌ {failures} durum uyumsuz'}")
+    return failures
+
+
+def _formula_cell(ref, formula, t=None, shared=None):
+    """Önbellek değeri (<v>) olmayan formül hücresi: openpyxl vb. ile yazılıp Excel'de açılmamış dosyalar"""
+    attrs = f' t="{t}"' if t else ""
+    if shared is None:
+        f = f"<f>{formula}</f>"
+    elif formula:
+        f = f'<f t="shared" ref="{shared[1]}" si="{shared[0]}">{formula}</f>'
+    else:
+        f = f'<f t="shared" si="{shared[0]}"/>'
+    return f'<c r="{ref}"{attrs}>{f}</c>'
+
+
+def run_formula_check(work_dir):
+    print("=" * 60)
+    print("Formül değerlendirici (önbellek değeri olmayan formüller)")
+    print("=" * 60)
+    fc = _formula_cell
+    data = (
+        '<row r="1"><c r="A1" t="s"><v>0</v></c></row>'
+        '<row r="2"><c r="A2" t="inlineStr"><is><t>Rib_1</t></is></c><c r="B2"><v>10</v></c>'
+        + fc("C2", "B2*2+1", shared=(0, "C2:C3"))
+        + fc("D2", "SUM(B2:C2, 4)") + fc("E2", "ROUND(B2/3,2)")
+        + fc("F2", 'IF(B2&gt;5,"büyük","küçük")', t="str")
+        + fc("G2", "'ayar'!B1*B2") + fc("H2", "VLOOKUP(B2,Ayar!A1:B2,2,0)") + '</row>'
+        '<row r="3">' + fc("A3", '"Rib_"&amp;B3', t="str") + fc("B3", "B2+1")
+        + fc("C3", None, shared=(0, "C2:C3"))
+        + fc("D3", "MAX(C2:C3)-MIN($B$2:B3)") + fc("E3", "ROUND(-2.5,0)+ROUND(1234.5,-2)")
+        + fc("F3", "B2/(B3-11)") + fc("G3", "-2^2+10%") + fc("H3", "_xlfn.XLOOKUP(1,B2:B3,C2:C3)") + '</row>'
+        '<row r="4"><c r="A4" t="inlineStr"><is><t>Rib_4</t></is></c>'
+        + fc("B4", "D4+1") + fc("D4", "B4*2") + fc("E4", 'IF(A4="rib_4",B2&gt;=10)') + '</row>'
+    )
+    ayar = '<row r="1"><c r="A1"><v>1</v></c><c r="B1"><v>1.5</v></c></row>'
+    path = build_xlsx(os.path.join(work_dir, "formul.xlsx"),
+                      [("Veri", data, "A1:H4"), ("Ayar", ayar, "A1:B1")])
+    expected = [
+        ("Rib_1", 10, 21, 35, 3.33, "büyük", 15, "#NAME?"),
+        ("Rib_11", 11, 23, 13, -3 + 1200, "#DIV/0!", 4.1, "#NAME?"),
+        ("Rib_4", 1, None, 0, True, None, None, None),
+    ]
+    report = {}
+    _, got, _ = app.read_excel_table(path, "Veri", None, report=report)
+    failures = 0
+    for i, (want, row) in enumerate(zip(expected, got), start=2):
+        ok = list(want) == list(row)
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} satır {i}: {row}" + ("" if ok else f"\n      beklenen: {want}"))
+    if len(got) != len(expected):
+        failures += 1
+        print(f"❌ {len(got)} satır okundu, beklenen {len(expected)}")
+    for key, value in report.items():
+        print(f"   {key}: {value}")
+    if "VLOOKUP ×1" not in report.get("Desteklenmeyen Formüller", ""):
+        failures += 1
+        print("❌ Desteklenmeyen fonksiyon raporlanmadı")
+
+    # Kısmi çalıştırma: satır indeksi de hesaplanmış değerlerle kurulmalı (None değil)
+    cache = app.ColumnarCache(os.path.join(work_dir, "Cache"))
+    for label, subset_cache in (("önbelleksiz", None), ("indeks kurulumu", cache), ("indeksten", cache)):
+        numbers, rows, missing, status = app.read_row_subset(path, "Veri", None, (2, 3), ["Rib_11", "Yok"],
+                                                             cache=subset_cache)
+        ok = numbers == [3] and [tuple(r) for r in rows] == [expected[1]] and missing == ["Yok"]
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} kısmi okuma ({label}): satır {numbers} {rows} - {status}")
+    print(f"\n{'✅ Formüller doğru hesaplandı' if not failures else f'❌ {failures} formül kontrolü başarısız'}")
+    return failures
+
+
+def run_benchmark(work_dir, rows, cols):
+    print("=" * 60)
+    print(f"Hız karşılaştırması ({rows} satır x {cols} sütun)")
+    print("=" * 60)
+    path = os.path.join(work_dir, f"bench_{rows}x{cols}.xlsx")
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("S")
+    ws.append(["ID"] + [f"P{i}" for i in range(1, cols)])
+    for r in range(rows):
+        ws.append([f"Rib_{r}"] + [r * 0.5 + i for i in range(1, cols)])
+    wb.save(path)
+    print(f"Dosya: {os.path.getsize(path) / 1e6:.1f} MB")
+
+    for label, columns in (("ID + 3 sütun", [0, 1, 5, min(40, cols - 1)]), ("tüm sütunlar", None)):
+        timings = {}
+        results = {}
+        for reader_name, reader in (("openpyxl", app.read_excel_openpyxl), ("native", app.read_excel_native)):
+            t0 = time.perf_counter()
+            results[reader_name], _ = reader(path, "S", columns)
+            timings[reader_name] = time.perf_counter() - t0
+        same = results["native"] == results["openpyxl"]
+        speedup = timings["openpyxl"] / timings["native"] if timings["native"] else 0
+        print(f"{label:14s} openpyxl {timings['openpyxl']:6.2f} sn | native {timings['native']:6.2f} sn | "
+              f"{speedup:4.1f}x | {'aynı' if same else 'FARKLI'}")
+
+
+def _same_rows(a, b):
+    """Sayılar tip farkı gözetmeden (CSV'de 1 / Parquet'te 1.0), ID'ler format_row_id ile karşılaştırılır"""
+    def norm(rows):
+        return [tuple(app.format_row_id(v) if i == 0 else (float(v) if isinstance(v, (int, float)) else v)
+                      for i, v in enumerate(r)) for r in rows]
+    return norm(a) == norm(b)
+
+
+def run_tabular_benchmark(work_dir, rows, cols):
+    print("=" * 60)
+    print(f"CSV / TSV / Parquet girişi ({rows} satır x {cols} sütun)")
+    print("=" * 60)
+    header = ["ID"] + [f"P{i}" for i in range(1, cols)]
+    table = [[f"Rib_{r}"] + [round(r * 0.5 + i, 3) for i in range(1, cols)] for r in range(rows)]
+
+    paths = {"xlsx": os.path.join(work_dir, "tablo.xlsx")}
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("S")
+    ws.append(header)
+    for r in table:
+        ws.append(r)
+    wb.save(paths["xlsx"])
+    for ext, delimiter in (("csv", ","), ("tsv", "\t")):
+        paths[ext] = os.path.join(work_dir, f"tablo.{ext}")
+        with open(paths[ext], "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            writer.writerow(header)
+            writer.writerows(table)
+    if app.PYARROW_AVAILABLE:
+        paths["parquet"] = os.path.join(work_dir, "tablo.parquet")
+        columns = list(zip(*table))
+        app.pyarrow.parquet.write_table(
+            app.pyarrow.table({name: list(col) for name, col in zip(header, columns)}), paths["parquet"])
+    else:
+        print("ℹ️ pyarrow yok: Parquet atlandı, CSV csv modülüyle okunuyor")
+
+    for label, columns in (("ID + 3 sütun", [0, 1, 2, min(10, cols - 1)]), ("tüm sütunlar", None)):
+        reference = None
+        for kind, path in paths.items():
+            t0 = time.perf_counter()
+            _, data, _ = app.read_excel_table(path, "S" if kind == "xlsx" else None, columns)
+            elapsed = time.perf_counter() - t0
+            if reference is None:
+                reference = data
+            same = _same_rows(data, reference)
+            print(f"{label:14s} {kind:8s} {os.path.getsize(path) / 1e6:6.1f} MB  {elapsed:6.2f} sn  "
+                  f"{len(data) / elapsed:10,.0f} satır/sn  {'aynı' if same else 'FARKLI'}")
+
+
+def peak_rss_mb():
+    """Sürecin şimdiye kadarki tepe bellek kullanımı (MB)"""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                 ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _large_row(r):
+    return (f'<row r="{r}"><c r="A{r}"><v>{r}</v></c><c r="B{r}"><v>{random.random() * 100:.6f}</v></c>'
+            f'<c r="C{r}"><v>{random.random() * 50:.6f}</v></c><c r="D{r}"><v>{random.randint(1, 999)}</v></c>'
+            f'<c r="E{r}" t="inlineStr"><is><t>{"AL" if r % 2 else "ST"}</t></is></c>'
+            f'<c r="F{r}"><v>{random.random():.6f}</v></c></row>')
+
+
+def build_large_xlsx(path, target_mb):
+    """Yaklaşık target_mb boyutunda tek sayfalı kitap; sayfa XML'i parça parça yazılır.
+    Satır sayısı bir örneğin sıkıştırma oranından tahmin edilir (<dimension> baştan yazılabilsin)."""
+    random.seed(1)
+    sample = "".join(_large_row(r) for r in range(2, 20002)).encode("utf-8")
+    import zlib
+    per_row = len(zlib.compress(sample, 6)) / 20000
+    rows = max(10, int(target_mb * 1024 * 1024 / per_row))
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        with z.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as f:
+            f.write((f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                     f'<worksheet xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><dimension ref="A1:F{rows + 1}"/><sheetData>'
+                     '<row r="1"><c r="A1" t="inlineStr"><is><t>ID</t></is></c></row>').encode("utf-8"))
+            for start in range(2, rows + 2, 10000):
+                f.write("".join(_large_row(r) for r in range(start, min(start + 10000, rows + 2))).encode("utf-8"))
+            f.write(b"</sheetData></worksheet>")
+        z.writestr("[Content_Types].xml", CONTENT_TYPES.format(sheets=
+                   '<Override PartName="/xl/worksheets/sheet1.xml" '
+                   'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'))
+        z.writestr("_rels/.rels", ROOT_RELS)
+        z.writestr("xl/workbook.xml",
+                   f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                   f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets><sheet name="S" sheetId="1" r:id="rId1"/></sheets></workbook>')
+        z.writestr("xl/_rels/workbook.xml.rels",
+                   f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                   f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                   f'<Relationship Id="rId1" Type="{REL_NS}/worksheet" Target="worksheets/sheet1.xml"/></Relationships>')
+    return rows
+
+
+def stream_child(path):
+    """Ayrı süreçte: dosyayı akışlı hattan geçirir, tepe bellek artışını JSON olarak yazar"""
+    baseline = peak_rss_mb()
+    columns, param_map = app.project_columns([("T", 1), ("H", 2), ("N", 3)])
+    pipeline = app.ExcelWritePipeline(app.iter_excel_rows_fast(path, "S", columns), param_map, 4000, 500)
+    pipeline.start()
+    t0 = time.perf_counter()
+    total = rows = ops = 0
+    try:
+        for item in pipeline:
+            if item[0] == "total":
+                total = item[1]
+                continue
+            rows += 1
+            ops += len(item[2])
+    finally:
+        pipeline.stop()
+    print(json.dumps({"total": total, "rows": rows, "ops": ops, "seconds": time.perf_counter() - t0,
+                      "baseline_mb": baseline, "peak_mb": peak_rss_mb()}))
+
+
+def run_stream_memory(work_dir, target_mb, ceiling_mb):
+    print("=" * 60)
+    print(f"Akışlı mod bellek testi (~{target_mb} MB kitap, tavan +{ceiling_mb} MB)")
+    print("=" * 60)
+    path = os.path.join(work_dir, "large.xlsx")
+    t0 = time.perf_counter()
+    rows = build_large_xlsx(path, target_mb)
+    print(f"Dosya: {os.path.getsize(path) / 1e6:.0f} MB, {rows} satır ({time.perf_counter() - t0:.0f} sn)")
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--bellek-alt", path],
+                         capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    growth = result["peak_mb"] - result["baseline_mb"]
+    ok = result["rows"] == rows and result["total"] == rows and growth <= ceiling_mb
+    print(f"{result['rows']} satır / {result['ops']} parametre, {result['seconds']:.0f} sn, "
+          f"tepe bellek artışı {growth:.0f} MB (taban {result['baseline_mb']:.0f} MB)")
+    print("✅ Bellek tavanın altında" if ok else "❌ Bellek tavanı aşıldı veya satır sayısı tutmuyor")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--bellek-alt":
+        stream_child(sys.argv[2])
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "--tablo":
+        with tempfile.TemporaryDirectory(prefix="s2d_xlsx_") as work:
+            run_tabular_benchmark(work, int(sys.argv[2]) if len(sys.argv) > 2 else 100000,
+                                  int(sys.argv[3]) if len(sys.argv) > 3 else 20)
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "--bellek":
+        target = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+        ceiling = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+        with tempfile.TemporaryDirectory(prefix="s2d_xlsx_") as work:
+            sys.exit(run_stream_memory(work, target, ceiling))
+    bench_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    bench_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with tempfile.TemporaryDirectory(prefix="s2d_xlsx_") as work:
+        failed = run_conformance(work)
+        print()
+        failed += run_formula_check(work)
+        print()
+        run_benchmark(work, bench_rows, bench_cols)
+    sys.exit(1 if failed else 0)